@@ -20,12 +20,16 @@ from .lldxf.encoding import dxfbackslashreplace
 codecs.register_error('dxfreplace', dxfbackslashreplace)  # setup DXF unicode encoder -> '\U+nnnn'
 
 from .options import options  # example: ezdxf.options.template_dir = 'c:\templates'
-from .lldxf.tags import dxf_info
-from .lldxf.tagger import stream_tagger, skip_comments
+from .lldxf.tags import dxf_info, read_dxf_info, dxf_encoding
+from .lldxf.tagger import stream_tagger, bulk_stream_tagger, skip_comments, BLOCK_SIZE
+from .lldxf.lazytags import lazy_stream_tagger
+from .lldxf.sectionfilter import SectionFilter
+from .lldxf.binarydxf import is_binary_dxf, binary_tagger, binary_dxf_info, filter_tag_sections, BINARY_DXF_SENTINEL
 from .tools.importer import Importer
 from .tools.codepage import is_supported_encoding
-from .lldxf.const import DXFStructureError, DXFVersionError
-from .tools.zipmanager import ctxZipReader
+from .lldxf.const import DXFStructureError, DXFVersionError, DXFSectionNotLoadedError
+from .tools.zipmanager import ctxZipReader, compression_format, open_binary, open_binary_format
+from .incremental import DXFSource
 from .tools import transparency2float, float2transparency  #  convert transparency integer values to floats 0..1
 from .tools.rgb import int2rgb, rgb2int
 from .tools.pattern import PATTERN
@@ -69,26 +73,167 @@ def read(stream):
     return Drawing.read(stream)
 
 
-def readfile(filename, encoding='auto'):
+SNIFF_SIZE = 16 * 1024  # leading bytes of DXF files read by readfile() to detect DXF version and encoding
+
+
+def readfile(filename, encoding='auto', lazy=False, sections=None, workers=1):
     """Read DXF drawing from file *filename*.
+
+    If *lazy* is True, the entities of the ENTITIES and BLOCKS section are decoded on first access, which requires
+    options.bulk_tag_reader = True.
+
+    If *workers* > 1, the ENTITIES section is split into chunks, which are parsed by a pool of *workers* processes,
+    this is worth it only for huge DXF files. Ignored if *lazy* is True, *sections* is not None or for compressed files.
+
+    If *sections* is an iterable of section names like ('header', 'tables'), just this sections are loaded and all
+    other sections are skipped without parsing them. Returns a read-only PartialDrawing(), the HEADER section is
+    always loaded. Accessing a skipped section raises DXFSectionNotLoadedError.
+
+    Compressed files are detected by their leading bytes, gzip compressed DXF files and the first DXF file of a zip
+    archive are decompressed on the fly.
+
+    Binary DXF files are detected by their leading bytes and are always loaded at once, *lazy* and *workers* are
+    ignored.
+    """
+    from .drawing import Drawing, PartialDrawing
+    # open and read the file just once: detect compression, binary DXF, DXF version and encoding from the leading
+    # bytes, and parse the whole file from the same file handle
+    fp, compression = open_binary_format(filename)
+    with fp:
+        prefix = fp.read(len(BINARY_DXF_SENTINEL))
+        if is_binary_dxf(prefix):
+            return _read_binary(prefix + fp.read(), filename, encoding, sections)
+        if not options.bulk_tag_reader and sections is None:
+            return _readfile_by_lines(filename, encoding)
+        info, data = _sniff_dxf_file(fp, filename, prefix)
+        enc = dxf_encoding(info, encoding)
+        tagger = lazy_stream_tagger if lazy else bulk_stream_tagger
+        if sections is None and not lazy and workers > 1 and compression is None:
+            from .lldxf.chunkparser import parallel_tagger
+            dwg = Drawing(parallel_tagger(filename, workers, encoding=enc, errors='ignore'))
+        elif sections is None:
+            dwg = Drawing(tagger(fp, encoding=enc, errors='ignore', prefix=data))
+        else:
+            sections = [name.lower() for name in sections]
+            names = [name.upper().encode('ascii') for name in sections]
+            names.append(b'HEADER')
+            stream = SectionFilter(fp, names, prefix=data)
+            dwg = PartialDrawing(tagger(stream, encoding=enc, errors='ignore'), sections)
+
+    dwg.filename = filename
+    if compression is None and sections is None:
+        dwg.source = DXFSource(filename, enc, info.version)
+    if encoding != 'auto' and is_supported_encoding(encoding):
+        dwg.encoding = encoding
+    return dwg
+
+
+def iter_entities(filename, query='*', blocks=False, encoding='auto'):
+    """Iterate over the DXF entities of file *filename* without building a drawing.
+
+    Yields the entities of the ENTITIES section and if *blocks* is True, also the entities of the BLOCKS section
+    including BLOCK and ENDBLK, which match the *query* string, see EntityQuery(). The entities are read one at a time
+    from the file and the entities have no access to the header, tables, blocks or layouts of the drawing.
+
+    Linked entities like the VERTEX entities of a POLYLINE are not yielded, but they are accessible by the POLYLINE
+    entity until the next entity is requested.
     """
+    from .entitystream import iter_stream_entities
+    with open_binary(filename) as fp:
+        sections = [b'ENTITIES', b'BLOCKS'] if blocks else [b'ENTITIES']
+        prefix = fp.read(len(BINARY_DXF_SENTINEL))
+        if is_binary_dxf(prefix):
+            data = prefix + fp.read()
+            info = binary_dxf_info(data)
+            enc = dxf_encoding(info, encoding)
+            tags = filter_tag_sections(binary_tagger(data, encoding=enc, errors='ignore'),
+                                       [name.decode('ascii') for name in sections])
+        else:
+            info, data = _sniff_dxf_file(fp, filename, prefix)
+            enc = dxf_encoding(info, encoding)
+            tags = bulk_stream_tagger(SectionFilter(fp, sections, prefix=data), encoding=enc, errors='ignore')
+        for entity in iter_stream_entities(tags, info.version, enc, query):
+            yield entity
+
+
+def readindexed(filename, encoding='auto'):
+    """Random access to the entities of DXF file *filename* by handle, without parsing the whole file.
+
+    Returns an IndexedDXF() object, use IndexedDXF.get_dxf_entity(handle) or IndexedDXF.entitydb.get(handle) to get
+    single entities. Creates a side-car index file *filename*.ezidx by the first call, which is reused as long as the
+    DXF file is unchanged (size and modification time).
+    """
+    from .fileindex import IndexedDXF
+    if compression_format(filename) is not None:
+        raise IOError("Compressed file '{}' does not support random access.".format(filename))
+    if _is_binary_dxf_file(filename):
+        raise IOError("Binary DXF file '{}' does not support random access.".format(filename))
     if not is_dxf_file(filename):
         raise IOError("File '{}' is not a DXF file.".format(filename))
+    return IndexedDXF(filename, encoding)
 
-    with io.open(filename, mode='rt', encoding='utf-8', errors='ignore') as fp:
-        info = dxf_info(fp)
 
-    if encoding != 'auto':  # override encoding detection and $DWGCODEPAGE
-        enc = encoding
-    elif info.version >= 'AC1021':  # R2007 files and later are always encoded as UTF-8
-        enc = 'utf-8'
+def readfiles(filenames, workers=None, encoding='auto', lazy=False, sections=None):
+    """Read multiple DXF files in parallel by a pool of *workers* processes, default is the CPU count.
+
+    Returns a list of ReadResult(filename, drawing, error) in the order of *filenames*, errors are captured per file,
+    *drawing* is None and *error* is the raised exception for files which could not be loaded. Arguments *encoding*,
+    *lazy* and *sections* are passed to readfile().
+
+    On Windows the calling script requires the `if __name__ == '__main__':` guard of the multiprocessing module.
+    """
+    from .multifile import readfiles as _readfiles
+    return _readfiles(filenames, workers=workers, encoding=encoding, lazy=lazy, sections=sections)
+
+
+def _sniff_dxf_file(fp, filename, prefix=b''):
+    """ Returns DXFInfo() and the leading bytes read from the binary file *fp*, including the already read *prefix*.
+    """
+    try:
+        return read_dxf_info(fp, SNIFF_SIZE, BLOCK_SIZE, prefix)
+    except ValueError:
+        raise IOError("File '{}' is not a DXF file.".format(filename))
+
+
+def _is_binary_dxf_file(filename):
+    with open_binary(filename) as fp:
+        return is_binary_dxf(fp.read(len(BINARY_DXF_SENTINEL)))
+
+
+def _read_binary(data, filename, encoding='auto', sections=None):
+    """ Returns the drawing of the binary DXF *data* read from file *filename*. """
+    from .drawing import Drawing, PartialDrawing
+    info = binary_dxf_info(data)
+    enc = dxf_encoding(info, encoding)
+    tags = binary_tagger(data, encoding=enc, errors='ignore')
+    if sections is None:
+        dwg = Drawing(tags)
     else:
-        enc = info.encoding
+        sections = [name.lower() for name in sections]
+        names = [name.upper() for name in sections]
+        names.append('HEADER')
+        dwg = PartialDrawing(filter_tag_sections(tags, names), sections)
+    dwg.filename = filename
+    if encoding != 'auto' and is_supported_encoding(encoding):
+        dwg.encoding = encoding
+    return dwg
+
+
+def _readfile_by_lines(filename, encoding='auto'):
+    if not is_dxf_file(filename):
+        raise IOError("File '{}' is not a DXF file.".format(filename))
+
+    with io.TextIOWrapper(open_binary(filename), encoding='utf-8', errors='ignore') as fp:
+        info = dxf_info(fp)
 
-    with io.open(filename, mode='rt', encoding=enc, errors='ignore') as fp:
+    enc = dxf_encoding(info, encoding)
+    stream, compression = open_binary_format(filename)
+    with io.TextIOWrapper(stream, encoding=enc, errors='ignore') as fp:
         dwg = read(fp)
 
     dwg.filename = filename
+    if compression is None:
+        dwg.source = DXFSource(filename, enc, info.version)
     if encoding != 'auto' and is_supported_encoding(encoding):
         dwg.encoding = encoding
     return dwg
@@ -104,6 +249,8 @@ def readzip(zipfile, filename=None):
 
 
 def is_dxf_file(filename):
-    with io.open(filename, errors='ignore') as fp:
+    if _is_binary_dxf_file(filename):
+        return True
+    with io.TextIOWrapper(open_binary(filename), errors='ignore') as fp:
         reader = skip_comments(stream_tagger(fp))
         return next(reader) == (0, 'SECTION')
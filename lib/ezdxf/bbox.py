@@ -0,0 +1,368 @@
+# Purpose: bounding boxes of DXF entities
+# Created: 18.10.2026
+# License: MIT License
+"""
+Bounding boxes are (min_x, min_y, max_x, max_y) tuples in the xy-plane of the WCS, the z-axis is ignored. Entities in
+an OCS (Object Coordinate System) are transformed into the WCS by the arbitrary axis algorithm of the DXF reference.
+
+Curves (ARC, CIRCLE, ELLIPSE and bulges of polylines) have exact bounding boxes, TEXT, ATTRIB, ATTDEF and MTEXT
+entities are approximated by a character width of the text height, because the font metrics are not available. INSERT
+and DIMENSION entities require the bounding box of the block content, see entity_bbox().
+"""
+from __future__ import unicode_literals
+
+import math
+
+from .lldxf import const
+
+TWO_PI = 2. * math.pi
+Z_AXIS = (0., 0., 1.)
+
+
+def entity_bbox(entity, block_bbox=None):
+    """ Returns the bounding box of the DXF *entity* or None for unsupported DXF types and entities without
+    geometry.
+
+    Args:
+        entity: wrapped DXF entity
+        block_bbox: function, which returns the bounding box of the block content relative to the block base point
+                    by block name or None, required for INSERT and DIMENSION entities
+
+    """
+    func = BBOX_FUNCTIONS.get(entity.dxftype())
+    if func is None:
+        return None
+    try:
+        return func(entity, block_bbox)
+    except ValueError:  # required DXF attribute does not exist
+        return None
+
+
+def bbox_of_points(points):
+    """ Returns the bounding box of *points* or None for no points. """
+    xs = []
+    ys = []
+    for point in points:
+        xs.append(point[0])
+        ys.append(point[1])
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def union(boxes):
+    """ Returns the bounding box of all *boxes*, None values are ignored, returns None for no boxes. """
+    boxes = [box for box in boxes if box is not None]
+    if not boxes:
+        return None
+    return (min(box[0] for box in boxes), min(box[1] for box in boxes),
+            max(box[2] for box in boxes), max(box[3] for box in boxes))
+
+
+def intersects(box1, box2):
+    """ True if the bounding boxes *box1* and *box2* intersect or touch. """
+    return box1[0] <= box2[2] and box2[0] <= box1[2] and box1[1] <= box2[3] and box2[1] <= box1[3]
+
+
+def distance(box, point):
+    """ Returns the distance of *point* to the bounding box *box*, 0 if *point* is inside of *box*. """
+    x, y = point[0], point[1]
+    dx = max(box[0] - x, 0., x - box[2])
+    dy = max(box[1] - y, 0., y - box[3])
+    return math.hypot(dx, dy)
+
+
+class OCS(object):
+    """ Object Coordinate System defined by the *extrusion* vector, see DXF reference: arbitrary axis algorithm. """
+    def __init__(self, extrusion=Z_AXIS):
+        az = _normalize(extrusion)
+        if abs(az[0]) < 1. / 64. and abs(az[1]) < 1. / 64.:
+            ax = _normalize(_cross((0., 1., 0.), az))
+        else:
+            ax = _normalize(_cross(Z_AXIS, az))
+        self.ux = ax
+        self.uy = _normalize(_cross(az, ax))
+        self.uz = az
+        self.is_wcs = az == Z_AXIS
+
+    def to_wcs(self, point):
+        """ Returns *point* as WCS point (x, y, z). """
+        x = point[0]
+        y = point[1]
+        z = point[2] if len(point) > 2 else 0.
+        if self.is_wcs:
+            return x, y, z
+        ux, uy, uz = self.ux, self.uy, self.uz
+        return (x * ux[0] + y * uy[0] + z * uz[0],
+                x * ux[1] + y * uy[1] + z * uz[1],
+                x * ux[2] + y * uy[2] + z * uz[2])
+
+    def vector_to_wcs(self, vector):
+        """ Returns the OCS *vector* as WCS vector. """
+        if self.is_wcs:
+            return vector
+        x, y = vector[0], vector[1]
+        return (x * self.ux[0] + y * self.uy[0],
+                x * self.ux[1] + y * self.uy[1],
+                x * self.ux[2] + y * self.uy[2])
+
+
+def _ocs(entity):
+    if entity.supports_dxf_attrib('extrusion'):
+        return OCS(entity.get_dxf_attrib('extrusion', Z_AXIS))
+    return OCS()
+
+
+def _cross(a, b):
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+def _normalize(v):
+    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+    return v[0] / length, v[1] / length, v[2] / length
+
+
+def _rotate(points, angle, origin):
+    """ Yields 2D *points* rotated by *angle* in radians and moved to *origin*. """
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    ox, oy = origin[0], origin[1]
+    for x, y in points:
+        yield (ox + x * cos_a - y * sin_a, oy + x * sin_a + y * cos_a, origin[2] if len(origin) > 2 else 0.)
+
+
+def ellipse_extents(center, major_axis, minor_axis, start=0., end=TWO_PI):
+    """ Returns the bounding box of the elliptic arc center + major_axis * cos(t) + minor_axis * sin(t) for t from
+    *start* to *end* in radians counter clockwise, all vectors in WCS. Circles and arcs are ellipses with perpendicular
+    axes of equal length.
+    """
+    start %= TWO_PI
+    end %= TWO_PI
+    if end <= start:
+        end += TWO_PI
+    params = [start, end]
+    for axis in (0, 1):  # extreme x and y values at dx/dt = 0 and dy/dt = 0
+        t = math.atan2(minor_axis[axis], major_axis[axis])
+        t += math.ceil((start - t) / math.pi) * math.pi
+        while t <= end:
+            params.append(t)
+            t += math.pi
+    cx, cy = center[0], center[1]
+    return bbox_of_points(
+        (cx + major_axis[0] * math.cos(t) + minor_axis[0] * math.sin(t),
+         cy + major_axis[1] * math.cos(t) + minor_axis[1] * math.sin(t)) for t in params
+    )
+
+
+def _ocs_arc_extents(ocs, center, radius, start, end):
+    """ Bounding box of an arc in the xy-plane of the *ocs*, angles in radians. """
+    return ellipse_extents(ocs.to_wcs(center), ocs.vector_to_wcs((radius, 0.)), ocs.vector_to_wcs((0., radius)),
+                           start, end)
+
+
+def bulge_extents(ocs, p1, p2, bulge, elevation=0.):
+    """ Returns the bounding box of the polyline segment from *p1* to *p2* with *bulge* in the *ocs*. """
+    z = elevation
+    if bulge == 0.:
+        return bbox_of_points([ocs.to_wcs((p1[0], p1[1], z)), ocs.to_wcs((p2[0], p2[1], z))])
+    dx = p2[0] - p1[0]
+    dy = p2[1] - p1[1]
+    chord = math.hypot(dx, dy)
+    if chord == 0.:
+        return bbox_of_points([ocs.to_wcs((p1[0], p1[1], z))])
+    radius = chord * (1. + bulge * bulge) / (4. * abs(bulge))
+    h = chord * (1. - bulge * bulge) / (4. * bulge)  # signed distance of the center from the chord middle point
+    cx = (p1[0] + p2[0]) / 2. - dy / chord * h
+    cy = (p1[1] + p2[1]) / 2. + dx / chord * h
+    start = math.atan2(p1[1] - cy, p1[0] - cx)
+    end = math.atan2(p2[1] - cy, p2[0] - cx)
+    if bulge < 0.:  # clockwise
+        start, end = end, start
+    return _ocs_arc_extents(ocs, (cx, cy, z), radius, start, end)
+
+
+def _polyline_extents(ocs, vertices, closed, elevation=0.):
+    """ Bounding box of polyline *vertices* as (x, y, bulge) tuples in the *ocs*. """
+    if not vertices:
+        return None
+    if closed:
+        vertices = vertices + vertices[:1]
+    boxes = [bulge_extents(ocs, v1, v2, v1[2], elevation) for v1, v2 in zip(vertices, vertices[1:])]
+    if not boxes:  # just one vertex
+        boxes.append(bulge_extents(ocs, vertices[0], vertices[0], 0., elevation))
+    return union(boxes)
+
+
+def _expand(box, size):
+    if box is None or size == 0.:
+        return box
+    return box[0] - size, box[1] - size, box[2] + size, box[3] + size
+
+
+def _line(entity, block_bbox):
+    return bbox_of_points([entity.dxf.start, entity.dxf.end])
+
+
+def _point(entity, block_bbox):
+    return bbox_of_points([entity.dxf.location])
+
+
+def _circle(entity, block_bbox):
+    return _ocs_arc_extents(_ocs(entity), entity.dxf.center, entity.dxf.radius, 0., TWO_PI)
+
+
+def _arc(entity, block_bbox):
+    return _ocs_arc_extents(_ocs(entity), entity.dxf.center, entity.dxf.radius,
+                            math.radians(entity.dxf.start_angle), math.radians(entity.dxf.end_angle))
+
+
+def _ellipse(entity, block_bbox):
+    major_axis = entity.dxf.major_axis
+    if len(major_axis) == 2:
+        major_axis = (major_axis[0], major_axis[1], 0.)
+    normal = _ocs(entity).uz
+    minor_axis = [value * entity.dxf.ratio for value in _cross(normal, major_axis)]
+    return ellipse_extents(entity.dxf.center, major_axis, minor_axis,
+                           entity.get_dxf_attrib('start_param', 0.), entity.get_dxf_attrib('end_param', TWO_PI))
+
+
+def _quadrilateral(entity, block_bbox):
+    ocs = _ocs(entity)
+    return bbox_of_points(ocs.to_wcs(entity.get_dxf_attrib(name)) for name in const.VERTEXNAMES
+                          if entity.dxf_attrib_exists(name))
+
+
+def _lwpolyline(entity, block_bbox):
+    points = list(entity)
+    vertices = [(x, y, bulge) for x, y, start_width, end_width, bulge in points]
+    box = _polyline_extents(_ocs(entity), vertices, entity.closed, entity.get_dxf_attrib('elevation', 0.))
+    width = max([entity.get_dxf_attrib('const_width', 0.)] + [max(p[2], p[3]) for p in points])
+    return _expand(box, width / 2.)
+
+
+def _polyline(entity, block_bbox):
+    if entity.is_2d_polyline:
+        vertices = [vertex.dxf.location[:2] + (vertex.get_dxf_attrib('bulge', 0.), ) for vertex in entity.vertices()]
+        elevation = entity.get_dxf_attrib('elevation', (0., 0., 0.))
+        return _polyline_extents(_ocs(entity), vertices, entity.dxf.flags & const.POLYLINE_CLOSED,
+                                 elevation[2] if len(elevation) > 2 else 0.)
+    else:  # 3D polylines, polygon meshes and the vertices of polyface meshes are WCS points, skip face records
+        return bbox_of_points(vertex.dxf.location for vertex in entity.vertices()
+                              if vertex.dxf.flags & const.VTX_3D_POLYGON_MESH_VERTEX or
+                              not vertex.dxf.flags & const.VTX_3D_POLYFACE_MESH_VERTEX)
+
+
+def _text_box(x0, x1, y0, y1, angle, origin, ocs):
+    corners = _rotate([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], angle, origin)
+    return bbox_of_points(ocs.to_wcs(corner) for corner in corners)
+
+
+def _text(entity, block_bbox):
+    text = entity.get_dxf_attrib('text', '')
+    if not text:
+        return None
+    height = entity.get_dxf_attrib('height', 1.)
+    width = len(text) * height * entity.get_dxf_attrib('width', 1.)  # approximation: character width == height
+    halign = entity.get_dxf_attrib('halign', 0)
+    valign = entity.get_dxf_attrib('valign', 0)
+    insert = entity.dxf.insert
+    align_point = entity.get_dxf_attrib('align_point', insert)
+    ocs = _ocs(entity)
+    if halign in (3, 5):  # aligned or fit, text between insert and align point
+        width = math.hypot(align_point[0] - insert[0], align_point[1] - insert[1])
+        angle = math.atan2(align_point[1] - insert[1], align_point[0] - insert[0])
+        return _text_box(0., width, 0., height, angle, insert, ocs)
+
+    origin = insert if halign == 0 and valign == 0 else align_point
+    if halign in (1, 4):  # center, middle
+        x0 = -width / 2.
+    elif halign == 2:  # right
+        x0 = -width
+    else:  # left
+        x0 = 0.
+    if valign == 2 or halign == 4:  # middle
+        y0 = -height / 2.
+    elif valign == 3:  # top
+        y0 = -height
+    else:  # baseline, bottom
+        y0 = 0.
+    return _text_box(x0, x0 + width, y0, y0 + height, math.radians(entity.get_dxf_attrib('rotation', 0.)), origin,
+                     ocs)
+
+
+def _mtext(entity, block_bbox):
+    paragraphs = entity.get_text().split('\\P')
+    height = entity.get_dxf_attrib('char_height', 1.)
+    width = entity.get_dxf_attrib('width', 0.)
+    line_count = len(paragraphs)
+    if width > 0.:  # approximation of the line wrapping
+        line_count = sum(max(1, int(math.ceil(len(paragraph) * height / width))) for paragraph in paragraphs)
+    else:
+        width = max(len(paragraph) for paragraph in paragraphs) * height
+    total_height = height * (line_count + (line_count - 1) * 0.667 * entity.get_dxf_attrib('line_spacing_factor', 1.))
+    attachment_point = entity.get_dxf_attrib('attachment_point', 1) - 1
+    row, column = divmod(attachment_point, 3)
+    x0 = -width * column / 2.  # left, center, right
+    y0 = -total_height * (2 - row) / 2.  # top, middle, bottom
+    text_direction = entity.get_dxf_attrib('text_direction', None)
+    if text_direction is not None:
+        angle = math.atan2(text_direction[1], text_direction[0])
+    else:
+        angle = math.radians(entity.get_dxf_attrib('rotation', 0.))
+    return _text_box(x0, x0 + width, y0, y0 + total_height, angle, entity.dxf.insert, OCS())
+
+
+def _spline(entity, block_bbox):
+    # the spline is inside of the convex hull of the control points
+    return bbox_of_points(entity.get_control_points()) or bbox_of_points(entity.get_fit_points())
+
+
+def _insert(entity, block_bbox):
+    boxes = [_block_reference_extents(entity, block_bbox)]
+    boxes.extend(_text(attrib, block_bbox) for attrib in entity.attribs())
+    return union(boxes)
+
+
+def _block_reference_extents(entity, block_bbox):
+    if block_bbox is None:
+        return None
+    box = block_bbox(entity.dxf.name)
+    if box is None:
+        return None
+    get = entity.get_dxf_attrib
+    xscale = get('xscale', 1.)
+    yscale = get('yscale', 1.)
+    xs = sorted([box[0] * xscale, box[2] * xscale])
+    ys = sorted([box[1] * yscale, box[3] * yscale])
+    column_offset = (get('column_count', 1) - 1) * get('column_spacing', 0.)  # MINSERT
+    row_offset = (get('row_count', 1) - 1) * get('row_spacing', 0.)
+    x0, x1 = min(xs[0], xs[0] + column_offset), max(xs[1], xs[1] + column_offset)
+    y0, y1 = min(ys[0], ys[0] + row_offset), max(ys[1], ys[1] + row_offset)
+    return _text_box(x0, x1, y0, y1, math.radians(get('rotation', 0.)), entity.dxf.insert, _ocs(entity))
+
+
+def _dimension(entity, block_bbox):
+    if block_bbox is None:
+        return None
+    return block_bbox(entity.get_dxf_attrib('geometry', ''))  # geometry block is inserted at (0, 0, 0)
+
+
+BBOX_FUNCTIONS = {
+    'LINE': _line,
+    'POINT': _point,
+    'CIRCLE': _circle,
+    'ARC': _arc,
+    'ELLIPSE': _ellipse,
+    'SOLID': _quadrilateral,
+    'TRACE': _quadrilateral,
+    '3DFACE': _quadrilateral,
+    'LWPOLYLINE': _lwpolyline,
+    'POLYLINE': _polyline,
+    'TEXT': _text,
+    'ATTRIB': _text,
+    'ATTDEF': _text,
+    'MTEXT': _mtext,
+    'SPLINE': _spline,
+    'INSERT': _insert,
+    'DIMENSION': _dimension,
+}
@@ -0,0 +1,123 @@
+# Purpose: render the entity spaces of a drawing in chunks by a process pool on saving
+# Created: 18.10.2026
+# License: MIT License
+"""
+Drawing.write(stream, workers=n) renders the HEADER, CLASSES and TABLES section, the BLOCK and ENDBLK entities and
+small entity spaces by the main process, the entities of large entity spaces (ENTITIES section, block content and
+OBJECTS section) are split into chunks of handles, which are rendered into strings by a pool of worker processes.
+The main process continues rendering while the workers are running, the chunks are written in order as soon as they
+are ready, therefore the output is identical to the output of the sequential writer.
+
+The worker processes are forked after preparing the drawing for writing, and inherit the entity database, only the
+handles of a chunk are transferred to the worker and the rendered string back to the main process. Platforms without
+fork() support write sequentially.
+"""
+from __future__ import unicode_literals
+
+import io
+import os
+import multiprocessing
+from contextlib import contextmanager
+
+from .lldxf.tagwriter import BufferedTextWriter
+
+MIN_CHUNK_SIZE = 1000  # entity spaces with less entities are rendered by the main process
+CHUNKS_PER_WORKER = 4  # more chunks than workers, to write the first chunks while the workers process the following
+
+# inherited by the forked worker processes, see fork_pool()
+_entitydb = None
+_writer_factory = None
+
+
+@contextmanager
+def fork_pool(workers, entitydb, writer_factory=BufferedTextWriter):
+    """ Yields a process pool of *workers* forked processes, which render entities of *entitydb* by a writer created
+    by *writer_factory(stream)*, yields None if fork() is not supported.
+    """
+    global _entitydb, _writer_factory
+    if hasattr(multiprocessing, 'get_context'):
+        context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    else:  # Python 2 forks on POSIX platforms
+        context = multiprocessing if os.name == 'posix' else None
+    if context is None:
+        yield None
+        return
+
+    _entitydb, _writer_factory = entitydb, writer_factory
+    pool = context.Pool(workers)
+    try:
+        yield pool
+    finally:
+        pool.close()
+        pool.join()
+        _entitydb, _writer_factory = None, None
+
+
+class ChunkWriter(object):
+    """ Text writer, which writes the strings and the entity chunks rendered by the *pool* workers in order to the
+    buffered *stream* (BufferedTextWriter() or inherited), the entity spaces call write_entities() instead of writing
+    the entities.
+    """
+    def __init__(self, stream, pool, workers, entitydb):
+        self._stream = stream
+        self._pool = pool
+        self._workers = workers
+        self._entitydb = entitydb
+        self._pending = []  # strings and AsyncResult() objects, waiting for the first unfinished chunk
+        strtags = getattr(stream, 'strtags', None)
+        if strtags is not None:  # tag formatting of the stream, see write_tags()
+            self.strtags = strtags
+
+    def write(self, s):
+        if self._pending:
+            self._pending.append(s)
+        else:
+            self._stream.write(s)
+
+    def flush(self):
+        self._write_pending(wait=True)
+        self._stream.flush()
+
+    def write_entities(self, handles):
+        """ Write the entities *handles* and the linked entities. """
+        count = len(handles)
+        if count < MIN_CHUNK_SIZE:
+            entitydb = self._entitydb
+            for handle in handles:
+                while handle is not None:
+                    tags = entitydb[handle]
+                    tags.write(self)
+                    handle = tags.link
+        else:
+            chunk_size = max(MIN_CHUNK_SIZE, count // (self._workers * CHUNKS_PER_WORKER) + 1)
+            for start in range(0, count, chunk_size):
+                chunk = list(handles[start:start + chunk_size])
+                self._pending.append(self._pool.apply_async(_render_chunk, (chunk, )))
+        self._write_pending(wait=False)
+
+    def _write_pending(self, wait):
+        pending = self._pending
+        stream = self._stream
+        index = 0
+        for index, part in enumerate(pending):
+            if hasattr(part, 'ready'):  # AsyncResult() of a chunk
+                if not wait and not part.ready():
+                    break
+                part = part.get()
+            stream.write(part)
+        else:
+            index = len(pending)
+        del pending[:index]
+
+
+def _render_chunk(handles):
+    entitydb = _entitydb
+    stream = io.StringIO()
+    writer = _writer_factory(stream)
+    for handle in handles:
+        while handle is not None:
+            tags = entitydb[handle]
+            tags.write(writer)
+            handle = tags.link
+    writer.flush()
+    return stream.getvalue()
@@ -7,6 +7,7 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from .tools.binarydata import compress_binary_data
 from .tools.handle import HandleGenerator
+from .lldxf.lazytags import LazyTags
 
 
 def factory():
@@ -28,16 +29,38 @@ class EntityDB(object):
     separated classes, which are generated by the dxffactory-object.
     The dxffactory-object generates DXF-Version specific wrapper classes.
 
+    Lazy loaded entities are stored as LazyTags() and replaced by ClassifiedTags() on first access.
+
+    The handles of added, replaced and deleted entities are collected in the set *dirty*, which is cleared after
+    loading a drawing, changes of the stored tags are tracked by the tags itself, see ClassifiedTags.is_modified().
+
+    The secondary indexes of the entity spaces are registered in the list *indexes*, see EntitySpaceIndex(), the name
+    indexes of the tables are registered in the list *name_indexes*, see TableNameIndex().
+
     """
     def __init__(self):
         self._database = {}
         self.handles = HandleGenerator()
+        self.dirty = set()
+        self.indexes = []
+        self.name_indexes = []
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['indexes'] = []  # the indexes are not pickled, see EntitySpace() and Table()
+        state['name_indexes'] = []
+        return state
 
     def __delitem__(self, key):
         del self._database[key]
+        self.dirty.add(key)
 
     def __getitem__(self, handle):
-        return self._database[handle]
+        tags = self._database[handle]
+        if tags.__class__ is LazyTags:
+            tags = tags.load()
+            self._database[handle] = tags
+        return tags
 
     def get(self, handle, default=None):
         try:
@@ -47,6 +70,7 @@ class EntityDB(object):
 
     def __setitem__(self, handle, entity):
         self._database[handle] = entity
+        self.dirty.add(handle)
 
     def __contains__(self, handle):
         """ Database contains handle? """
@@ -66,11 +90,19 @@ class EntityDB(object):
 
     def values(self):
         """ Iterate over all entities. """
-        return self._database.values()
+        return (self.__getitem__(handle) for handle in self._database)
 
     def items(self):
         """ Iterate over all (handle, entities) pairs. """
-        return self._database.items()
+        return ((handle, self.__getitem__(handle)) for handle in self._database)
+
+    def peek(self, handle):
+        """ Returns the stored tags of entity *handle*, without loading lazy loaded entities. """
+        return self._database[handle]
+
+    def is_lazy(self, handle):
+        """ Returns *True* if entity *handle* is lazy loaded and not accessed until now. """
+        return self._database[handle].__class__ is LazyTags
 
     def add_tags(self, tags):
         try:
@@ -86,10 +118,28 @@ class EntityDB(object):
 
     def delete_handle(self, handle):
         del self._database[handle]
+        self.dirty.add(handle)
+
+    def update_indexes(self, tags, key, count=None):
+        """ Update the secondary, spatial and name indexes after changing the DXF attribute *key* of the entity
+        *tags*, *count* is the modification_count() of the tags before the change, see EntitySpaceIndex().
+        """
+        indexes = self.indexes + self.name_indexes if key == 'name' else self.indexes
+        try:
+            handle = tags.get_handle()
+        except ValueError:  # DXF R12 entity without handle, rebuild all indexes
+            for index in indexes:
+                index.valid = False
+            self.indexes = [index for index in self.indexes if index.valid]
+            self.name_indexes = [index for index in self.name_indexes if index.valid]
+        else:
+            for index in indexes:
+                index.update(handle, key, count)
 
     def compress_binary_data(self):
-        for tags in self.values():
-            compress_binary_data(tags)
+        for tags in self._database.values():
+            if tags.__class__ is not LazyTags:  # do not load lazy entities
+                compress_binary_data(tags)
 
     def get_unique_handle(self):
         while True:
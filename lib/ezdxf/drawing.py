@@ -7,20 +7,27 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from datetime import datetime
 import io
+import pickle
 import warnings
+from functools import partial
 
 from . import database
 from .lldxf.tags import DXFTag, write_tags
-from .lldxf.const import DXFVersionError, acad_release, BLK_XREF
+from .lldxf.const import DXFVersionError, DXFSectionNotLoadedError, acad_release, BLK_XREF
 from .lldxf.tagger import stream_tagger
+from .lldxf.tagwriter import BufferedTextWriter, FixedPrecisionWriter
+from .lldxf.binarydxf import BinaryDXFWriter
 from .dxffactory import dxffactory
-from .templates import TemplateLoader
+from .templates import TemplateLoader, get_prototype, set_prototype
 from .options import options
 from .tools.codepage import tocodepage, toencoding
+from .tools.zipmanager import compressed_writer
 from .sections import Sections
+from .sections.sections import KNOWN_SECTIONS
 from .tools.juliandate import juliandate
 from .lldxf import repair
 from .audit import Audit
+from .chunkwriter import fork_pool, ChunkWriter
 
 
 class Drawing(object):
@@ -36,8 +43,19 @@ class Drawing(object):
         self.encoding = 'cp1252'  # read/write - set by _bootstraphook()
         self.filename = None  # read/write
         self.entitydb = database.factory()
-        self.sections = Sections(tagreader, self)
+        self.sections = self._load_sections(tagreader)
+        self.entitydb.dirty.clear()  # just track changes after loading
+        self.source = None  # DXFSource() of the loaded DXF file, set by readfile(), required for incremental saving
         self._groups = None
+        self._setup_management_structures()
+
+        if options.compress_binary_data:
+            self.compress_binary_data()
+
+    def _load_sections(self, tagreader):
+        return Sections(tagreader, self)
+
+    def _setup_management_structures(self):
         if self.dxfversion > 'AC1009':
             self.rootdict = self.objects.rootdict
             self.objects.setup_objects_management_tables(self.rootdict)  # create missing tables
@@ -60,9 +78,6 @@ class Drawing(object):
             self.entities.repair_model_space(self.modelspace().layout_key)
             self.layouts.link_block_entities_into_layouts()
 
-        if options.compress_binary_data:
-            self.compress_binary_data()
-
     def compress_binary_data(self):
         if self.dxfversion > 'AC1009' and not self._is_binary_data_compressed:
             self.entitydb.compress_binary_data()
@@ -260,11 +275,17 @@ class Drawing(object):
         if dxfversion not in versions_supported_by_new:
             raise DXFVersionError("Can not create DXF drawings, unsupported DXF version '{}'.".format(dxfversion))
         finder = TemplateLoader(options.template_dir)
-        stream = finder.getstream(dxfversion.upper())
-        try:
-            dwg = Drawing.read(stream)
-        finally:
-            stream.close()
+        # every template is parsed just once, new drawings are unpickled copies of the parsed template
+        prototype = get_prototype(finder.templatedir, dxfversion)
+        if prototype is None:
+            stream = finder.getstream(dxfversion)
+            try:
+                dwg = Drawing.read(stream)
+            finally:
+                stream.close()
+            set_prototype(finder.templatedir, dxfversion, pickle.dumps(dwg, pickle.HIGHEST_PROTOCOL))
+        else:
+            dwg = pickle.loads(prototype)
         dwg._setup_metadata()
         return dwg
 
@@ -277,24 +298,97 @@ class Drawing(object):
         tagreader = stream_tagger(stream)
         return Drawing(tagreader)
 
-    def saveas(self, filename, encoding='auto'):
+    def saveas(self, filename, encoding='auto', compression=None, incremental=False, precision=None, workers=1,
+               fmt='asc'):
         self.filename = filename
-        self.save(encoding=encoding)
+        self.save(encoding=encoding, compression=compression, incremental=incremental, precision=precision,
+                  workers=workers, fmt=fmt)
+
+    def save(self, encoding='auto', compression=None, incremental=False, precision=None, workers=1, fmt='asc'):
+        """ Save drawing to file *filename*, *compression* is None for a plain DXF file, 'gzip' for a gzip compressed
+        DXF file or 'zip' for a zip archive, which contains the DXF file.
 
-    def save(self, encoding='auto'):
+        If *incremental* is True, the entities which are not changed since loading are copied verbatim from the
+        source file, this requires a drawing loaded by readfile() from an uncompressed DXF file, which is not changed
+        since loading, else the drawing is saved as usual.
+
+        *precision* writes the float values of the entities, tables and objects with a fixed count of decimal places
+        instead of the full float precision, as count for all float values or as dict with the keys 'coordinates',
+        'angles' and 'scales', e.g. {'coordinates': 6, 'angles': 4}, missing keys keep the full precision. A fixed
+        precision disables the incremental save.
+
+        If *workers* > 1, the entities of large entity spaces are rendered in chunks by a pool of *workers* forked
+        processes, the output is identical to the sequential writer, see ezdxf.chunkwriter. On platforms without
+        fork() support and for the incremental save the drawing is written sequentially.
+
+        *fmt* is 'asc' for an ASCII DXF file or 'bin' for a binary DXF file, which is smaller and loads faster, binary
+        DXF files ignore *incremental*, *precision* and *workers*.
+        """
+        enc = self.output_encoding(encoding)
+        if fmt == 'bin':
+            if compression is None:
+                with io.open(self.filename, mode='wb') as fp:
+                    self.write_binary(fp, enc)
+            else:
+                with compressed_writer(self.filename, compression, encoding=None) as fp:
+                    self.write_binary(fp, enc)
+            return
+        elif fmt != 'asc':
+            raise ValueError("Unknown DXF format '{}', use 'asc' or 'bin'.".format(fmt))
+        source = self.source
+        if incremental and precision is None and source is not None and source.dxfversion == self.dxfversion and \
+                source.is_unchanged():
+            source.save(self, enc, compression)
+            return
+        # in ASCII mode unknown, characters will be escaped as \U+nnnn unicode characters.
+        if compression is None:
+            with io.open(self.filename, mode='wt', encoding=enc, errors='dxfreplace') as fp:
+                self.write(fp, precision, workers)
+        else:
+            with compressed_writer(self.filename, compression, encoding=enc, errors='dxfreplace') as fp:
+                self.write(fp, precision, workers)
+
+    def output_encoding(self, encoding='auto'):
         # DXF R12, R2000, R2004 - ASCII encoding
         # DXF R2007 and newer - UTF-8 encoding
         if encoding == 'auto':
-            enc = 'utf-8' if self.dxfversion >= 'AC1021' else self.encoding
+            return 'utf-8' if self.dxfversion >= 'AC1021' else self.encoding
         else:  # override default encoding, for applications that handles encoding different than AutoCAD
-            enc = encoding
-        # in ASCII mode unknown, characters will be escaped as \U+nnnn unicode characters.
-        with io.open(self.filename, mode='wt', encoding=enc, errors='dxfreplace') as fp:
-            self.write(fp)
+            return encoding
 
-    def write(self, stream):
+    def write(self, stream, precision=None, workers=1):
+        """ Write drawing to text *stream*, *precision* is the fixed float precision and *workers* is the count of
+        processes to render large entity spaces, see save().
+        """
+        if precision is not None:
+            stream = FixedPrecisionWriter(stream, precision)
+            buffered = True
+        else:
+            buffered = (options.bulk_tag_writer or workers > 1) and not isinstance(stream, BufferedTextWriter)
+            if buffered:
+                stream = BufferedTextWriter(stream)
         self._create_appids()
         self._update_metadata()
+        if workers > 1:
+            writer_factory = BufferedTextWriter if precision is None else partial(FixedPrecisionWriter,
+                                                                                  precision=precision)
+            with fork_pool(workers, self.entitydb, writer_factory) as pool:
+                if pool is not None:
+                    writer = ChunkWriter(stream, pool, workers, self.entitydb)
+                    self._write_sections(writer)
+                    writer.flush()
+                    return
+        self._write_sections(stream)
+        if buffered:
+            stream.flush()
+
+    def write_binary(self, stream, encoding='auto'):
+        """ Write drawing as binary DXF to binary *stream*, *encoding* overrides the default encoding. """
+        writer = BinaryDXFWriter(stream, self.output_encoding(encoding), self.dxfversion)
+        self.write(writer)
+        writer.flush()
+
+    def _write_sections(self, stream):
         if options.store_comments:
             self.write_leading_comments(stream)
         self.sections.write(stream)
@@ -346,3 +440,64 @@ class Drawing(object):
         if self.dxfversion > 'AC1009':
             create_appid_if_not_exist('HATCHBACKGROUNDCOLOR', 0)
 
+
+class PartialDrawing(Drawing):
+    """ Read-only drawing, which contains just a subset of the DXF sections, created by
+    ezdxf.readfile(filename, sections=[...]). The HEADER section is always loaded.
+
+    Accessing a not loaded section raises DXFSectionNotLoadedError, layouts are only available if the sections TABLES,
+    BLOCKS, ENTITIES and for DXF R2000+ also OBJECTS are loaded. Saving a partial drawing is not supported.
+    """
+    def __init__(self, tagreader, sections):
+        self.loaded_sections = frozenset(name.lower() for name in sections) | frozenset(['header'])
+        super(PartialDrawing, self).__init__(tagreader)
+
+    def _load_sections(self, tagreader):
+        return Sections(tagreader, self, skipped=frozenset(KNOWN_SECTIONS) - self.loaded_sections)
+
+    def _setup_management_structures(self):
+        required = {'tables', 'blocks', 'entities'}
+        if self.dxfversion > 'AC1009':
+            required.add('objects')
+        if required <= self.loaded_sections:
+            super(PartialDrawing, self)._setup_management_structures()
+            return
+
+        if self.dxfversion > 'AC1009':
+            if 'objects' in self.loaded_sections:
+                self.rootdict = self.objects.rootdict
+                self._groups = self.objects.groups()
+        else:
+            repair.enable_handles(self)
+        self.layouts = NotLoadedLayouts(required - self.loaded_sections)
+
+    def save(self, encoding='auto', compression=None, incremental=False, precision=None, workers=1, fmt='asc'):
+        # raise before the target file is opened, an existing file remains unchanged
+        raise DXFSectionNotLoadedError('Can not save a partial drawing.')
+
+    def write(self, stream, precision=None, workers=1):
+        raise DXFSectionNotLoadedError('Can not write a partial drawing.')
+
+    def write_binary(self, stream, encoding='auto'):
+        raise DXFSectionNotLoadedError('Can not write a partial drawing.')
+
+
+class NotLoadedLayouts(object):
+    """ Placeholder for the layouts of a PartialDrawing() without the sections required for the layout management. """
+    def __init__(self, missing_sections):
+        self._missing_sections = sorted(name.upper() for name in missing_sections)
+
+    def _raise(self):
+        raise DXFSectionNotLoadedError('Layouts require the not loaded sections: {}.'.format(
+            ', '.join(self._missing_sections)))
+
+    def __getattr__(self, name):
+        if name.startswith('__'):  # special method lookup, e.g. by pickle
+            raise AttributeError(name)
+        self._raise()
+
+    def __contains__(self, name):
+        self._raise()
+
+    def __iter__(self):
+        self._raise()
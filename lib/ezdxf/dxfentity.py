@@ -7,9 +7,11 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from .lldxf.types import cast_tag_value, DXFTag
+from .lldxf.tags import modification_count
 from .lldxf.const import DXFStructureError, DXFInternalEzdxfError
 
 ACAD_REACTORS = '{ACAD_REACTORS'
+INDEXED_DXF_ATTRIBS = frozenset(['layer', 'color', 'linetype'])  # see EntitySpaceIndex()
 
 
 class DXFNamespace(object):
@@ -23,6 +25,10 @@ class DXFNamespace(object):
         super(DXFNamespace, self).__setattr__('_setter', wrapper.set_dxf_attrib)
         super(DXFNamespace, self).__setattr__('_deleter', wrapper.del_dxf_attrib)
 
+    def __reduce__(self):
+        # DXFNamespace.__setattr__ prevents default unpickling
+        return self.__class__, (self._getter.__self__, )
+
     def __getattr__(self, attrib):
         """Returns value of DXF attribute *attrib*. usage: value = DXFEntity.dxf.attrib
         """
@@ -164,16 +170,29 @@ class DXFEntity(object):
             if self.drawing.dxfversion < dxfattr.dxfversion:
                 msg = "DXFAttrib '{0}' not supported by DXF version '{1}', requires at least DXF version '{2}'."
                 raise AttributeError(msg.format(key, self.drawing.dxfversion, dxfattr.dxfversion))
+        count = modification_count()
         # no subclass is subclass index 0
         subclasstags = self.tags.subclasses[dxfattr.subclass]
         if dxfattr.xtype is not None:
             self._set_extended_type(subclasstags, dxfattr.code, dxfattr.xtype, value)
         else:
             subclasstags.set_first(dxfattr.code, cast_tag_value(dxfattr.code, value))
+        self._update_indexes(key, count)
 
     def del_dxf_attrib(self, key):
         dxfattr = self._get_dxfattr_definition(key)
+        count = modification_count()
         self._del_dxf_attrib(dxfattr)
+        self._update_indexes(key, count)
+
+    def _update_indexes(self, key, count):
+        # the secondary indexes track INDEXED_DXF_ATTRIBS, the spatial index tracks geometric attributes and the name
+        # indexes of the tables track the names of the table-entries, *count* is the modification_count() before the
+        # change
+        if self.drawing is not None:
+            entitydb = self.drawing.entitydb
+            if entitydb.indexes or (key == 'name' and entitydb.name_indexes):
+                entitydb.update_indexes(self.tags, key, count)
 
     def clone_dxf_attribs(self):
         """ Clones defined and existing DXF attributes as dict.
@@ -273,3 +292,23 @@ class DXFEntity(object):
         reactors.discard(handle)
         self.set_reactors(reactors)
 
+
+def dxf_attrib_getter(dxfattribs, key, dxfversion):
+    """ Returns a function, which returns the value of DXF attribute *key* from the ClassifiedTags() of an entity with
+    the DXF attribute definitions *dxfattribs* including the DXF default value, like get_dxf_attrib(key) of the wrapped
+    entity of a drawing with *dxfversion*, but returns None if the attribute does not exist. Returns None if *key* is
+    not supported.
+    """
+    dxfattr = dxfattribs.get(key)
+    if dxfattr is None:
+        return None
+    subclass = dxfattr.subclass
+    code = dxfattr.code
+    default = dxfattr.default
+    if dxfattr.dxfversion is not None and dxfversion < dxfattr.dxfversion:
+        default = None  # no DXF default values if DXF version is incorrect
+
+    def getter(tags):
+        return tags.subclasses[subclass].find_first(code, default)
+
+    return getter
@@ -7,6 +7,9 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from .lldxf.const import DXFStructureError
+from .lldxf.tags import modification_count
+from .dxfentity import dxf_attrib_getter
+from .spatialindex import SpatialIndex
 
 
 class EntitySpace(list):
@@ -14,23 +17,136 @@ class EntitySpace(list):
     The ENTITY section is such an entity space, but also blocks.
     The EntitySpace stores only handles to the drawing entity database.
     """
+    _index = None  # secondary index, created by get_index()
+    _spatial_index = None  # spatial index, created by get_spatial_index()
+
     def __init__(self, entitydb):
         self._entitydb = entitydb
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_index', None)  # the indexes are rebuilt at the first query
+        state.pop('_spatial_index', None)
+        return state
+
+    def append(self, handle):
+        super(EntitySpace, self).append(handle)
+        if self._index is not None:
+            self._index.add(handle)
+        if self._spatial_index is not None:
+            self._spatial_index.add(handle)
+
+    def extend(self, handles):
+        if self._index is None and self._spatial_index is None:
+            super(EntitySpace, self).extend(handles)
+        else:
+            for handle in handles:
+                self.append(handle)
+
+    def remove(self, handle):
+        super(EntitySpace, self).remove(handle)
+        if self._index is not None:
+            self._index.discard(handle)
+        if self._spatial_index is not None:
+            self._spatial_index.discard(handle)
+
+    def insert(self, index, handle):
+        super(EntitySpace, self).insert(index, handle)
+        if self._index is not None:
+            self._index.add(handle)
+        if self._spatial_index is not None:
+            self._spatial_index.add(handle)
+
+    def pop(self, index=-1):
+        handle = super(EntitySpace, self).pop(index)
+        if self._index is not None:
+            self._index.discard(handle)
+        if self._spatial_index is not None:
+            self._spatial_index.discard(handle)
+        return handle
+
+    # the other list methods, which change the content, drop the indexes, which are rebuilt at the next query
+
+    def __setitem__(self, index, value):
+        super(EntitySpace, self).__setitem__(index, value)
+        self._drop_index()
+
+    def __delitem__(self, index):
+        super(EntitySpace, self).__delitem__(index)
+        self._drop_index()
+
+    def __iadd__(self, handles):
+        self.extend(handles)
+        return self
+
+    def __imul__(self, count):
+        super(EntitySpace, self).__imul__(count)
+        self._drop_index()
+        return self
+
+    def clear(self):
+        del self[:]
+
+    if hasattr(list, '__setslice__'):  # Python 2
+        def __setslice__(self, i, j, handles):
+            super(EntitySpace, self).__setslice__(i, j, handles)
+            self._drop_index()
+
+        def __delslice__(self, i, j):
+            super(EntitySpace, self).__delslice__(i, j)
+            self._drop_index()
+
+    def get_index(self, dxffactory):
+        """ Returns the secondary index of the entity space, created at the first call.
+        """
+        index = self._index
+        if index is None or not index.valid:
+            index = EntitySpaceIndex(self, dxffactory)
+            self._entitydb.indexes.append(index)
+            self._index = index
+        return index
+
+    def get_spatial_index(self, dxffactory):
+        """ Returns the spatial index of the entity space, created at the first call.
+        """
+        index = self._spatial_index
+        if index is None or not index.valid:
+            index = SpatialIndex(self, dxffactory)
+            self._entitydb.indexes.append(index)
+            self._spatial_index = index
+        return index
+
+    def _drop_index(self):
+        indexes = self._entitydb.indexes
+        for index in (self._index, self._spatial_index):
+            if index is not None and index in indexes:
+                indexes.remove(index)
+        self._index = None
+        self._spatial_index = None
+
     def get_tags_by_handle(self, handle):
         return self._entitydb[handle]
 
-    def store_tags(self, tags):
-        try:
-            handle = tags.get_handle()
-        except ValueError:  # no handle tag available
-            # handle is not stored in tags!!!
-            handle = self._entitydb.handles.next()
+    def store_tags(self, tags, handle=None):
+        """ Store *tags* in the entity database and add them to the entity space, *handle* is the database key of
+        tags already stored in the entity database.
+        """
+        if handle is None:
+            try:
+                handle = tags.get_handle()
+            except ValueError:  # no handle tag available
+                # handle is not stored in tags!!!
+                handle = self._entitydb.handles.next()
+            self._entitydb[handle] = tags
         self.append(handle)
-        self._entitydb[handle] = tags
         return handle
 
     def write(self, stream):
+        write_entities = getattr(stream, 'write_entities', None)
+        if write_entities is not None:  # incremental save, see IncrementalWriter()
+            write_entities(self)
+            return
+
         for handle in self:
             # write linked entities
             while handle is not None:
@@ -44,21 +160,160 @@ class EntitySpace(list):
 
     def delete_all_entities(self):
         # do not delete database objects - entity space just manage handles
-        del self[:]
+        del self[:]  # drops the indexes
 
     def add_handle(self, handle):
         self.append(handle)
 
 
+class EntitySpaceIndex(object):
+    """ Secondary indexes of an EntitySpace(): DXF type and the DXF attributes layer, color and linetype -> set of
+    handles, each index is created at the first query with an equality term on it.
+
+    The indexes are maintained by adding and removing handles to/from the entity space and by setting or deleting the
+    indexed DXF attributes by the entity wrappers, see EntityDB.update_indexes(). Changes of the tags, which bypass the
+    wrappers, like tags.set_first(8, 'LAYER') or the modification of the points of a LWPOLYLINE, are detected by the
+    modification_count() of the tags: the next query evaluates all entities, and the indexes are rebuilt by the
+    following query, if the tags were not changed meanwhile.
+    """
+    def __init__(self, handles, dxffactory):
+        self.valid = True
+        self._count = modification_count()  # modification count of the tags at the last update of the indexes
+        self._changed = None  # modification count at the last query with outdated indexes
+        self._handles = handles
+        self._dxffactory = dxffactory
+        self._entitydb = dxffactory.entitydb
+        self._getters = {}  # attribute getters by (DXF type, attribute name)
+        self._indexes = {}  # index name -> value -> set of handles
+        self._values = {}  # index name -> handle -> indexed value
+
+    def _attrib_getter(self, dxftype, key):
+        getter = self._getters.get((dxftype, key))
+        if getter is None:
+            dxffactory = self._dxffactory
+            wrapper = dxffactory.ENTITY_WRAPPERS.get(dxftype, dxffactory.DEFAULT_WRAPPER)
+            if hasattr(wrapper, 'cast'):  # the DXF attributes are defined by the casted wrapper class
+                getter = _wrapped_attrib_getter(dxffactory.wrap_entity, key)
+            else:
+                getter = dxf_attrib_getter(wrapper.DXFATTRIBS, key, dxffactory.dxfversion) or _none
+            self._getters[(dxftype, key)] = getter
+        return getter
+
+    def _value(self, name, tags):
+        dxftype = tags.noclass[0].value
+        if name == 'dxftype':
+            return dxftype
+        return self._attrib_getter(dxftype, name)(tags)
+
+    def _add(self, name, handle, value):
+        self._values[name][handle] = value
+        if value is not None:
+            index = self._indexes[name]
+            handles = index.get(value)
+            if handles is None:
+                index[value] = set([handle])
+            else:
+                handles.add(handle)
+
+    def _discard(self, name, handle):
+        value = self._values[name].pop(handle, None)
+        if value is not None:
+            index = self._indexes[name]
+            handles = index[value]
+            handles.discard(handle)
+            if not handles:
+                del index[value]
+
+    def _create(self, name):
+        self._indexes[name] = {}
+        self._values[name] = {}
+        entitydb = self._entitydb
+        for handle in self._handles:
+            self._add(name, handle, self._value(name, entitydb[handle]))
+
+    def add(self, handle):
+        if self._indexes:
+            tags = self._entitydb[handle]
+            for name in self._indexes:
+                self._add(name, handle, self._value(name, tags))
+
+    def discard(self, handle):
+        for name in self._indexes:
+            self._discard(name, handle)
+
+    def update(self, handle, key, count=None):
+        """ Update the indexes after changing the DXF attribute *key* of entity *handle*, *count* is the
+        modification_count() before the change.
+        """
+        if count != self._count:  # outdated by changes, which bypass the wrappers, see candidates()
+            if count == self._changed:  # changes by the wrappers do not delay the rebuild
+                self._changed = modification_count()
+            return
+        if key in self._indexes and handle in self._values[key]:
+            self._discard(key, handle)
+            self._add(key, handle, self._value(key, self._entitydb[handle]))
+        self._count = modification_count()
+
+    def candidates(self, terms):
+        """ Returns the set of handles, which match all *terms*, a list of (index name, match) tuples, where match is a
+        function, which returns True for matching index values. Returns None if the indexes are outdated and the
+        query has to evaluate all entities.
+        """
+        count = modification_count()
+        if count != self._count:
+            if count != self._changed:  # tags changed since the last query, do not rebuild the indexes for each query
+                self._changed = count
+                return None
+            names = list(self._indexes)
+            self._indexes = {}
+            self._values = {}
+            for name in names:
+                self._create(name)
+            self._count = count
+        result = None
+        for name, match in terms:
+            if name not in self._indexes:
+                self._create(name)
+            matches = [handles for value, handles in self._indexes[name].items() if match(value)]
+            if len(matches) == 1:
+                handles = matches[0]
+            else:
+                handles = set().union(*matches)
+            result = handles if result is None else result & handles
+            if not result:
+                break
+        return result
+
+
+def _none(tags):
+    return None
+
+
+def _wrapped_attrib_getter(wrap_entity, key):
+    def getter(tags):
+        try:
+            return wrap_entity(tags).get_dxf_attrib(key)  # with DXF default value
+        except (AttributeError, ValueError):  # not supported or does not exist
+            return None
+
+    return getter
+
+
+def _paper_space_key(tags):
+    return tags.noclass.find_first(67, default=0)  # paper space value
+
+
+def _owner_key(tags):
+    return tags.noclass.find_first(330, default=0)  # if no owner tag, set 0 and repair later
+
+
 class LayoutSpaces(object):
     def __init__(self, entitydb, dxfversion):
         self._layout_spaces = {}
         self._entitydb = entitydb
         self._dxfversion = dxfversion
-        if dxfversion <= 'AC1009':
-            self._get_key = lambda t: t.noclass.find_first(67, default=0)  # paper space value
-        else:
-            self._get_key = lambda t: t.noclass.find_first(330, default=0)  # if no owner tag, set 0 and repair later
+        # module level functions, because lambdas are not picklable
+        self._get_key = _paper_space_key if dxfversion <= 'AC1009' else _owner_key
 
     def __iter__(self):
         """ Iterate over all layout entity spaces.
@@ -117,16 +372,19 @@ class LayoutSpaces(object):
         return entity_space
 
     def set_entity_space(self, key, entity_space):
+        replaced_entity_space = self._layout_spaces.get(key)
+        if replaced_entity_space is not None and replaced_entity_space is not entity_space:
+            replaced_entity_space._drop_index()  # unregister the indexes of the replaced entity space
         self._layout_spaces[key] = entity_space
 
-    def store_tags(self, tags):
-        """ Store *tags* in associated layout entity space.
+    def store_tags(self, tags, handle=None):
+        """ Store *tags* in associated layout entity space, see EntitySpace.store_tags().
         """
         # AC1018: if entities have no owner tag (330) (thanks to ProE), store this entities in a temporary model space
         # with layout_key = 0;
         # this will be resolved later in LayoutSpaces.repair_model_space()
         entity_space = self.get_entity_space(self._get_key(tags))
-        entity_space.store_tags(tags)
+        entity_space.store_tags(tags, handle)
 
     def write(self, stream, keys=None):
         """ Write all entity spaces to *stream*.
@@ -156,7 +414,7 @@ class LayoutSpaces(object):
         """ Delete layout entity space *key*.
         """
         entity_space = self._layout_spaces[key]
-        entity_space.delete_all_entities()
+        entity_space.delete_all_entities()  # also unregisters the indexes of the entity space
         del self._layout_spaces[key]
 
     def delete_all_entities(self):
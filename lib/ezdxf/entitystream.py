@@ -0,0 +1,61 @@
+# Purpose: iterate over DXF entities without building a drawing
+# Created: 18.10.2026
+# License: MIT License
+from __future__ import unicode_literals
+
+from . import database
+from .dxffactory import dxffactory
+from .lldxf.classifiedtags import get_tags_linker
+from .lldxf.lazytags import classified_tags_groups
+from .lldxf.tagger import skip_comments
+from .query import entity_matcher
+
+STRUCTURE_TAGS = frozenset(['SECTION', 'ENDSEC', 'EOF'])
+
+
+class StreamDrawing(object):
+    """ Minimal drawing replacement for the entities yielded by iter_stream_entities(), provides no header, tables,
+    blocks or layouts.
+
+    The entity database contains just the actual entity and its linked entities (ATTRIB, VERTEX, SEQEND).
+    """
+    def __init__(self, dxfversion, encoding):
+        self.dxfversion = dxfversion
+        self.encoding = encoding
+        self.entitydb = database.factory()
+        self.dxffactory = dxffactory(self)
+
+
+def iter_stream_entities(tags, dxfversion, encoding='cp1252', query='*'):
+    """ Yields wrapped DXF entities from the tag stream *tags* of the ENTITIES or BLOCKS section, which match *query*.
+
+    Linked entities like the VERTEX entities of a POLYLINE are not yielded, but they are accessible by the
+    POLYLINE entity until the next entity is requested.
+    """
+    drawing = StreamDrawing(dxfversion, encoding)
+    wrap_entity = drawing.dxffactory.wrap_entity
+    fix_tags = drawing.dxffactory.modify_tags
+    match = None if query == '*' else entity_matcher(query)
+    linked_tags = get_tags_linker()
+    entity = None  # last main entity, complete if the next main entity starts
+    for tags in classified_tags_groups(skip_comments(tags)):
+        fix_tags(tags)  # post read tags fixer for VERTEX!
+        try:
+            handle = tags.get_handle()
+        except ValueError:  # DXF R12 without handles
+            handle = drawing.entitydb.handles.next()
+        if linked_tags(tags, handle):  # also creates the link structure as side effect
+            drawing.entitydb[handle] = tags
+            continue
+
+        if entity is not None and (match is None or match(entity)):
+            yield entity
+        entity = None
+        if tags.dxftype() in STRUCTURE_TAGS:
+            continue
+        drawing.entitydb = database.factory()  # forget the previous entity
+        drawing.entitydb[handle] = tags
+        entity = wrap_entity(tags)
+
+    if entity is not None and (match is None or match(entity)):
+        yield entity
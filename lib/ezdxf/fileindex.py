@@ -0,0 +1,276 @@
+# Purpose: persistent side-car index for random access to DXF entities by handle
+# Created: 18.10.2026
+# License: MIT License
+"""
+The FileIndex() maps the handles of all entities of a DXF file to the byte position of the entities in the file,
+and stores also the DXF type and the layer name of the entities. The index is stored as JSON file beside the DXF
+file (filename + '.ezidx') and is rebuilt if the size or the modification time of the DXF file has changed.
+
+A POLYLINE or an INSERT with ATTRIB entities is indexed as a whole, including the following VERTEX, ATTRIB and SEQEND
+entities, this linked entities are indexed separately too.
+
+IndexedDXF() provides random access to the entities of a DXF file by handle, each entity is read by a single file
+seek, without parsing the whole file.
+"""
+from __future__ import unicode_literals
+
+import io
+import os
+import json
+from itertools import chain
+
+from .database import EntityDB
+from .dxffactory import dxffactory
+from .lldxf.tags import read_dxf_info, dxf_encoding
+from .lldxf.tagger import binary_line_blocks, bulk_tagger
+from .lldxf.lazytags import classified_tags_groups
+from .lldxf.classifiedtags import get_tags_linker
+from .tools.c23 import PY3
+
+if not PY3:
+    from itertools import izip as zip
+
+INDEX_EXTENSION = '.ezidx'
+INDEX_FORMAT = 1
+INDEXED_SECTIONS = frozenset([b'TABLES', b'BLOCKS', b'ENTITIES', b'OBJECTS'])
+LINKED_ENTITIES = frozenset([b'VERTEX', b'ATTRIB', b'SEQEND'])
+DXFTYPE, LAYER = 2, 3  # index of DXF type and layer in index entries
+
+
+class FileIndex(object):
+    """ Index of the entities of a DXF file: handle -> [offset, length, dxftype, layer] """
+    def __init__(self, size=0, mtime=0., dxfversion='AC1009', encoding='cp1252', entries=None):
+        self.size = size  # of DXF file in bytes
+        self.mtime = mtime  # of DXF file
+        self.dxfversion = dxfversion
+        self.encoding = encoding  # detected encoding of the DXF file
+        self.entries = entries or {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, handle):
+        return handle in self.entries
+
+    def __getitem__(self, handle):
+        return self.entries[handle]
+
+    @staticmethod
+    def index_filename(filename):
+        return filename + INDEX_EXTENSION
+
+    def is_fresh(self, filename):
+        """ True if the index matches the actual state of DXF file *filename*. """
+        stat = os.stat(filename)
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    @classmethod
+    def get(cls, filename):
+        """ Returns the index of DXF file *filename*, loads the side-car index file if it is fresh, else builds a new
+        index and tries to save it.
+        """
+        try:
+            index = cls.load(cls.index_filename(filename))
+        except (IOError, OSError, ValueError, KeyError):  # no or invalid index file
+            index = None
+        if index is not None and index.is_fresh(filename):
+            return index
+        index = cls.build(filename)
+        try:
+            index.save(cls.index_filename(filename))
+        except (IOError, OSError):  # just use the index in memory, if the index file is not writeable
+            pass
+        return index
+
+    @classmethod
+    def load(cls, filename):
+        with io.open(filename, mode='rt', encoding='utf-8') as fp:
+            data = json.load(fp)
+        if data['format'] != INDEX_FORMAT:
+            raise ValueError('Unsupported index format.')
+        return cls(data['size'], data['mtime'], data['dxfversion'], data['encoding'], data['entries'])
+
+    def save(self, filename):
+        data = {
+            'format': INDEX_FORMAT,
+            'size': self.size,
+            'mtime': self.mtime,
+            'dxfversion': self.dxfversion,
+            'encoding': self.encoding,
+            'entries': self.entries,
+        }
+        with io.open(filename, mode='wb') as fp:
+            fp.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def build(cls, filename):
+        """ Scans DXF file *filename* at the byte level, without decoding all tags. """
+        stat = os.stat(filename)
+        with io.open(filename, mode='rb') as fp:
+            info, data = read_dxf_info(fp)
+            encoding = dxf_encoding(info)
+            entries = {}
+            for handle, offset, length, dxftype, layer in scan_entities(fp, prefix=data):
+                entries[handle.decode(encoding, 'ignore')] = [
+                    offset,
+                    length,
+                    dxftype.decode(encoding, 'ignore'),
+                    None if layer is None else layer.decode(encoding, 'ignore'),
+                ]
+        return cls(stat.st_size, stat.st_mtime, info.version, encoding, entries)
+
+
+def scan_entities(stream, prefix=b''):
+    """ Yields (handle, offset, length, dxftype, layer) for all entities with a handle in the TABLES, BLOCKS,
+    ENTITIES and OBJECTS section of the binary DXF *stream*, all values except *offset* and *length* as bytes, *layer*
+    is None for entities without a layer. *prefix* are bytes already read from *stream*.
+
+    The *length* of a POLYLINE or an INSERT with following ATTRIB entities includes all linked entities.
+    """
+    def close(record, end):
+        record[2] = end - record[1]
+        if record[0] is not None:  # ignore entities without handle
+            return tuple(record)
+
+    offset = 0
+    section = None
+    entity = None  # [handle, offset, length, dxftype, layer] of the actual entity
+    group = None  # entity which starts a linked structure
+    linked_entities_follow = False
+    lines = chain.from_iterable(binary_line_blocks(stream, prefix=prefix))
+    for code, value in zip(lines, lines):
+        start = offset
+        offset += len(code) + len(value) + 2  # + 2x '\n'
+        code = code.strip()
+        if code == b'0':
+            value = value.rstrip()
+            if entity is not None and entity is not group:
+                record = close(entity, start)
+                if record:
+                    yield record
+            entity = None
+            if group is not None and not (linked_entities_follow and value in LINKED_ENTITIES):
+                record = close(group, start)
+                if record:
+                    yield record
+                group = None
+
+            if value == b'SECTION':
+                section = b''
+            elif value == b'ENDSEC':
+                section = None
+            elif section in INDEXED_SECTIONS:
+                entity = [None, start, 0, value, None]
+                if value == b'POLYLINE' or value == b'INSERT':
+                    group = entity
+                    linked_entities_follow = value == b'POLYLINE'  # INSERT: depends on group code 66
+                elif value == b'SEQEND':
+                    linked_entities_follow = False  # end of linked structure
+        elif section == b'' and code == b'2':
+            section = value.rstrip()
+        elif entity is not None:
+            if (code == b'5' or code == b'105') and entity[0] is None:
+                entity[0] = value.rstrip()
+            elif code == b'8' and entity[4] is None:
+                entity[4] = value.rstrip()
+            elif code == b'66' and entity is group:
+                linked_entities_follow = value.strip() == b'1'
+
+
+class IndexedEntityDB(EntityDB):
+    """ Read-only entity database, reads the entities on demand from the binary *stream* of the DXF file, located by
+    the FileIndex() *index*. Loaded entities are cached.
+    """
+    def __init__(self, stream, index, encoding='cp1252', fix_tags=None):
+        super(IndexedEntityDB, self).__init__()
+        self._stream = stream
+        self.index = index
+        self.encoding = encoding
+        self.fix_tags = fix_tags  # post read tags fixer
+
+    def __getitem__(self, handle):
+        try:
+            return self._database[handle]
+        except KeyError:
+            pass
+        offset, length = self.index[handle][:2]  # raises KeyError for unknown handles
+        self._stream.seek(offset)
+        self._load(self._stream.read(length))
+        return self._database[handle]
+
+    def _load(self, data):
+        lines = data.split(b'\n')
+        if data.endswith(b'\n'):
+            lines.pop()
+        linked_tags = get_tags_linker()
+        for tags in classified_tags_groups(bulk_tagger(zip(lines[::2], lines[1::2]), self.encoding, 'ignore')):
+            if self.fix_tags is not None:
+                self.fix_tags(tags)
+            try:
+                handle = tags.get_handle()
+            except ValueError:  # linked entities without handle
+                handle = self.get_unique_handle()
+            linked_tags(tags, handle)  # creates the link structure
+            self._database[handle] = tags
+
+    def __contains__(self, handle):
+        return handle in self.index or handle in self._database
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index.entries.keys())
+
+    def keys(self):
+        return self.index.entries.keys()
+
+    def values(self):
+        return (self.__getitem__(handle) for handle in self.keys())
+
+    def items(self):
+        return ((handle, self.__getitem__(handle)) for handle in self.keys())
+
+    def is_lazy(self, handle):
+        return handle not in self._database
+
+
+class IndexedDXF(object):
+    """ Random access to the entities of DXF file *filename* by handle, replaces the drawing object for the wrapped
+    entities, but provides no header, tables, blocks or layouts.
+
+    The side-car index file is created by the first access and reused as long as the DXF file is unchanged.
+    """
+    def __init__(self, filename, encoding='auto'):
+        self.filename = filename
+        self.index = FileIndex.get(filename)
+        self.dxfversion = self.index.dxfversion
+        self.encoding = self.index.encoding if encoding == 'auto' else encoding
+        self._stream = io.open(filename, mode='rb')
+        self.entitydb = IndexedEntityDB(self._stream, self.index, self.encoding)
+        self.dxffactory = dxffactory(self)
+        self.entitydb.fix_tags = self.dxffactory.modify_tags
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._stream.close()
+
+    def get_dxf_entity(self, handle):
+        """ Get wrapped entity by *handle*, raises KeyError if *handle* does not exist. """
+        return self.dxffactory.wrap_handle(handle)
+
+    def handles(self, dxftype=None, layer=None):
+        """ Iterate over the handles of all indexed entities, filtered by *dxftype* and *layer* if not None, without
+        reading the DXF file.
+        """
+        for handle, entry in self.index.entries.items():
+            if dxftype is not None and entry[DXFTYPE] != dxftype:
+                continue
+            if layer is not None and entry[LAYER] != layer:
+                continue
+            yield handle
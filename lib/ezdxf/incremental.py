@@ -0,0 +1,174 @@
+# Purpose: incremental saving, copies unchanged entities verbatim from the source DXF file
+# Created: 18.10.2026
+# License: MIT License
+"""
+A drawing loaded by readfile() remembers its source file as DXFSource(). Drawing.save(incremental=True) writes the
+HEADER, CLASSES and TABLES section and the BLOCK and ENDBLK entities as usual, but the entities of the entity spaces
+(ENTITIES section, block content and OBJECTS section) are copied as byte spans from the source file, if they were not
+changed since loading. Consecutive unchanged entities are copied as a single span.
+
+An entity is changed if the EntityDB() handle was added, replaced or deleted (EntityDB.dirty), or if the tags were
+modified, see ClassifiedTags.is_modified(). Entities without a handle in the source file are always rendered.
+
+The span of an entity starts at its group code 0 line and ends at the next group code 0 line, a '0' line is a group
+code line if the following line is not a group code, which are integers. The handle has to be the first tag after
+the DXF type, which is the case for all DXF files written by AutoCAD and ezdxf, other entities are rendered.
+"""
+from __future__ import unicode_literals
+
+import io
+import os
+import re
+import mmap
+import shutil
+import tempfile
+
+from .lldxf.lazytags import LazyTags
+from .lldxf.tagwriter import BufferedTextWriter
+from .tools.zipmanager import compressed_writer
+
+ENTITY_START = re.compile(
+    br'\n[ \t]*0[ \t]*\r?\n'  # group code 0 line or a value line '0'
+    br'(?=[ \t]*[0-9]*[A-Za-z_][^\n]*\n'  # followed by a DXF type like 'LINE' or '3DFACE' and not by a group code
+    br'(?:[ \t]*(?:5|105)[ \t]*\r?\n[ \t]*([0-9A-Fa-f]+)[ \t]*\r?\n)?)')  # optional handle
+
+
+class DXFSource(object):
+    """ The DXF file *filename* of a loaded drawing, encoded by *encoding*. """
+    def __init__(self, filename, encoding, dxfversion):
+        stat = os.stat(filename)
+        self.filename = filename
+        self.encoding = encoding
+        self.dxfversion = dxfversion
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+
+    def is_unchanged(self):
+        """ True if the source file was not changed since loading. """
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def save(self, drawing, encoding, compression=None):
+        """ Save *drawing* as *drawing.filename*, copies the unchanged entities from the source file. The source file
+        can be overwritten, the new file is written into a temporary file and replaces the source file at the end.
+        """
+        filename = drawing.filename
+        replace = _is_same_file(filename, self.filename)
+        if replace:
+            fd, target = tempfile.mkstemp(suffix='.dxf', dir=os.path.dirname(os.path.abspath(filename)))
+            os.close(fd)
+        else:
+            target = filename
+        try:
+            with io.open(self.filename, mode='rb') as fp:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    if compression is None:
+                        with io.open(target, mode='wt', encoding=encoding, errors='dxfreplace') as stream:
+                            self._write(drawing, stream, data)
+                    else:
+                        with compressed_writer(target, compression, encoding=encoding, errors='dxfreplace') as stream:
+                            self._write(drawing, stream, data)
+                finally:
+                    data.close()
+            if replace:
+                shutil.copymode(filename, target)
+                _replace_file(target, filename)
+        except Exception:
+            if replace and os.path.exists(target):
+                os.remove(target)
+            raise
+        if replace:  # the saved file is the new source file
+            drawing.source = None if compression else DXFSource(filename, encoding, drawing.dxfversion)
+
+    def _write(self, drawing, stream, data):
+        writer = IncrementalWriter(stream, data, self.encoding, drawing.entitydb)
+        drawing.write(writer)
+        writer.flush()
+
+
+class IncrementalWriter(BufferedTextWriter):
+    """ Buffered text writer, which copies the unchanged entities from the source DXF file *data* (bytes or mmap),
+    encoded by *encoding*, the entity spaces call write_entities() instead of writing the entities.
+    """
+    def __init__(self, stream, data, encoding, entitydb):
+        super(IncrementalWriter, self).__init__(stream)
+        self._data = data
+        self._encoding = encoding
+        self._entitydb = entitydb
+        self._crlf = data.find(b'\r\n', 0, 1024) > -1
+        self._spans = scan_spans(data)
+        self._run_start = 0  # actual span of unchanged entities
+        self._run_end = 0
+
+    def write(self, s):
+        if self._run_end:
+            self._copy_run()
+        super(IncrementalWriter, self).write(s)
+
+    def flush(self):
+        if self._run_end:
+            self._copy_run()
+        super(IncrementalWriter, self).flush()
+
+    def write_entities(self, handles):
+        """ Write the entities *handles* and the linked entities. """
+        entitydb = self._entitydb
+        peek = entitydb.peek
+        dirty = entitydb.dirty
+        spans = self._spans
+        for handle in handles:
+            while handle is not None:
+                tags = peek(handle)
+                span = spans.get(handle)
+                if span is None or handle in dirty or (tags.__class__ is not LazyTags and tags.is_modified()):
+                    tags = entitydb[handle]
+                    tags.write(self)
+                else:
+                    start, end = span
+                    if start != self._run_end:
+                        if self._run_end:
+                            self._copy_run()
+                        self._run_start = start
+                    self._run_end = end
+                handle = tags.link
+
+    def _copy_run(self):
+        text = self._data[self._run_start:self._run_end].decode(self._encoding, 'ignore')
+        if self._crlf:
+            text = text.replace('\r\n', '\n')
+        self._run_start = 0
+        self._run_end = 0
+        super(IncrementalWriter, self).write(text)
+
+
+def scan_spans(data):
+    """ Returns the byte spans of all entities with a handle in the DXF file *data* as dict handle -> (start, end). """
+    spans = {}
+    handle = None
+    start = 0
+    for match in ENTITY_START.finditer(data):
+        end = match.start() + 1  # entity starts after the line ending of the previous line
+        if handle is not None:
+            spans[handle.decode('ascii')] = (start, end)
+        start = end
+        handle = match.group(1)
+    return spans
+
+
+def _is_same_file(filename1, filename2):
+    def normalize(filename):
+        return os.path.normcase(os.path.realpath(filename))
+    return normalize(filename1) == normalize(filename2)
+
+
+def _replace_file(source, destination):
+    try:
+        os.replace(source, destination)
+    except AttributeError:  # Python 2
+        if os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
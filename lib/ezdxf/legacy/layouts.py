@@ -8,7 +8,7 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from ..graphicsfactory import GraphicsFactory
 from ..entityspace import EntitySpace
-from ..query import EntityQuery
+from ..query import EntityQuery, handle_query
 from ..groupby import groupby
 
 
@@ -138,7 +138,36 @@ class BaseLayout(GraphicsFactory):
 
     # noinspection PyTypeChecker
     def query(self, query='*'):
-        return EntityQuery(iter(self), query)
+        return handle_query(self._entity_space, self._dxffactory, query)
+
+    def get_spatial_index(self):
+        """
+        Get the spatial index of the layout, created at the first call and maintained by adding and deleting
+        entities, see SpatialIndex().
+        """
+        return self._entity_space.get_spatial_index(self._dxffactory)
+
+    def query_window(self, min_point, max_point):
+        """
+        Get all entities, which bounding boxes intersect the rectangular window *min_point*, *max_point* in the
+        xy-plane of the WCS as EntityQuery(), sorted by handle.
+
+        Args:
+            min_point: first corner of the window as (x, y) tuple
+            max_point: opposite corner of the window as (x, y) tuple
+
+        """
+        wrap = self._dxffactory.wrap_handle
+        handles = self.get_spatial_index().intersecting(min_point, max_point)
+        return EntityQuery(wrap(handle) for handle in handles)
+
+    def nearest(self, point, count=1):
+        """
+        Get the *count* entities with the smallest distance of their bounding boxes to *point* in the xy-plane of
+        the WCS, returns a list sorted by distance.
+        """
+        wrap = self._dxffactory.wrap_handle
+        return [wrap(handle) for handle in self.get_spatial_index().nearest(point, count)]
 
     def groupby(self, dxfattrib="", key=None):
         return groupby(iter(self), dxfattrib, key)
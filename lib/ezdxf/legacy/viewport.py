@@ -143,6 +143,7 @@ class Viewport(GraphicEntity):
             self.tags.xdata.insert(0, dxftags)  # insert viewport data as first extended data
         else:
             self.tags.xdata[pos] = dxftags
+        self.tags.modified = True
 
     def get_next_viewport_id(self):
         current_id = Viewport.viewport_id
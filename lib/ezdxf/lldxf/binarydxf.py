@@ -0,0 +1,271 @@
+# Purpose: read and write binary DXF files
+# Created: 18.10.2026
+# License: MIT License
+"""
+Binary DXF files start with the sentinel b'AutoCAD Binary DXF<CR><LF><SUB><NUL>' followed by the same tag structure as
+ASCII DXF files, but group codes and values are stored in binary form, all numbers little endian:
+
+- group code: 2 byte short for DXF R13 and later, DXF R12 and prior uses 1 byte, 255 is followed by a 2 byte short
+- strings: encoded characters terminated by a NUL byte
+- doubles: 8 byte IEEE double, each coordinate of a point is a separate tag like in ASCII DXF files
+- integers: 2, 4 or 8 bytes, booleans 290-299: 1 byte
+- binary data 310-319 and 1004: 1 byte length followed by the data bytes, ezdxf uses hex strings as value
+
+The binary_tagger() yields the same DXFTag() stream as the bulk_tagger() for ASCII DXF files.
+"""
+from __future__ import unicode_literals
+
+import struct
+from functools import partial
+from binascii import hexlify, unhexlify
+
+from .const import DXFStructureError
+from .types import DXFTag, TYPE_TABLE, POINT_CODES
+from .tags import DXFInfo
+from .tagger import string_tagger
+from .tagwriter import BufferedTextWriter
+from ..tools.c23 import ustr
+from ..tools.compressedstring import CompressedString
+
+BINARY_DXF_SENTINEL = b'AutoCAD Binary DXF\r\n\x1a\x00'
+
+STRING, DOUBLE, INT16, INT32, INT64, BOOL, BINARY = range(7)
+NUMBER, POINT, SKIP = range(7, 10)  # additional encoder kinds of the BinaryDXFWriter()
+
+
+def _build_value_types():
+    types = {}  # missing group codes are strings
+    for code, caster in TYPE_TABLE.items():
+        if code >= 0 and caster is not int and caster is not ustr:
+            types[code] = DOUBLE  # floats and point coordinates
+    for codes, value_type in [
+        ((60, 80), INT16), ((170, 180), INT16), ((270, 290), INT16), ((370, 390), INT16), ((400, 410), INT16),
+        ((1060, 1071), INT16), ((90, 100), INT32), ((420, 430), INT32), ((440, 460), INT32), ((1071, 1072), INT32),
+        ((160, 170), INT64), ((290, 300), BOOL), ((310, 320), BINARY), ((1004, 1005), BINARY),
+    ]:
+        for code in range(*codes):
+            types[code] = value_type
+    for code in POINT_CODES:  # y and z coordinates
+        types[code + 10] = DOUBLE
+        types[code + 20] = DOUBLE
+    return types
+
+# value types of the group codes as dict group code -> value type, missing group codes are strings
+VALUE_TYPES = _build_value_types()
+
+SHORT = struct.Struct('<h')
+BYTE = struct.Struct('<B')
+VALUE_FORMATS = {
+    DOUBLE: 'd',
+    INT16: 'h',
+    INT32: 'i',
+    INT64: 'q',
+    BOOL: 'B',
+}
+VALUE_STRUCTS = dict((value_type, struct.Struct('<' + fmt)) for value_type, fmt in VALUE_FORMATS.items())
+
+
+def is_binary_dxf(data):
+    """ True if *data*, the leading bytes of a file, starts with the binary DXF sentinel. """
+    return data[:len(BINARY_DXF_SENTINEL)] == BINARY_DXF_SENTINEL
+
+
+def binary_tagger(data, encoding='cp1252', errors='ignore'):
+    """ Generates DXFTag() from binary DXF *data* (bytes), yields the same tags as bulk_stream_tagger() for an ASCII
+    DXF file. Does not skip comment tags 999.
+
+    Decoded strings are cached, because most strings of a DXF file are repeated DXF types, subclass markers, layer
+    names and owner handles.
+    """
+    if not is_binary_dxf(data):
+        raise DXFStructureError('Not a binary DXF file.')
+    value_types = VALUE_TYPES
+    point_codes = POINT_CODES
+    unpack_short = SHORT.unpack_from
+    unpack_byte = BYTE.unpack_from
+    unpack_double = VALUE_STRUCTS[DOUBLE].unpack_from
+    unpack_values = dict((value_type, (s.unpack_from, s.size)) for value_type, s in VALUE_STRUCTS.items())
+    find = data.find
+    strings = {}  # cache of decoded strings
+    size = len(data)
+    position = len(BINARY_DXF_SENTINEL)
+    # the first tag is (0, 'SECTION'), the second byte is 'S' for 1 byte group codes
+    short_codes = data[position + 1:position + 2] == b'\x00'
+
+    def read_code(position):
+        if short_codes:
+            return unpack_short(data, position)[0], position + 2
+        code = unpack_byte(data, position)[0]
+        if code == 255:
+            return unpack_short(data, position + 1)[0], position + 3
+        return code, position + 1
+
+    try:
+        while position < size:
+            if short_codes:
+                code = unpack_short(data, position)[0]
+                position += 2
+            else:
+                code, position = read_code(position)
+            value_type = value_types.get(code, STRING)
+            if value_type == STRING:
+                end = find(b'\x00', position)
+                if end < 0:
+                    raise DXFStructureError('Missing string terminator for group code {}.'.format(code))
+                raw = data[position:end]
+                value = strings.get(raw)
+                if value is None:
+                    value = raw.decode(encoding, errors)
+                    strings[raw] = value
+                position = end + 1
+            elif value_type == DOUBLE:
+                value = unpack_double(data, position)[0]
+                position += 8
+                if code in point_codes:  # parse x, y and z coordinate in one step
+                    ycode, position = read_code(position)  # y coordinate is mandatory
+                    if ycode != code + 10:
+                        raise DXFStructureError("Missing required y coordinate for group code {}.".format(code))
+                    y = unpack_double(data, position)[0]
+                    position += 8
+                    value = (value, y)
+                    if position < size:
+                        zcode, zposition = read_code(position)  # z coordinate just for 3d points
+                        if zcode == code + 20:
+                            value = (value[0], y, unpack_double(data, zposition)[0])
+                            position = zposition + 8
+            elif value_type == BINARY:
+                length = unpack_byte(data, position)[0]
+                value = hexlify(data[position + 1:position + 1 + length]).upper().decode('ascii')
+                position += 1 + length
+            else:  # integers
+                unpack, length = unpack_values[value_type]
+                value = unpack(data, position)[0]
+                position += length
+            yield DXFTag(code, value)
+    except struct.error:
+        raise DXFStructureError('Unexpected end of binary DXF data.')
+
+
+def binary_dxf_info(data):
+    """ Detect DXF version and encoding from the HEADER section of binary DXF *data*, returns DXFInfo(). """
+    info = DXFInfo()
+    tags = binary_tagger(data)
+    for tag in tags:
+        if tag == (0, 'ENDSEC'):
+            break
+        if tag.code == 9:
+            method = getattr(info, tag.value[1:], None)
+            if method is not None:
+                method(next(tags).value)
+    return info
+
+
+def filter_tag_sections(tags, sections):
+    """ Yields the tags of the DXF sections *sections*, an iterable of upper case section names, and the EOF tag. """
+    sections = frozenset(sections)
+    tags = iter(tags)
+    for tag in tags:
+        if tag == (0, 'SECTION'):
+            name = next(tags)
+            if name.value in sections:
+                yield tag
+                yield name
+                for tag in tags:
+                    yield tag
+                    if tag == (0, 'ENDSEC'):
+                        break
+            else:
+                for tag in tags:
+                    if tag == (0, 'ENDSEC'):
+                        break
+        elif tag == (0, 'EOF'):
+            yield tag
+
+
+class BinaryDXFWriter(BufferedTextWriter):
+    """ Buffered writer, which writes binary DXF into the binary *stream*, the strings are encoded by *encoding*,
+    DXF R12 (*dxfversion* 'AC1009') and prior use 1 byte group codes.
+
+    write_tags() renders the tags by the strtags() method as binary DXF, DXF text written by write() is parsed and
+    converted, comment tags 999 are not written. The group code and the value of a numeric tag and all coordinates of
+    a point are packed by one cached struct per group code.
+    """
+    def __init__(self, stream, encoding, dxfversion, blocksize=1024 * 1024):
+        super(BinaryDXFWriter, self).__init__(stream, blocksize)
+        self._encoding = encoding
+        self._short_codes = dxfversion > 'AC1009'
+        self._encoders = {999: (SKIP, None)}  # cached encoders by group code
+        stream.write(BINARY_DXF_SENTINEL)
+
+    def write(self, s):
+        if isinstance(s, ustr):  # DXF text
+            s = self.strtags(string_tagger(s))
+        super(BinaryDXFWriter, self).write(s)
+
+    def flush(self):
+        if self._parts:
+            self._stream.write(b''.join(self._parts))
+            del self._parts[:]
+            self._size = 0
+
+    def _code_bytes(self, code):
+        if self._short_codes:
+            return SHORT.pack(code)
+        elif code < 255:
+            return BYTE.pack(code)
+        else:
+            return BYTE.pack(255) + SHORT.pack(code)
+
+    def _encoder(self, code):
+        """ Returns the encoder of group code *code* as (kind, data), see strtags(). """
+        if code in POINT_CODES:
+            axes = [self._code_bytes(code + axis * 10) for axis in range(3)]
+            formats = ['{}sd'.format(len(data)) for data in axes]
+            encoder = (POINT, (axes, struct.Struct('<' + ''.join(formats[:2])).pack,
+                               struct.Struct('<' + ''.join(formats)).pack))
+        else:
+            value_type = VALUE_TYPES.get(code, STRING)
+            data = self._code_bytes(code)
+            if value_type == STRING or value_type == BINARY:
+                encoder = (value_type, data)
+            else:  # pack group code and value at once
+                encoder = (NUMBER, partial(struct.Struct('<{}s{}'.format(len(data), VALUE_FORMATS[value_type])).pack,
+                                           data))
+        self._encoders[code] = encoder
+        return encoder
+
+    def strtags(self, tags):
+        """ Returns *tags* as binary DXF data. """
+        parts = []
+        append = parts.append
+        encoders = self._encoders
+        encoding = self._encoding
+        for code, value in tags:
+            if value.__class__ is CompressedString:  # CompressedTags() of any group code
+                append(self.strtags(string_tagger(value.decompress())))
+                continue
+            try:
+                kind, data = encoders[code]
+            except KeyError:
+                kind, data = self._encoder(code)
+            if kind == STRING:
+                append(data)
+                append(ustr(value).encode(encoding, 'dxfreplace'))
+                append(b'\x00')
+            elif kind == NUMBER:
+                try:
+                    append(data(value))
+                except struct.error:  # float value for an integer group code
+                    append(data(int(value)))
+            elif kind == POINT:
+                axes, pack2d, pack3d = data
+                if len(value) == 3:
+                    append(pack3d(axes[0], value[0], axes[1], value[1], axes[2], value[2]))
+                else:
+                    append(pack2d(axes[0], value[0], axes[1], value[1]))
+            elif kind == BINARY:
+                value = unhexlify(value)
+                append(data)
+                append(BYTE.pack(len(value)))
+                append(value)
+        return b''.join(parts)
@@ -0,0 +1,131 @@
+# Purpose: parse the ENTITIES section of a DXF file in chunks by a process pool
+# Created: 18.10.2026
+# License: MIT License
+"""
+The byte range of the ENTITIES section is split into chunks at entity starts ('0<LF>' group code lines), each chunk is
+tokenized and classified by a worker process. The resulting ClassifiedTags() are transferred back to the main process
+and passed in file order as DXFTag(PRELOADED_TAGS, ClassifiedTags()) into the tag stream, all other sections are parsed
+by the main process, while the workers are running.
+
+A '0' line is an entity start only if it is a group code line, the line number relative to the section start has to
+be even, this is checked by counting the line endings.
+
+Linked entities (POLYLINE + VERTEX, INSERT + ATTRIB) may be split across chunks, because the link structure is created
+by the main process in file order.
+"""
+from __future__ import unicode_literals
+
+import gc
+import io
+import mmap
+import re
+import multiprocessing
+
+from .const import PRELOADED_TAGS
+from .types import DXFTag
+from .tagger import bulk_stream_tagger, skip_comments
+from .lazytags import classified_tags_groups
+from .sectionfilter import SECTION_START, SECTION_END
+from ..options import options
+
+ENTITY_START = re.compile(br'\n[ \t]*0[ \t]*\r?\n')  # group code 0 line, or a value line '0'
+MIN_CHUNK_SIZE = 1024 * 1024  # smaller ENTITIES sections are not worth the process pool overhead
+CHUNKS_PER_WORKER = 4  # more chunks than workers, to merge the first chunks while the workers process the following
+
+
+def parallel_tagger(filename, workers, encoding='cp1252', errors='ignore'):
+    """ Yields DXFTag() from DXF file *filename* like bulk_stream_tagger(), but the entities of the ENTITIES section
+    are tokenized and classified by *workers* processes and yielded as DXFTag(PRELOADED_TAGS, ClassifiedTags()).
+
+    The cyclic garbage collector is disabled until the generator is exhausted, because unpickling the huge count of
+    small objects triggers many useless garbage collections.
+    """
+    with io.open(filename, mode='rb') as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start, end = entities_section_range(data)
+            chunks = chunk_boundaries(data, start, end, workers * CHUNKS_PER_WORKER)
+            if len(chunks) < 3:  # 1 chunk, parse by main process
+                start, end = len(data), len(data)
+            head, tail = data[:start], data[end:]
+        finally:
+            data.close()
+
+    if start == end:
+        for tag in bulk_stream_tagger(io.BytesIO(head + tail), encoding, errors):
+            yield tag
+        return
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    pool = multiprocessing.Pool(workers)
+    try:
+        tasks = [(filename, chunk_start, chunk_end, encoding, errors, vars(options))
+                 for chunk_start, chunk_end in zip(chunks, chunks[1:])]
+        results = pool.imap(_parse_chunk, tasks)  # starts processing
+        for tag in bulk_stream_tagger(io.BytesIO(head), encoding, errors):
+            yield tag
+        for entities in results:
+            for entity in entities:
+                yield DXFTag(PRELOADED_TAGS, entity)
+        for tag in bulk_stream_tagger(io.BytesIO(tail), encoding, errors):
+            yield tag
+    finally:
+        pool.close()
+        pool.join()
+        if gc_enabled:
+            gc.enable()
+
+
+def entities_section_range(data):
+    """ Returns the byte range (start, end) of the content of the ENTITIES section in the DXF *data*, *start* is the
+    first entity and *end* is the ENDSEC tag, returns (0, 0) if no ENTITIES section exist.
+    """
+    for match in SECTION_START.finditer(data):
+        if match.group(1).rstrip() == b'ENTITIES':
+            start = match.end()
+            end = SECTION_END.search(data, start)
+            if end is not None:
+                return start, end.start()
+    return 0, 0
+
+
+def chunk_boundaries(data, start, end, count):
+    """ Returns a list of entity start positions, which split the byte range *start* to *end* into max. *count* chunks,
+    the first value is *start* and the last value is *end*. *start* has to be a group code line.
+    """
+    count = min(count, (end - start) // MIN_CHUNK_SIZE)
+    boundaries = [start]
+    if count < 2:
+        boundaries.append(end)
+        return boundaries
+    chunk_size = (end - start) // count
+    position = start  # line endings are counted up to this position
+    line_count = 0
+    for index in range(1, count):
+        match = ENTITY_START.search(data, max(start + index * chunk_size, position), end)
+        while match is not None:
+            line_start = match.start() + 1
+            line_count += data[position:line_start].count(b'\n')
+            position = line_start
+            if line_count % 2 == 0:  # group code line
+                break
+            match = ENTITY_START.search(data, match.end() - 1, end)  # next line can also be a '0' line
+        if match is None:
+            break
+        boundaries.append(position)
+    boundaries.append(end)
+    return boundaries
+
+
+def _parse_chunk(task):
+    filename, start, end, encoding, errors, worker_options = task
+    vars(options).update(worker_options)
+    gc.disable()
+    try:
+        with io.open(filename, mode='rb') as fp:
+            fp.seek(start)
+            tags = bulk_stream_tagger(io.BytesIO(fp.read(end - start)), encoding, errors)
+            return list(classified_tags_groups(skip_comments(tags)))
+    finally:
+        gc.enable()
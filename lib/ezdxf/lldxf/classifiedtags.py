@@ -8,6 +8,8 @@ __author__ = "mozman <mozman@gmx.at>"
 from .tags import Tags, DXFStructureError, DXFTag, write_tags
 from ..tools.c23 import isstring
 from .tagger import string_tagger, skip_comments
+from .compacttags import CompactTags
+from ..options import options
 APP_DATA_MARKER = 102
 SUBCLASS_MARKER = 100
 XDATA_MARKER = 1001
@@ -17,7 +19,7 @@ NoneTag = DXFTag(None, None)
 
 class ClassifiedTags(object):
     """ Manage Subclasses, AppData and Extended Data """
-    __slots__ = ('subclasses', 'appdata', 'xdata', 'link')
+    __slots__ = ('subclasses', 'appdata', 'xdata', 'link', 'modified')
 
     def __init__(self, iterable=None):
         if isstring(iterable):
@@ -27,6 +29,7 @@ class ClassifiedTags(object):
         self.subclasses = list()  # code == 100, keys are "subclassname", values are Tags()
         self.xdata = list()  # code >= 1000, keys are "APPNAME", values are Tags()
         self.link = None  # link to following entities like INSERT -> ATTRIB and POLYLINE -> VERTEX
+        self.modified = False  # True if subclasses, appdata or xdata were added, removed or replaced
         if iterable is not None:
             self._setup(iterable)
 
@@ -43,6 +46,16 @@ class ClassifiedTags(object):
 
     clone = __copy__
 
+    def __getstate__(self):
+        return self.subclasses, self.appdata, self.xdata, self.link, self.is_modified()
+
+    def __setstate__(self, state):
+        # unpickling fills the Tags() by the overridden list methods, which marks them as modified
+        self.subclasses, self.appdata, self.xdata, self.link, self.modified = state
+        for tag_lists in (self.subclasses, self.appdata, self.xdata):
+            for tags in tag_lists:
+                tags.modified = False
+
     @property
     def noclass(self):
         return self.subclasses[0]
@@ -52,6 +65,7 @@ class ClassifiedTags(object):
 
     def _setup(self, iterable):
         tagstream = iter(iterable)
+        append = list.append  # does not mark the loaded Tags() as modified
 
         def isappdata(tag):
             return tag.code == APP_DATA_MARKER and tag.value.startswith('{')
@@ -66,13 +80,13 @@ class ClassifiedTags(object):
                     tag = next(tagstream)
                     if isappdata(tag):
                         app_data_pos = len(self.appdata)
-                        data.append(DXFTag(tag.code, app_data_pos))
+                        append(data, DXFTag(tag.code, app_data_pos))
                         collect_appdata(tag)
                     elif tag.code in (SUBCLASS_MARKER, XDATA_MARKER):
                         self.subclasses.append(data)
                         return tag
                     else:
-                        data.append(tag)
+                        append(data, tag)
             except StopIteration:
                 pass
             self.subclasses.append(data)
@@ -86,7 +100,7 @@ class ClassifiedTags(object):
                     tag = next(tagstream)
                 except StopIteration:
                     raise DXFStructureError("Missing closing DXFTag(102, '}') for appdata structure.")
-                data.append(tag)
+                append(data, tag)
                 if tag.code == APP_DATA_MARKER:
                     break
             self.appdata.append(data)
@@ -103,7 +117,7 @@ class ClassifiedTags(object):
                         self.xdata.append(data)
                         return tag
                     else:
-                        data.append(tag)
+                        append(data, tag)
             except StopIteration:
                 pass
             self.xdata.append(data)
@@ -118,6 +132,26 @@ class ClassifiedTags(object):
         if tag is not NoneTag:
             raise DXFStructureError("Unexpected tag '%r' at end of entity." % tag)
 
+        if options.compact_tags:
+            self.subclasses = [CompactTags(tags) for tags in self.subclasses]
+            self.appdata = [CompactTags(tags) for tags in self.appdata]
+            self.xdata = [CompactTags(tags) for tags in self.xdata]
+
+    def is_modified(self):
+        """ True if the tags were changed since loading or creation. """
+        if self.modified:
+            return True
+        for tags in self.subclasses:
+            if tags.modified:
+                return True
+        for tags in self.appdata:
+            if tags.modified:
+                return True
+        for tags in self.xdata:
+            if tags.modified:
+                return True
+        return False
+
     def __iter__(self):
         for subclass in self.subclasses:
             for tag in subclass:
@@ -173,6 +207,7 @@ class ClassifiedTags(object):
         if tags is not None:
             xtags.extend(DXFTag(t[0], t[1]) for t in tags)
         self.xdata.append(xtags)
+        self.modified = True
         return xtags
 
     def app_data_index(self, appid):
@@ -230,6 +265,7 @@ class ClassifiedTags(object):
         app_data_pos = len(self.appdata)
         subclass.append(DXFTag(APP_DATA_MARKER, app_data_pos))
         self.appdata.append(app_tags)
+        self.modified = True
         return app_tags
 
     def write(self, stream):
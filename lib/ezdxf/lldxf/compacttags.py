@@ -0,0 +1,316 @@
+# Purpose: memory compact tag storage
+# Created: 18.10.2026
+# License: MIT License
+"""
+CompactTags() is a memory compact replacement for Tags(), used by ClassifiedTags() if options.compact_tags is True.
+
+Group codes are stored in an array('h'), values in a list and the coordinates of points in an array('d'), the value
+of a point tag is the packed int (offset << 2 | dimension) of the point coordinates. DXFTag() objects are created on
+demand.
+
+Entities of the same DXF type have mostly the same sequence of group codes, therefore the arrays of group codes are
+shared by all CompactTags() with the same sequence of group codes and copied before the first modification. Frequently
+repeated strings like DXF types, subclass markers, layer names and owner handles are also stored as a single object.
+The shared objects are held by weak references, the interned strings by the interpreter, and released if no
+CompactTags() uses them anymore. Python 2 interns just byte strings, therefore unicode values are not shared.
+
+Objects which are not tags, like CompressedTags(), are stored unchanged with the group code OPAQUE_CODE.
+"""
+from __future__ import unicode_literals
+
+from array import array
+from weakref import WeakValueDictionary
+
+from .types import DXFTag, POINT_CODES
+from .tags import Tags, write_tags, count_modification
+from .tagger import string_tagger, skip_comments
+from ..tools.c23 import MutableSequence, PY3
+
+if PY3:
+    from sys import intern
+else:
+    from itertools import izip as zip
+
+ARRAY_CODES = 'h' if PY3 else b'h'
+ARRAY_FLOATS = 'd' if PY3 else b'd'
+OPAQUE_CODE = -32768  # value is not a tag, but an object like CompressedTags()
+SHARED_VALUE_CODES = frozenset([0, 2, 6, 7, 8, 100, 102, 330, 1001])  # group codes of frequently repeated values
+MAX_SHARED_CODES = 64  # share just arrays of group codes up to this length
+_shared_codes = WeakValueDictionary()
+
+
+def _share_codes(codes):
+    if len(codes) > MAX_SHARED_CODES:
+        return codes, False
+    key = codes.tobytes() if PY3 else codes.tostring()
+    return _shared_codes.setdefault(key, codes), True
+
+
+def _share_value(value):
+    if value.__class__ is str:
+        return intern(value)
+    return value
+
+
+class CompactTags(MutableSequence):
+    """ Implements the Tags() interface. """
+    __slots__ = ('codes', 'values', 'points', 'shared', 'modified')
+
+    def __init__(self, iterable=None):
+        self.codes = array(ARRAY_CODES)
+        self.values = []
+        self.points = None  # array('d') created by the first point tag
+        self.shared = False  # True if self.codes is shared with other CompactTags()
+        self.modified = False  # True after the first change, see Tags()
+        if iterable is not None:
+            self._store(iterable)
+
+    def _store(self, tags):
+        codes = array(ARRAY_CODES, self.codes)
+        values = self.values
+        encode = self._encode
+        for tag in tags:
+            code, value = encode(tag)
+            codes.append(code)
+            values.append(value)
+        self.codes, self.shared = _share_codes(codes)
+
+    def _modify(self):
+        self.modified = True
+        count_modification()
+
+    def _own_codes(self):
+        if self.shared:
+            self.codes = array(ARRAY_CODES, self.codes)
+            self.shared = False
+        return self.codes
+
+    def _encode(self, tag):
+        """ Returns stored (code, value) tuple. """
+        if not isinstance(tag, tuple):
+            return OPAQUE_CODE, tag
+        code, value = tag
+        if code in POINT_CODES:
+            if self.points is None:
+                self.points = array(ARRAY_FLOATS)
+            points = self.points
+            offset = len(points)
+            points.extend(float(coord) for coord in value)
+            return code, (offset << 2) | (len(points) - offset)
+        if code in SHARED_VALUE_CODES:
+            value = _share_value(value)
+        return code, value
+
+    def _decode(self, code, value):
+        if code in POINT_CODES:
+            offset = value >> 2
+            return DXFTag(code, tuple(self.points[offset: offset + (value & 3)]))
+        if code == OPAQUE_CODE:
+            return value
+        return DXFTag(code, value)
+
+    def _rebuild(self, tags):
+        self._modify()
+        self.codes = array(ARRAY_CODES)
+        self.values = []
+        self.points = None
+        self._store(tags)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Tags(self._decode(code, value) for code, value in zip(self.codes[index], self.values[index]))
+        return self._decode(self.codes[index], self.values[index])
+
+    def __setitem__(self, index, tag):
+        self._modify()
+        if isinstance(index, slice):
+            tags = list(self)
+            tags[index] = tag
+            self._rebuild(tags)
+        else:
+            code, value = self._encode(tag)
+            if self.codes[index] != code:
+                self._own_codes()[index] = code
+            self.values[index] = value
+
+    def __delitem__(self, index):
+        self._modify()
+        if isinstance(index, slice):
+            tags = list(self)
+            del tags[index]
+            self._rebuild(tags)
+        else:
+            del self._own_codes()[index]
+            del self.values[index]
+
+    def __iter__(self):
+        decode = self._decode
+        for code, value in zip(self.codes, self.values):
+            yield decode(code, value)
+
+    def __repr__(self):
+        return 'CompactTags({!r})'.format(list(self))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def insert(self, index, tag):
+        self._modify()
+        code, value = self._encode(tag)
+        self._own_codes().insert(index, code)
+        self.values.insert(index, value)
+
+    def append(self, tag):
+        self._modify()
+        code, value = self._encode(tag)
+        self._own_codes().append(code)
+        self.values.append(value)
+
+    def extend(self, tags):
+        self._modify()
+        encode = self._encode
+        codes = self._own_codes()
+        values = self.values
+        for tag in tags:
+            code, value = encode(tag)
+            codes.append(code)
+            values.append(value)
+
+    # Tags() interface
+
+    def write(self, stream):
+        write_tags(stream, self)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(skip_comments(string_tagger(text)))
+
+    def __copy__(self):
+        clone = self.__class__()
+        if self.shared:
+            clone.codes, clone.shared = self.codes, True
+        else:
+            clone.codes, clone.shared = _share_codes(array(ARRAY_CODES, self.codes))
+        clone.values = list(self.values)
+        clone.points = None if self.points is None else array(ARRAY_FLOATS, self.points)
+        return clone
+
+    clone = __copy__
+
+    def get_handle(self):
+        """Get DXF handle. Raises ValueError if handle not exists.
+
+        :returns: handle as hex-string like 'FF'
+        """
+        handle = ''
+        for code, value in zip(self.codes, self.values):
+            if code in (5, 105):
+                handle = value
+                break
+        int(handle, 16)  # check for valid handle
+        return handle
+
+    def replace_handle(self, new_handle):
+        """Replace existing handle.
+        """
+        for index, code in enumerate(self.codes):
+            if code in (5, 105):
+                self._modify()
+                self.values[index] = new_handle
+                return
+
+    def dxftype(self):
+        return self.values[0]
+
+    def has_tag(self, code):
+        return code in self.codes
+
+    def find_first(self, code, default=ValueError):
+        """Returns value of first DXFTag(code, value) or default if default != ValueError, else raises ValueError.
+        """
+        try:
+            index = self.codes.index(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
+        return self._decode(code, self.values[index]).value
+
+    def get_first_tag(self, code, default=ValueError):
+        """Returns first DXFTag(code, value) or default if default != ValueError, else raises ValueError.
+        """
+        try:
+            index = self.codes.index(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
+        return self._decode(code, self.values[index])
+
+    def find_all(self, code):
+        """Returns a list of DXFTag(code, value).
+        """
+        return [self._decode(code, value) for tag_code, value in zip(self.codes, self.values) if tag_code == code]
+
+    def tag_index(self, code, start=0, end=None):
+        """Return first index of DXFTag(code, value).
+        """
+        codes = self.codes
+        if end is None:
+            end = len(codes)
+        index = start
+        while index < end:
+            if codes[index] == code:
+                return index
+            index += 1
+        raise ValueError(code)
+
+    def update(self, code, value):
+        """Update first existing tag, raises ValueError if tag not exists.
+        """
+        index = self.tag_index(code)
+        self[index] = DXFTag(code, value)
+
+    def set_first(self, code, value):
+        """Update first existing DXFTag(code, value) or append a new
+        DXFTag(code, value).
+
+        """
+        try:
+            self.update(code, value)
+        except ValueError:
+            self.append(DXFTag(code, value))
+
+    def remove_tags(self, codes):
+        codes = frozenset(codes)
+        self._rebuild([tag for tag in self if tag[0] not in codes])
+
+    def collect_consecutive_tags(self, codes, start=0, end=None):
+        """Collect all consecutive tags with code in codes, start and end delimits the search range. A tag code not
+        in codes ends the process.
+
+        Returns the collected tags in a collection of type Tag().
+        """
+        codes = frozenset(codes)
+        collected_tags = Tags()
+        if end is None:
+            end = len(self)
+        index = start
+        while index < end:
+            tag = self[index]
+            if tag.code in codes:
+                collected_tags.append(tag)
+                index += 1
+            else:
+                break
+        return collected_tags
@@ -51,11 +51,17 @@ class DXFEncodingError(DXFError):
 class DXFDecodingError(DXFError):
     pass
 
+
+class DXFSectionNotLoadedError(DXFError):
+    pass
+
 # Special tag codes for internal purpose
 # -1 to -5 id reserved by AutoCAD for internal use, but this tags will never be saved to file.
 # Same approach here, the following tags have to be converted/transformed into normal tags before
 # saved to file.
 COMPRESSED_TAGS = -10
+LAZY_TAGS = -11  # value is a LazyTags() object, not decoded DXF entity
+PRELOADED_TAGS = -12  # value is a ClassifiedTags() object, already decoded DXF entity
 
 
 # Entity: Polyline, Polymesh
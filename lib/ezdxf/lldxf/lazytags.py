@@ -0,0 +1,154 @@
+# Purpose: lazy loaded DXF entities
+# Created: 18.10.2026
+# License: MIT License
+"""
+Lazy loading keeps the raw DXF bytes of an entity until the entity is accessed the first time by
+EntityDB.__getitem__(). Only a few tags required to manage the entity are decoded at loading time: the DXF type,
+the handle, the owner handle (330) and the paper space flag (67) of the 'noclass' subclass.
+
+Entities with a linked structure (INSERT, ATTRIB, POLYLINE, VERTEX, SEQEND), block definition entities (BLOCK, ENDBLK)
+and entities without a handle are always loaded at once.
+"""
+from __future__ import unicode_literals
+
+from .const import LAZY_TAGS, PRELOADED_TAGS
+from .types import DXFTag
+from .tags import Tags
+from .classifiedtags import ClassifiedTags
+from .tagger import binary_tag_pairs, bulk_tagger, skip_comments, BLOCK_SIZE
+
+LAZY_SECTIONS = frozenset([b'ENTITIES', b'BLOCKS'])
+EAGER_ENTITIES = frozenset([b'INSERT', b'ATTRIB', b'POLYLINE', b'VERTEX', b'SEQEND', b'BLOCK', b'ENDBLK'])
+PREFETCH_CODES = frozenset([5, 105, 330, 67])
+
+
+class LazyTags(object):
+    """ Raw DXF entity data, which will be decoded into a ClassifiedTags() object on first access.
+
+    Supports the read-only subset of the ClassifiedTags() interface, which is required to store an entity in the
+    entity database and in an entity space.
+    """
+    __slots__ = ('data', 'noclass', 'link', 'codec')
+
+    def __init__(self, data, noclass, codec):
+        self.data = data  # raw DXF bytes, lines separated by '\n'
+        self.noclass = noclass  # prefetched tags of the 'noclass' subclass as Tags()
+        self.link = None  # lazy loaded entities are never linked entities
+        self.codec = codec  # (encoding, errors)
+
+    def dxftype(self):
+        return self.noclass[0].value
+
+    def get_handle(self):
+        return self.noclass.get_handle()
+
+    def load(self):
+        """ Returns the decoded entity as ClassifiedTags(). """
+        encoding, errors = self.codec
+        lines = self.data.split(b'\n')
+        return ClassifiedTags(skip_comments(bulk_tagger(zip(lines[::2], lines[1::2]), encoding, errors)))
+
+
+def lazy_stream_tagger(stream, encoding='cp1252', errors='ignore', blocksize=BLOCK_SIZE, prefix=b'',
+                       sections=LAZY_SECTIONS):
+    """ Like bulk_stream_tagger(), but yields the entities of *sections* as DXFTag(LAZY_TAGS, LazyTags()).
+    """
+    tags = lazy_sections_filter(binary_tag_pairs(stream, blocksize, prefix), sections, (encoding, errors))
+    return bulk_tagger(tags, encoding, errors)
+
+
+def lazy_sections_filter(tags, sections, codec):
+    """ Passes raw (code, value) pairs through, but replaces entities of *sections* by (LAZY_TAGS, LazyTags()).
+    """
+    tags = iter(tags)
+    for code, value in tags:
+        yield code, value
+        if value.rstrip() == b'SECTION' and code.strip() == b'0':
+            try:
+                code, name = next(tags)
+            except StopIteration:
+                return
+            yield code, name
+            if name.rstrip() in sections:
+                for tag in _lazy_section(tags, codec):
+                    yield tag
+
+
+def _lazy_section(tags, codec):
+    lines = []  # raw lines of the actual entity
+    for code, value in tags:
+        if code.strip() == b'0':
+            if lines:
+                for tag in _lazy_entity(lines, codec):
+                    yield tag
+            if value.rstrip() == b'ENDSEC':
+                yield code, value
+                return
+            lines = [code, value]
+        else:
+            lines.extend((code, value))
+    if lines:
+        for tag in _lazy_entity(lines, codec):
+            yield tag
+
+
+def _lazy_entity(lines, codec):
+    def eager():
+        return zip(lines[::2], lines[1::2])
+
+    dxftype = lines[1].rstrip()
+    if dxftype in EAGER_ENTITIES:
+        return eager()
+
+    encoding, errors = codec
+    noclass = Tags([DXFTag(0, dxftype.decode(encoding, errors))])
+    has_handle = False
+    has_owner = False
+    index = 2
+    count = len(lines)
+    while index < count:
+        code = int(lines[index])
+        if code == 100:  # end of the 'noclass' subclass
+            break
+        if code == 102:  # skip app data
+            index += 2
+            while index < count and int(lines[index]) != 102:
+                index += 2
+        elif code in PREFETCH_CODES:
+            value = lines[index + 1].rstrip()
+            if code == 67:
+                noclass.append(DXFTag(code, int(value)))
+            elif code == 330:
+                if not has_owner:  # just the owner handle
+                    noclass.append(DXFTag(code, value.decode(encoding, errors)))
+                    has_owner = True
+            else:
+                noclass.append(DXFTag(code, value.decode(encoding, errors)))
+                has_handle = True
+        index += 2
+
+    if not has_handle:  # database handles of entities without handle would be lost
+        return eager()
+    return [(LAZY_TAGS, LazyTags(b'\n'.join(lines), noclass, codec))]
+
+
+def classified_tags_groups(tags):
+    """ Yields ClassifiedTags() for every entity in *tags* and the LazyTags() of lazy loaded entities, skips tags in
+    front of the first entity like TagGroups(). Already decoded entities (PRELOADED_TAGS) are passed through.
+    """
+    group = None
+    for tag in tags:
+        code = tag.code
+        if code == LAZY_TAGS or code == PRELOADED_TAGS:
+            if group is not None:
+                yield ClassifiedTags(group)
+                group = None
+            yield tag.value
+        elif code == 0:
+            if group is not None:
+                yield ClassifiedTags(group)
+            group = [tag]
+        elif group is not None:
+            group.append(tag)
+    if group is not None:
+        yield ClassifiedTags(group)
@@ -182,7 +182,11 @@ def enable_handles(dwg):
         return False
 
     def put_handles_into_entity_tags():
-        for handle, tags in dwg.entitydb.items():
+        entitydb = dwg.entitydb
+        for handle in list(entitydb.keys()):
+            if entitydb.is_lazy(handle):  # lazy loaded entities have always a handle
+                continue
+            tags = entitydb[handle]
             is_not_dimstyle = tags.noclass[0] != (0, 'DIMSTYLE')
             handle_code = 5 if is_not_dimstyle else 105  # legacy shit!!!
             if not has_handle(tags, handle_code):
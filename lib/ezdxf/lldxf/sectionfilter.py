@@ -0,0 +1,95 @@
+# Purpose: skip DXF sections at the byte level
+# Created: 18.10.2026
+# License: MIT License
+"""
+The SectionFilter() reads a binary DXF stream and passes just the requested sections through, all other sections are
+skipped without splitting them into lines or tags. Reading stops after the last requested section.
+
+Section structure tags like '0<LF>SECTION<LF>' or '0<LF>ENDSEC<LF>' are found reliable by regular expressions: a DXF
+value line is always followed by a group code line, which can never be 'SECTION' or 'ENDSEC', so the pattern
+'<group code 0><LF>SECTION' exists only at section starts.
+"""
+from __future__ import unicode_literals
+import re
+
+from .tagger import BLOCK_SIZE
+
+SECTION_START = re.compile(br'^[ \t]*0[ \t]*\r?\nSECTION[ \t]*\r?\n[ \t]*2[ \t]*\r?\n([^\r\n]*)\r?\n', re.MULTILINE)
+SECTION_END = re.compile(br'^[ \t]*0[ \t]*\r?\nENDSEC[ \t]*\r?\n', re.MULTILINE)
+EOF_TAG = b'  0\nEOF\n'
+OVERLAP = 512  # bytes kept from the end of a block, to find section structure tags split by a block boundary
+
+OUTSIDE, COPY, SKIP = range(3)
+
+
+class SectionFilter(object):
+    """ File like object, which reads just the DXF sections *sections* from the binary *stream*, *sections* is an
+    iterable of upper case section names as bytes e.g. b'HEADER'. *prefix* are bytes already read from *stream*.
+    """
+    def __init__(self, stream, sections, prefix=b'', blocksize=BLOCK_SIZE):
+        self._blocks = filter_sections(stream, sections, prefix, blocksize)
+
+    def read(self, size=-1):
+        # returns the next filtered block, which may be smaller or larger than *size*, returns b'' at the end
+        return next(self._blocks, b'')
+
+
+def filter_sections(stream, sections, prefix=b'', blocksize=BLOCK_SIZE):
+    """ Yields blocks of bytes, which contain just the sections *sections* of the binary DXF *stream*. """
+    missing = set(sections)
+    wanted = frozenset(missing)
+    buffer = prefix
+    pos = 0  # buffer[pos] is always the start of a line
+    state = OUTSIDE
+    output = []
+    while True:
+        if state == SKIP:
+            match = SECTION_END.search(buffer, pos)
+            if match:
+                pos = match.end()
+                state = OUTSIDE
+                continue
+        elif state == COPY:
+            match = SECTION_END.search(buffer, pos)
+            if match:
+                output.append(buffer[pos:match.end()])
+                pos = match.end()
+                state = OUTSIDE
+                if not missing:  # stop reading after the last requested section
+                    output.append(EOF_TAG)
+                    yield b''.join(output)
+                    return
+                continue
+        else:
+            match = SECTION_START.search(buffer, pos)
+            if match:
+                name = match.group(1).strip()
+                if name in wanted:
+                    output.append(buffer[pos:match.end()])
+                    missing.discard(name)
+                    state = COPY
+                else:
+                    output.append(buffer[pos:match.start()])
+                    state = SKIP
+                pos = match.end()
+                continue
+
+        # no section structure tag found in buffer[pos:], keep enough lines to find tags split by a block boundary
+        cut = buffer.rfind(b'\n', pos, len(buffer) - OVERLAP) + 1
+        cut = max(cut, pos)
+        if state != SKIP:
+            output.append(buffer[pos:cut])
+        block = stream.read(blocksize)
+        if not block:  # end of stream
+            if state != SKIP:
+                output.append(buffer[cut:])
+            data = b''.join(output)
+            if data:
+                yield data
+            return
+        data = b''.join(output)
+        if data:
+            yield data
+        output = []
+        buffer = buffer[cut:] + block
+        pos = 0
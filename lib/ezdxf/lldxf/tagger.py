@@ -5,10 +5,16 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
-from .types import DXFTag, is_point_code, cast_tag
+from itertools import chain
+
+from .types import DXFTag, cast_tag, point_tuple, TYPE_TABLE, CAST_TABLE, POINT_CODES, MAX_GROUP_CODE
 from .const import DXFStructureError
+from ..tools.c23 import ustr, PY3
+
+if not PY3:
+    from itertools import izip as zip
 
-DUMMY_TAG = DXFTag(999, '')
+BLOCK_SIZE = 1024 * 1024  # bytes read by one call of stream.read() in bulk_stream_tagger()
 
 
 def string_tagger(s):
@@ -21,30 +27,22 @@ def string_tagger(s):
     if s.endswith('\n'):  # split() creates an extra item, if s ends with '\n'
         lines.pop()
     pos = 0
-
-    def next_tag():
-        return DXFTag(int(lines[pos]), lines[pos+1])
-
     count = len(lines)
     while pos < count:
-        x = next_tag()
-        pos += 2
-        code = x.code
-        if is_point_code(code):
-            y = next_tag()  # y coordinate is mandatory - string_tagger relies on well formed DXF strings
-            pos += 2
-            if pos < count:
-                z = next_tag()  # z coordinate just for 3d points
-            else:  # if string s ends with a 2d point
-                z = DUMMY_TAG
-            if z.code == code + 20:
-                pos += 2
-                point = (float(x.value), float(y.value), float(z.value))
+        code = int(lines[pos])
+        if code in POINT_CODES:  # parse x, y and z coordinate in one step
+            # y coordinate is mandatory - string_tagger relies on well formed DXF strings
+            # z coordinate just for 3d points, string s can end with a 2d point
+            if pos + 4 < count and int(lines[pos + 4]) == code + 20:
+                point = (float(lines[pos + 1]), float(lines[pos + 3]), float(lines[pos + 5]))
+                pos += 6
             else:
-                point = (float(x.value), float(y.value))
+                point = (float(lines[pos + 1]), float(lines[pos + 3]))
+                pos += 4
             yield DXFTag(code, point)
         else:
-            yield cast_tag(x)
+            yield cast_tag((code, lines[pos + 1]))
+            pos += 2
 
 
 def skip_comments(tagger, comments=None):
@@ -72,40 +70,133 @@ def stream_tagger(stream):
         value = stream.readline()
         line.counter += 2
         if code and value:  # StringIO(): empty strings indicates EOF
-            return DXFTag(int(code[:-1]), value[:-1])  # without '\n'
+            return int(code[:-1]), value[:-1]  # without '\n'
         else:  # StringIO(): missing '\n' indicates EOF
             raise EOFError()
 
     while True:
         try:
             if undo_tag is not None:
-                x = undo_tag
+                code, value = undo_tag
                 undo_tag = None
             else:
-                x = next_tag()
-            code = x.code
-            if is_point_code(code):
-                y = next_tag()  # y coordinate is mandatory
-                if y.code != code + 10:
+                code, value = next_tag()
+            if code in POINT_CODES:  # parse x, y and z coordinate in one step
+                ycode, yvalue = next_tag()  # y coordinate is mandatory
+                if ycode != code + 10:
                     raise DXFStructureError("Missing required y coordinate near line: {}.".format(line.counter))
-                z = next_tag()  # z coordinate just for 3d points
+                zcode, zvalue = next_tag()  # z coordinate just for 3d points
                 try:
-                    if z.code == code + 20:
-                        point = (float(x.value), float(y.value), float(z.value))
+                    if zcode == code + 20:
+                        point = (float(value), float(yvalue), float(zvalue))
                     else:
-                        point = (float(x.value), float(y.value))
-                        undo_tag = z
+                        point = (float(value), float(yvalue))
+                        undo_tag = (zcode, zvalue)
                 except ValueError:
                     raise DXFStructureError('Invalid floating point values near line: {}.'.format(line.counter))
                 yield DXFTag(code, point)
             else:  # just a single tag
                 try:
-                    yield cast_tag(x)
+                    tag = cast_tag((code, value))
                 except ValueError:
                     raise DXFStructureError('Invalid tag (code={code}, value="{value}") near line: {line}.'.format(
                         line=line.counter,
-                        code=x.code,
-                        value=x.value,
+                        code=code,
+                        value=value,
                     ))
+                yield tag
         except EOFError:
             return
+
+
+def binary_line_blocks(stream, blocksize=BLOCK_SIZE, prefix=b''):
+    """ Reads binary *stream* in blocks of *blocksize* bytes and yields lists of lines (without '\n'). A line split
+    by a block boundary is joined with the next block. *prefix* are bytes already read from *stream*.
+    """
+    tail = prefix
+    while True:
+        block = stream.read(blocksize)
+        if not block:
+            break
+        lines = (tail + block).split(b'\n')
+        tail = lines.pop()
+        yield lines
+    if tail:
+        yield tail.split(b'\n')
+
+
+def bulk_stream_tagger(stream, encoding='cp1252', errors='ignore', blocksize=BLOCK_SIZE, prefix=b''):
+    """ Generates DXFTag() from a binary stream (untrusted external source), yields the same tags as stream_tagger().
+    Does not skip comment tags 999.
+
+    The *stream* is read in large blocks and just string values are decoded by *encoding*, int and float values are
+    converted directly from bytes. *prefix* are bytes already read from *stream*, e.g. by sniff_dxf_info().
+    """
+    return bulk_tagger(binary_tag_pairs(stream, blocksize, prefix), encoding, errors)
+
+
+def binary_tag_pairs(stream, blocksize=BLOCK_SIZE, prefix=b''):
+    """ Yields (code, value) pairs as bytes from a binary stream, lines can end with '\r'. """
+    lines = chain.from_iterable(binary_line_blocks(stream, blocksize, prefix))
+    return zip(lines, lines)
+
+
+def bulk_tagger(tags, encoding='cp1252', errors='ignore'):
+    """ Generates DXFTag() from (code, value) pairs as bytes, like delivered by binary_tag_pairs().
+
+    Internal tags with a negative int group code are passed through.
+    """
+    def decode(value):
+        return value.rstrip(b'\r').decode(encoding, errors)
+
+    casters = [decode if caster is ustr else caster for caster in CAST_TABLE]
+    tags = iter(tags)
+    point = None  # pending point as (code, x, y), waiting for an optional z coordinate
+    for code, value in tags:
+        try:
+            code = int(code)
+        except ValueError:
+            raise DXFStructureError('Invalid group code "{}".'.format(code.decode(encoding, errors)))
+        if point is not None:
+            pcode, x, y = point
+            point = None
+            if code == pcode + 20:  # z coordinate just for 3d points
+                try:
+                    z = float(value)
+                except ValueError:
+                    raise DXFStructureError('Invalid floating point values for group code {}.'.format(pcode))
+                yield DXFTag(pcode, (x, y, z))
+                continue
+            yield DXFTag(pcode, (x, y))
+
+        if 0 <= code <= MAX_GROUP_CODE:
+            caster = casters[code]
+        else:  # internal tags
+            caster = TYPE_TABLE.get(code, decode)
+        if caster is point_tuple:
+            try:
+                ycode, yvalue = next(tags)  # y coordinate is mandatory
+            except StopIteration:
+                return
+            try:
+                if int(ycode) != code + 10:
+                    raise DXFStructureError("Missing required y coordinate for group code {}.".format(code))
+                point = (code, float(value), float(yvalue))
+            except ValueError:
+                raise DXFStructureError('Invalid floating point values for group code {}.'.format(code))
+            continue
+        try:
+            value = caster(value)
+        except ValueError:
+            try:
+                if caster is not int:
+                    raise
+                value = int(float(value))  # convert float to int
+            except ValueError:
+                raise DXFStructureError('Invalid tag (code={code}, value="{value}").'.format(
+                    code=code,
+                    value=decode(value),
+                ))
+        yield DXFTag(code, value)
+    if point is not None:  # stream ends with a 2d point
+        yield DXFTag(point[0], point[1:])
@@ -6,15 +6,37 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from .const import acad_release, DXFStructureError
-from .types import NONE_TAG, strtag2, DXFTag, is_point_code, cast_tag
+from .types import NONE_TAG, strtag2, strtags, DXFTag, is_point_code, cast_tag
 from ..tools.codepage import toencoding
 from ..tools.compressedstring import CompressedString
 from .tagger import string_tagger, skip_comments, stream_tagger
+from ..options import options
 
 COMMENT_CODE = 999
+MAX_GROUP_CODE_LINE = 32  # max. length of a group code line including padding and line ending
+_modification_count = 0  # count of changes of all Tags() and CompactTags(), see modification_count()
+
+
+def modification_count():
+    """ Returns the count of changes of all Tags() and CompactTags() of this process, used by EntitySpaceIndex() to
+    detect changes of the tags, which bypass the entity wrappers.
+    """
+    return _modification_count
+
+
+def count_modification():
+    global _modification_count
+    _modification_count += 1
 
 
 def write_tags(stream, tags):
+    render = getattr(stream, 'strtags', None)
+    if render is not None:  # stream with its own tag formatting like FixedPrecisionWriter()
+        stream.write(render(tags))
+        return
+    if options.bulk_tag_writer:  # render all tags into one string
+        stream.write(strtags(tags))
+        return
     for tag in tags:
         if isinstance(tag, CompressedTags):
             tag.write(stream)
@@ -60,8 +82,110 @@ def dxf_info(stream):
     return info
 
 
+def sniff_dxf_info(data, eof=False):
+    """ Detect DXF version and encoding from *data*, the leading bytes of a DXF file.
+
+    Returns DXFInfo() or None, if *data* ends before $ACADVER and $DWGCODEPAGE of the HEADER section were found and
+    *eof* is False. Raises ValueError if *data* does not start with a DXF SECTION.
+    """
+    info = DXFInfo()
+    lines = data.split(b'\n')
+    if not eof:
+        lines.pop()  # last line could be incomplete
+    found = 0
+    is_first_tag = True
+    index = 0
+    count = len(lines) - 1
+    while index < count:
+        code = int(lines[index])  # raises ValueError for none DXF files
+        value = lines[index + 1].rstrip(b'\r').decode('cp1252', 'ignore')
+        index += 2
+        if code == COMMENT_CODE:
+            continue
+        if is_first_tag:
+            if (code, value) != (0, 'SECTION'):
+                raise ValueError('Not a DXF file.')
+            is_first_tag = False
+        elif code == 0:  # end of HEADER section or no HEADER section at all
+            return info
+        elif code == 9 and value in ('$ACADVER', '$DWGCODEPAGE', '$HANDSEED') and index < count:
+            getattr(info, value[1:])(lines[index + 1].rstrip(b'\r').decode('cp1252', 'ignore'))
+            index += 2
+            if value != '$HANDSEED':
+                found += 1
+                if found == 2:
+                    return info
+    if is_first_tag and eof:
+        raise ValueError('Not a DXF file.')
+    return info if eof else None
+
+
+def read_dxf_info(stream, size=16 * 1024, blocksize=1024 * 1024, prefix=b''):
+    """ Detect DXF version and encoding from the leading bytes of the binary *stream*, reads *size* bytes and more
+    blocks of *blocksize* bytes for very big HEADER sections, *prefix* are the bytes already read from *stream*.
+
+    Returns (DXFInfo(), bytes read from stream including *prefix*). Raises ValueError if *stream* does not start with a
+    DXF SECTION.
+    """
+    data = prefix + stream.read(max(size - len(prefix), 0))
+    if len(data) > MAX_GROUP_CODE_LINE and b'\n' not in data[:MAX_GROUP_CODE_LINE]:
+        raise ValueError('Not a DXF file.')  # do not read the whole file to find the end of the first line
+    info = sniff_dxf_info(data)
+    while info is None:
+        block = stream.read(blocksize)
+        data += block
+        info = sniff_dxf_info(data, eof=not block)
+    return info, data
+
+
+def dxf_encoding(info, encoding='auto'):
+    """ Returns the encoding of a DXF file described by DXFInfo() *info*, *encoding* overrides the detected encoding.
+    """
+    if encoding != 'auto':  # override encoding detection and $DWGCODEPAGE
+        return encoding
+    elif info.version >= 'AC1021':  # R2007 files and later are always encoded as UTF-8
+        return 'utf-8'
+    else:
+        return info.encoding
+
+
 class Tags(list):
-    """ DXFTag() chunk as flat list. """
+    """ DXFTag() chunk as flat list.
+
+    All list methods which change the content set the attribute *modified* to True, used by the incremental save to
+    detect changed entities, and increase the modification_count(). Loaders have to use the list methods of the base
+    class, e.g. list.append(tags, tag).
+    """
+    modified = False  # class attribute, instance attribute is set by the first change
+
+    def _modifier(method):
+        def modifier(self, *args):
+            global _modification_count
+            _modification_count += 1
+            self.modified = True
+            return method(self, *args)
+        modifier.__name__ = method.__name__
+        return modifier
+
+    append = _modifier(list.append)
+    extend = _modifier(list.extend)
+    insert = _modifier(list.insert)
+    remove = _modifier(list.remove)
+    pop = _modifier(list.pop)
+    reverse = _modifier(list.reverse)
+    __setitem__ = _modifier(list.__setitem__)
+    __delitem__ = _modifier(list.__delitem__)
+    __iadd__ = _modifier(list.__iadd__)
+    if hasattr(list, '__setslice__'):  # Python 2
+        __setslice__ = _modifier(list.__setslice__)
+        __delslice__ = _modifier(list.__delslice__)
+    del _modifier
+
+    def sort(self, *args, **kwargs):
+        count_modification()
+        self.modified = True
+        list.sort(self, *args, **kwargs)
+
     def write(self, stream):
         write_tags(stream, self)
 
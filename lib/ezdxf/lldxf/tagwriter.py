@@ -0,0 +1,56 @@
+# Purpose: buffered text stream writer
+# Created: 18.10.2026
+# License: MIT License
+from __future__ import unicode_literals
+
+from .types import float_tag_formats, strtags, strip_fixed_floats, cast_float_values
+
+WRITE_BLOCK_SIZE = 1024 * 1024  # characters collected before writing to the wrapped stream
+
+
+class BufferedTextWriter(object):
+    """ Collects the strings written to this object and writes them as large blocks to the wrapped text *stream*, call
+    flush() to write the remaining strings.
+    """
+    def __init__(self, stream, blocksize=WRITE_BLOCK_SIZE):
+        self._stream = stream
+        self._parts = []  # reused buffer
+        self._size = 0
+        self.blocksize = blocksize
+
+    def write(self, s):
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self.blocksize:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            self._stream.write(''.join(self._parts))
+            del self._parts[:]
+            self._size = 0
+
+
+class FixedPrecisionWriter(BufferedTextWriter):
+    """ Buffered text writer, which formats the float values of the written DXF tags by a fixed count of decimal
+    places, trailing zeros are removed. *precision* is the count of decimal places for all float values or a dict of
+    group code class -> count of decimal places, see float_tag_formats().
+
+    write_tags() renders the tags by the strtags() method of the stream, if available. The trailing zeros are removed
+    from the whole block on flushing, which is faster than formatting each float value by a Python function.
+    """
+    def __init__(self, stream, precision, blocksize=WRITE_BLOCK_SIZE):
+        super(FixedPrecisionWriter, self).__init__(stream, blocksize)
+        self._tag_formats, self._point_formats = float_tag_formats(precision)
+
+    def strtags(self, tags):
+        try:
+            return strtags(tags, self._tag_formats, self._point_formats)
+        except TypeError:  # float group code with a string value
+            return strtags(cast_float_values(tags), self._tag_formats, self._point_formats)
+
+    def flush(self):
+        if self._parts:
+            self._stream.write(strip_fixed_floats(''.join(self._parts)))
+            del self._parts[:]
+            self._size = 0
@@ -6,9 +6,11 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import re
 from collections import namedtuple
 
 from ..tools.c23 import ustr
+from ..tools.compressedstring import CompressedString
 
 DXFTag = namedtuple('DXFTag', 'code value')
 NONE_TAG = DXFTag(None, None)
@@ -32,7 +34,7 @@ def internal_type(value):
 
 
 TYPE_TABLE = _build_type_table([
-    (internal_type, (-10, )),  # spacial tags for internal use
+    (internal_type, (-10, -11)),  # spacial tags for internal use
     (ustr, range(0, 10)),
     (point_tuple, range(10, 20)),  # 2d or 3d points
     (float, range(20, 60)),  # code 20-39 belongs to 2d/3d points and should not appear alone
@@ -64,27 +66,93 @@ TYPE_TABLE = _build_type_table([
 ])
 
 
+MAX_GROUP_CODE = 1071
+# code indexed dispatch table for the group codes 0 .. MAX_GROUP_CODE, undefined group codes are strings
+CAST_TABLE = tuple(TYPE_TABLE.get(code, ustr) for code in range(MAX_GROUP_CODE + 1))
+POINT_CODES = frozenset(code for code, caster in TYPE_TABLE.items() if caster is point_tuple)
+
+
+# cached DXF string formats for the group codes 0 .. MAX_GROUP_CODE, the format of a point tag formats all coordinates
+# by one string operation: POINT_FORMATS[code][dimension] % coordinates
+TAG_FORMATS = dict((code, '%3d\n%%s\n' % code) for code in range(MAX_GROUP_CODE + 1))
+POINT_FORMATS = dict((code, tuple(''.join(TAG_FORMATS[code + axis * 10] for axis in range(dim)) for dim in range(4)))
+                     for code in POINT_CODES)
+
+
+# float group codes by group code class for the fixed float precision, see float_tag_formats()
+FLOAT_CODE_CLASSES = {
+    # point coordinates: 10-18, 20-28, 30-38, 110-112, 120-122, 130-132, 210, 220, 230 and 1010-1013, 1020-1023, ...
+    'coordinates': frozenset(code + axis * 10 for code in POINT_CODES for axis in range(3)),
+    # angles in degrees
+    'angles': frozenset(range(50, 59)),
+    # scale factors, heights, widths and other float values
+    'scales': frozenset(list(range(40, 49)) + list(range(140, 150)) + [1040, 1041, 1042]),
+}
+FIXED_FLOAT_END = '\x00'  # marks the end of fixed precision floats, see strip_fixed_floats()
+FIXED_FLOAT_TRAILING_ZEROS = re.compile('0+\x00')
+
+
+def float_tag_formats(precision):
+    """ Returns the group code formats and the point formats like TAG_FORMATS and POINT_FORMATS, but formats the float
+    values by a fixed count of decimal places followed by FIXED_FLOAT_END, see strip_fixed_floats().
+
+    *precision* is the count of decimal places for all float group code classes, or a dict of group code class ->
+    count of decimal places, the float values of missing classes or of classes with a precision of None are written
+    with full precision, see FLOAT_CODE_CLASSES.
+    """
+    if not isinstance(precision, dict):
+        precision = dict.fromkeys(FLOAT_CODE_CLASSES, precision)
+    unknown = set(precision) - set(FLOAT_CODE_CLASSES)
+    if unknown:
+        raise ValueError('Unknown group code class: {}'.format(', '.join(sorted(unknown))))
+    tag_formats = dict(TAG_FORMATS)
+    for name, places in precision.items():
+        if places is None:
+            continue
+        places = int(places)
+        if places < 0:
+            raise ValueError('Invalid precision: {}'.format(places))
+        # 1.500000 -> 1.5 and 1.000000 -> 1.0 by strip_fixed_floats(), precision 0: 1 -> 1.0
+        float_format = '%.{}f'.format(places) if places else '%.0f.0'
+        for code in FLOAT_CODE_CLASSES[name]:
+            tag_formats[code] = '%3d\n%s%s\n' % (code, float_format, FIXED_FLOAT_END)
+    point_formats = dict((code, tuple(''.join(tag_formats[code + axis * 10] for axis in range(dim))
+                                      for dim in range(4)))
+                         for code in POINT_CODES)
+    return tag_formats, point_formats
+
+
 def is_point_code(code):
-    return (10 <= code <= 19) or code == 210 or (110 <= code <= 112) or (1010 <= code <= 1019)
+    return code in POINT_CODES
 
 
 def is_point_tag(tag):
-    return is_point_code(tag[0])
+    return tag[0] in POINT_CODES
+
+
+def get_caster(code, types=TYPE_TABLE):
+    if 0 <= code <= MAX_GROUP_CODE and types is TYPE_TABLE:
+        return CAST_TABLE[code]
+    return types.get(code, ustr)
 
 
 def cast_tag(tag, types=TYPE_TABLE):
-    caster = types.get(tag[0], ustr)
+    code, value = tag
+    if 0 <= code <= MAX_GROUP_CODE and types is TYPE_TABLE:
+        caster = CAST_TABLE[code]
+    else:
+        caster = types.get(code, ustr)
     try:
-        return DXFTag(tag[0], caster(tag[1]))
+        return DXFTag(code, caster(value))
     except ValueError:
         if caster is int:  # convert float to int
-            return DXFTag(tag[0], int(float(tag[1])))
+            return DXFTag(code, int(float(value)))
         else:
             raise
 
 
 def cast_tag_value(code, value, types=TYPE_TABLE):
-    return types.get(code, ustr)(value)
+    return get_caster(code, types)(value)
 
 
 def tag_type(code):
@@ -110,6 +178,45 @@ def strtag2(tag):
         return strtag(tag)
 
 
+def strtags(tags, tag_formats=TAG_FORMATS, point_formats=POINT_FORMATS):
+    """ Returns the DXF string of all *tags* like strtag2(), but with cached group code formats. """
+    parts = []
+    append = parts.append
+    for code, value in tags:
+        if code in point_formats:
+            append(point_formats[code][len(value)] % tuple(value))
+        elif value.__class__ is CompressedString:  # CompressedTags() of any group code
+            append(value.decompress())
+        else:
+            try:
+                append(tag_formats[code] % (value, ))
+            except KeyError:  # internal or invalid group code
+                append(TAG_STRING_FORMAT % (code, value))
+    return ''.join(parts)
+
+
+def strip_fixed_floats(s):
+    """ Removes the trailing zeros and the end markers of the fixed precision floats of float_tag_formats() from the
+    DXF string *s*, e.g. '1.500000' -> '1.5' and '1.000000' -> '1.0'.
+    """
+    s = FIXED_FLOAT_TRAILING_ZEROS.sub(FIXED_FLOAT_END, s)
+    return s.replace('.' + FIXED_FLOAT_END, '.0').replace(FIXED_FLOAT_END, '')
+
+
+def cast_float_values(tags):
+    """ Yields *tags*, but casts the values of float group codes to float, e.g. string values set by the user. """
+    for tag in tags:
+        code, value = tag
+        if value.__class__ is CompressedString:  # CompressedTags() unchanged
+            yield tag
+            continue
+        if code in POINT_CODES:
+            value = tuple(float(f) for f in value)
+        elif TYPE_TABLE.get(code) is float:
+            value = float(value)
+        yield DXFTag(code, value)
+
+
 def convert_tags_to_text_lines(line_tags):
     """ *line_tags* are tags with code 1 or 3, tag with code 3 is the tail of previous line with more than 255 chars.
 
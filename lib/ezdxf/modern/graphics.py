@@ -575,6 +575,7 @@ class Vertex(legacy.Vertex, ModernGraphicEntityExtension):
         elif self.is_face_record:  # (flags & Vertex.FACE_FLAGS) == const.VTX_3D_POLYFACE_MESH_VERTEX:
             set_subclass('AcDbFaceRecord')
             self.tags.subclasses[2] = EMPTY_VERTEX_SUBCLASS  # clear subclass AcDbVertex
+            self.tags.modified = True
         elif self.is_poly_face_mesh_vertex:  # flags & Vertex.FACE_FLAGS == Vertex.FACE_FLAGS:
             set_subclass('AcDbPolyFaceMeshVertex')
         elif self.is_polygon_mesh_vertex:  # flags & const.VTX_3D_POLYGON_MESH_VERTEX:
@@ -588,6 +589,7 @@ class Vertex(legacy.Vertex, ModernGraphicEntityExtension):
         """
         if tags.subclasses[2][0].value != 'AcDbVertex':
             tags.subclasses.insert(2, EMPTY_VERTEX_SUBCLASS)
+            tags.modified = True
 
 
 class SeqEnd(legacy.SeqEnd):
@@ -124,6 +124,7 @@ class Hatch(ModernGraphicEntity):
                 DXFTag(1001, 'HATCHBACKGROUNDCOLOR'),
                 DXFTag(1071, color_value),
             ]))
+            self.tags.modified = True
         else:
             xdata_bgcolor.set_first(1071, color_value)
 
@@ -135,6 +136,7 @@ class Hatch(ModernGraphicEntity):
             return
         else:
             self.tags.xdata.remove(xdata_bgcolor)
+            self.tags.modified = True
 
     @contextmanager
     def edit_boundary(self):
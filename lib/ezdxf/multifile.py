@@ -0,0 +1,63 @@
+# Purpose: read multiple DXF files in parallel by a process pool
+# Created: 18.10.2026
+# License: MIT License
+"""
+The DXF files are parsed by worker processes, the loaded drawings are transferred as pickled Drawing() objects to the
+parent process. Unpickling a drawing is faster than parsing the DXF file, but not for free, the parent process
+rebuilds the drawings one after another. Lazy loaded drawings (lazy=True) have the smallest transfer costs, because the
+entities are transferred as raw DXF data.
+
+Errors are captured per file and returned as part of the result, an invalid DXF file does not abort the batch.
+"""
+from __future__ import unicode_literals
+
+import multiprocessing
+import pickle
+from collections import namedtuple
+
+from .options import options
+
+ReadResult = namedtuple('ReadResult', 'filename drawing error')
+
+
+def readfiles(filenames, workers=None, encoding='auto', lazy=False, sections=None):
+    """ Read the DXF files *filenames* by a pool of *workers* processes, *workers* is the CPU count if None.
+
+    Returns a list of ReadResult(filename, drawing, error) in the order of *filenames*, *drawing* is None if an error
+    occurred and *error* is the raised exception, else *error* is None. Arguments *encoding*, *lazy* and *sections*
+    are passed to ezdxf.readfile(), the actual ezdxf.options are used by the worker processes.
+
+    For *workers* = 1 the files are read by the calling process without a process pool.
+    """
+    tasks = [(filename, encoding, lazy, sections, vars(options)) for filename in filenames]
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(tasks))
+    if workers < 2:
+        return [_read_task(task) for task in tasks]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        return pool.map(_read_task, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _read_task(task):
+    filename, encoding, lazy, sections, worker_options = task
+    from . import readfile
+    vars(options).update(worker_options)
+    try:
+        drawing = readfile(filename, encoding=encoding, lazy=lazy, sections=sections)
+    except Exception as e:
+        return ReadResult(filename, None, _picklable_error(e))
+    return ReadResult(filename, drawing, None)
+
+
+def _picklable_error(error):
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:  # exceptions with complex __init__() signatures or unpicklable attributes
+        return Exception('{}: {}'.format(error.__class__.__name__, error))
+    return error
@@ -8,7 +8,7 @@ __author__ = "mozman <mozman@gmx.at>"
 
 class Options(object):
     def __init__(self):
-        self.template_dir = None
+        self._template_dir = None
 
         # compress tags of unknown chunks of tags like unknown sections
         self.compress_default_chunks = False
@@ -19,5 +19,32 @@ class Options(object):
         # preserves comments at the top of the DXF file and adds ezdxf comments on saving
         self.store_comments = True
 
+        # ezdxf.readfile() reads DXF files in binary mode by large blocks, set False to use the line based stream_tagger()
+        self.bulk_tag_reader = True
+
+        # store the tags of DXF entities memory compact as CompactTags(), saves memory but slows down tag access
+        self.compact_tags = False
+
+        # Drawing.write() renders whole entities into one string and writes large blocks, set False to write tag by tag
+        self.bulk_tag_writer = True
+
+        # max. count of compiled query strings in the LRU cache of ezdxf.query.compile(), 0 disables the cache
+        self.query_cache_size = 256
+
+        # layout.query() uses the secondary indexes of the entity spaces for equality terms on the DXF type and the DXF
+        # attributes layer, color and linetype, set False to evaluate the query for all entities
+        self.query_indexes = True
+
+    @property
+    def template_dir(self):
+        return self._template_dir
+
+    @template_dir.setter
+    def template_dir(self, template_dir):
+        from .templates import clear_prototypes
+        self._template_dir = template_dir
+        clear_prototypes()  # cached templates of the previous template dir are invalid
+
+
 # Global Options
 options = Options()
@@ -5,10 +5,13 @@
 
 import re
 import operator
+from collections import OrderedDict, namedtuple
 
 from .tools.c23 import isstring, Sequence
 from .queryparser import EntityQueryParser
 from .groupby import groupby
+from .options import options
+from .dxfentity import INDEXED_DXF_ATTRIBS, dxf_attrib_getter
 
 
 class EntityQuery(Sequence):
@@ -71,12 +74,12 @@ class EntityQuery(Sequence):
 
         Args:
             entities: sequence of wrapped DXF entities (at least GraphicEntity class)
-            query: query string, see class documentation
+            query: query string, see class documentation, or a CompiledQuery() object created by compile()
         """
         if query == '*':
             self.entities = list(entities)
         else:
-            match = entity_matcher(query)
+            match = query if isinstance(query, CompiledQuery) else entity_matcher(query)
             self.entities = [entity for entity in entities if match(entity)]
 
     def __len__(self):
@@ -126,14 +129,166 @@ class EntityQuery(Sequence):
 
 
 def entity_matcher(query):
-    query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+    """
+    Returns a function, which returns True if an entity matches the *query* string, uses the compile() cache.
+    """
+    return compile(query)
+
+
+class CompiledQuery(object):
+    """
+    Reusable matcher of a query string, created by compile(). Calling the object with a DXF entity returns True if the
+    entity matches the query. Can be passed to EntityQuery() and layout.query() instead of the query string.
+    """
+    __slots__ = ('query', 'index_terms', '_match', '_names', '_expr')
+
+    def __init__(self, query):
+        self.query = query
+        query_args = EntityQueryParser.parseString(query, parseAll=True)
+        names = query_args.EntityQuery
+        self._names = None if names[0] == '*' else frozenset(names)
+        self._expr = expr = build_bool_expression(query_args.AttribQuery, query_args.AttribQueryOptions)
+        entity_matcher_ = build_entity_name_matcher(names)
+        # terms, which have to match, usable for the secondary indexes, see EntitySpaceIndex.candidates()
+        self.index_terms = [] if self._names is None else [('dxftype', self._names.__contains__)]
+        if expr is not None:
+            self.index_terms.extend(expr.index_terms())
+
+        def matcher(entity):
+            return entity_matcher_(entity) and (expr is None or expr.evaluate(entity))
+
+        self._match = matcher
+
+    def __call__(self, entity):
+        return self._match(entity)
+
+    def __repr__(self):
+        return 'CompiledQuery({!r})'.format(self.query)
+
+    def tags_matcher(self, dxffactory):
+        """
+        Returns a function, which returns True if the ClassifiedTags() of a DXF entity match the query. The query is
+        compiled for each DXF type at the first use into a predicate, which tests the group codes of the DXF attributes
+        defined by the wrapper class of *dxffactory*, without wrapping the entity.
+        """
+        predicates = {}  # tag predicates by DXF type
+
+        def match_tags(tags):
+            dxftype = tags.noclass[0].value
+            try:
+                predicate = predicates[dxftype]
+            except KeyError:
+                predicate = self._tags_predicate(dxftype, dxffactory)
+                predicates[dxftype] = predicate
+            return predicate(tags)
+
+        return match_tags
+
+    def _tags_predicate(self, dxftype, dxffactory):
+        if self._names is not None and dxftype not in self._names:
+            return _false
+        if self._expr is None:
+            return _true
+        wrapper = dxffactory.ENTITY_WRAPPERS.get(dxftype, dxffactory.DEFAULT_WRAPPER)
+        if hasattr(wrapper, 'cast'):  # the DXF attributes are defined by the casted wrapper class
+            match = self._match
+            wrap_entity = dxffactory.wrap_entity
+            return lambda tags: match(wrap_entity(tags))
+        return self._expr.tags_predicate(wrapper.DXFATTRIBS, dxffactory.dxfversion)
+
+    def select(self, handles, dxffactory):
+        """
+        Yields the DXF entities of *handles*, which match the query. Tests the ClassifiedTags() of the entity database
+        and wraps just the matching entities.
+        """
+        match_tags = self.tags_matcher(dxffactory)
+        entitydb = dxffactory.entitydb
+        wrap_entity = dxffactory.wrap_entity
+        for handle in handles:
+            tags = entitydb[handle]
+            if match_tags(tags):
+                yield wrap_entity(tags)
+
+
+QueryCacheInfo = namedtuple('QueryCacheInfo', 'hits misses maxsize currsize')
+
+
+class QueryCache(object):
+    """
+    LRU cache of CompiledQuery() objects by query string, the max. size is options.query_cache_size.
+    """
+    def __init__(self):
+        self._queries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query):
+        queries = self._queries
+        try:
+            compiled_query = queries.pop(query)
+        except KeyError:
+            self.misses += 1
+            compiled_query = CompiledQuery(query)
+            maxsize = options.query_cache_size
+            if maxsize <= 0:
+                return compiled_query
+            while len(queries) >= maxsize:
+                queries.popitem(last=False)  # remove least recently used query
+        else:
+            self.hits += 1
+        queries[query] = compiled_query  # most recently used query is the last item
+        return compiled_query
+
+    def info(self):
+        return QueryCacheInfo(self.hits, self.misses, options.query_cache_size, len(self._queries))
+
+    def clear(self):
+        self._queries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_query_cache = QueryCache()
+
 
-    def matcher(entity):
-        return entity_matcher_(entity) and attrib_matcher(entity)
+def compile(query):
+    """
+    Returns the query string *query* as reusable CompiledQuery() object, see EntityQuery() for the query string
+    syntax. The compiled queries are cached by query string in a LRU cache, see cache_info().
+    """
+    return _query_cache.get(query)
+
+
+def cache_info():
+    """
+    Returns the statistics of the compiled query cache as QueryCacheInfo(hits, misses, maxsize, currsize).
+    """
+    return _query_cache.info()
 
-    return matcher
+
+def clear_cache():
+    """
+    Removes all compiled queries from the cache and resets the statistics.
+    """
+    _query_cache.clear()
+
+
+def handle_query(handles, dxffactory, query='*'):
+    """
+    Returns an EntityQuery() of the DXF entities *handles* matching *query*, the query is evaluated on the
+    ClassifiedTags() of the entity database of *dxffactory*, only matching entities are wrapped. If *handles* is an
+    EntitySpace() and the query has equality terms on the DXF type or indexed DXF attributes, just the candidates of the
+    secondary index are evaluated, if the index is not outdated by changes of the tags, see EntitySpaceIndex().
+    """
+    if query == '*':
+        return EntityQuery((dxffactory.wrap_handle(handle) for handle in handles), query)
+    if not isinstance(query, CompiledQuery):
+        query = compile(query)
+    if query.index_terms and options.query_indexes and hasattr(handles, 'get_index'):
+        candidates = handles.get_index(dxffactory).candidates(query.index_terms)
+        if candidates is not None:
+            handles = [handle for handle in handles if handle in candidates] if candidates else []
+    return EntityQuery(query.select(handles, dxffactory))
 
 
 def build_entity_name_matcher(names):
@@ -169,6 +324,38 @@ class Relation:
         else:
             self.value = self.convert_case(value)
 
+    def index_terms(self):
+        """
+        Returns the relation as index term, see EntitySpaceIndex.candidates(), if the relation is an equality term on
+        an indexed DXF attribute.
+        """
+        if self.compare is operator.eq and self.dxf_attrib in INDEXED_DXF_ATTRIBS:
+            return [(self.dxf_attrib, self.match_value)]
+        return []
+
+    def match_value(self, value):
+        return self.compare(self.convert_case(value), self.value)
+
+    def tags_predicate(self, dxfattribs, dxfversion):
+        """
+        Returns a function, which evaluates the relation on the ClassifiedTags() of an entity with the DXF attribute
+        definitions *dxfattribs*, same results as evaluate() for the wrapped entity of a drawing with *dxfversion*.
+        """
+        getter = dxf_attrib_getter(dxfattribs, self.dxf_attrib, dxfversion)
+        if getter is None:  # entity does not support this attribute
+            return _false
+        compare = self.compare
+        convert_case = self.convert_case
+        value = self.value
+
+        def predicate(tags):
+            attrib = getter(tags)
+            if attrib is None:  # entity supports this attribute, but has no value for it
+                return False
+            return compare(convert_case(attrib), value)
+
+        return predicate
+
     def evaluate(self, entity):
         try:
             value = self.convert_case(entity.get_dxf_attrib(self.dxf_attrib))
@@ -215,6 +402,74 @@ class BoolExpression:
             values.append(value)
         return values.pop()
 
+    def index_terms(self):
+        """
+        Returns the index terms of the relations, which have to match, if the expression just combines terms by '&'.
+        """
+        if isinstance(self.tokens, Relation):
+            return self.tokens.index_terms()
+        tokens = list(self.tokens)
+        if any(isstring(token) and token != '&' for token in tokens):
+            return []
+        terms = []
+        for token in tokens:
+            if not isstring(token):
+                terms.extend(token.index_terms())
+        return terms
+
+    def tags_predicate(self, dxfattribs, dxfversion):
+        """
+        Returns the expression as one function of nested predicates, which evaluates the expression on the
+        ClassifiedTags() of an entity, see Relation.tags_predicate(). The operators are applied in the same order as
+        by evaluate(), but at compile time.
+        """
+        if isinstance(self.tokens, Relation):
+            return self.tokens.tags_predicate(dxfattribs, dxfversion)
+
+        predicates = []
+        operators = []
+        for token in self.tokens:
+            if hasattr(token, 'tags_predicate'):
+                predicates.append(token.tags_predicate(dxfattribs, dxfversion))
+            else:  # bool operator
+                operators.append(token)
+        predicates.reverse()
+        for op in operators:
+            if op == '!':
+                predicate = _not(predicates.pop())
+            elif op == '&':
+                predicate = _and(predicates.pop(), predicates.pop())
+            else:
+                predicate = _or(predicates.pop(), predicates.pop())
+            predicates.append(predicate)
+        return predicates.pop()
+
+
+def _true(tags):
+    return True
+
+
+def _false(tags):
+    return False
+
+
+def _not(predicate):
+    return lambda tags: not predicate(tags)
+
+
+def _and(predicate1, predicate2):
+    if predicate1 is _false or predicate2 is _false:
+        return _false
+    return lambda tags: predicate1(tags) and predicate2(tags)
+
+
+def _or(predicate1, predicate2):
+    if predicate1 is _false:
+        return predicate2
+    if predicate2 is _false:
+        return predicate1
+    return lambda tags: predicate1(tags) or predicate2(tags)
+
 
 def _compile_tokens(tokens, ignore_case):
     def is_relation(tokens):
@@ -230,11 +485,17 @@ def _compile_tokens(tokens, ignore_case):
         return BoolExpression([_compile_tokens(token, ignore_case) for token in tokens])
 
 
-def build_entity_attributes_matcher(tokens, options):
+def build_bool_expression(tokens, options):
     if not len(tokens):
-        return lambda x: True
+        return None
     ignore_case = 'i' == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))
+    return BoolExpression(_compile_tokens(tokens, ignore_case))
+
+
+def build_entity_attributes_matcher(tokens, options):
+    expr = build_bool_expression(tokens, options)
+    if expr is None:
+        return lambda x: True
 
     def match_bool_expr(entity):
         return expr.evaluate(entity)
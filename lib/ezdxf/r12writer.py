@@ -6,12 +6,19 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import re
+from array import array
 from contextlib import contextmanager
+from itertools import chain
 
 
 def rnd(x):  # adjust output precision of floats by changing 'ndigits'
     return round(x, ndigits=6)
 
+BATCH_SIZE = 1024  # entities formatted by one string operation
+FLOAT_FORMAT = '%.6f\n'  # same precision as rnd()
+TRAILING_ZEROS = re.compile(r'(\.[0-9]*?[0-9])0+\n')
+
 TEXT_ALIGN_FLAGS = {
     'LEFT': (0, 0),
     'CENTER': (1, 0),
@@ -124,6 +131,63 @@ class R12FastStreamWriter(object):
         if polyline_flags is not None:
             self.stream.write("0\nSEQEND\n")
 
+    def add_lines(self, starts, ends, dim=2, layer="0", color=None, linetype=None):
+        """ Add multiple LINE entities, *starts* and *ends* are flat sequences of coordinates like [x0, y0, x1, y1, ...]
+        for *dim* = 2 or [x0, y0, z0, x1, y1, z1, ...] for *dim* = 3, e.g. list, array('d') or an object supporting the
+        buffer protocol with float64 values like a numpy array.
+        """
+        starts = float_sequence(starts, dim)
+        ends = float_sequence(ends, dim)
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends require the same count of coordinates.")
+        template = "0\nLINE\n" + escape(dxf_attribs(layer, color, linetype)) + vertex_template(10, dim) + \
+                   vertex_template(11, dim)
+        size = 2 * dim  # coordinates per entity
+        step = dim * BATCH_SIZE
+        for index in range(0, len(starts), step):
+            start_coords = format_floats(starts[index:index + step])
+            end_coords = format_floats(ends[index:index + step])
+            coords = [None] * (len(start_coords) * 2)
+            for axis in range(dim):
+                coords[axis::size] = start_coords[axis::dim]
+                coords[dim + axis::size] = end_coords[axis::dim]
+            self.stream.write((template * (len(coords) // size)) % tuple(coords))
+
+    def add_points(self, points, dim=2, layer="0", color=None, linetype=None):
+        """ Add multiple POINT entities, *points* is a flat sequence of coordinates, see add_lines(). """
+        points = float_sequence(points, dim)
+        template = "0\nPOINT\n" + escape(dxf_attribs(layer, color, linetype)) + vertex_template(10, dim)
+        step = dim * BATCH_SIZE
+        for index in range(0, len(points), step):
+            coords = format_floats(points[index:index + step])
+            self.stream.write((template * (len(coords) // dim)) % tuple(coords))
+
+    def add_polylines(self, polylines, dim=2, layer="0", color=None, linetype=None):
+        """ Add multiple POLYLINE entities, *polylines* is an iterable of flat vertex sequences, see add_lines(). """
+        polyline_flags, vertex_flags = ('8', '32') if dim == 3 else ('0', '0')
+        head = escape("0\nPOLYLINE\n" + dxf_attribs(layer, color, linetype) + dxf_tag(66, "1") +
+                      dxf_tag(70, polyline_flags))
+        vertex = escape("0\nVERTEX\n" + dxf_attribs(layer) + dxf_tag(70, vertex_flags)) + vertex_template(10, dim)
+        tail = "0\nSEQEND\n"
+
+        def write_polylines(batch):
+            coords = format_floats(tuple(chain.from_iterable(batch)))
+            templates = []
+            for vertices in batch:
+                count = len(vertices) // dim
+                if count:
+                    templates.extend((head, vertex * count, tail))
+            self.stream.write(''.join(templates) % tuple(coords))
+
+        batch = []
+        for vertices in polylines:
+            batch.append(float_sequence(vertices, dim))
+            if len(batch) >= BATCH_SIZE:
+                write_polylines(batch)
+                batch = []
+        if batch:
+            write_polylines(batch)
+
     def add_text(self, text, insert=(0, 0), height=1., width=1., align="LEFT", rotation=0., oblique=0., style='STANDARD',
                  layer="0", color=None):
         # text style is always STANDARD without a TABLES section
@@ -170,6 +234,39 @@ def dxf_vertex(vertex, code=10):
 def dxf_tag(code, value):
     return "%d\n%s\n" % (code, value)
 
+
+def vertex_template(code, dim):
+    return "".join("%d\n%%s\n" % (code + axis * 10) for axis in range(dim))
+
+
+def escape(s):
+    # escape '%' for usage as format template
+    return s.replace('%', '%%')
+
+
+def float_sequence(values, dim):
+    """ Returns *values* as sliceable sequence of floats, flattens C contiguous float64 buffers like 2d numpy arrays.
+    """
+    if not isinstance(values, (list, tuple, array)):
+        try:
+            view = memoryview(values)
+        except TypeError:  # no buffer protocol support
+            values = list(values)
+        else:
+            if view.format == 'd' and view.c_contiguous:
+                values = view.cast('B').cast('d')
+            else:
+                values = list(values)
+    if len(values) % dim:
+        raise ValueError("Count of coordinates has to be a multiple of {}.".format(dim))
+    return values
+
+
+def format_floats(values):
+    """ Returns the floats *values* as list of strings like str(rnd(value)), formatted by one string operation. """
+    s = TRAILING_ZEROS.sub(r'\1\n', (FLOAT_FORMAT * len(values)) % tuple(values))
+    return s.split('\n')[:-1]
+
 PREFACE = """  0
 SECTION
   2
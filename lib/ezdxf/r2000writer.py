@@ -0,0 +1,292 @@
+# Purpose: fast & simple but restricted DXF R2000 writer, with no in-memory drawing, and without dependencies to other
+# ezdxf modules except the r12writer. The created DXF file contains a minimal HEADER, TABLES, BLOCKS and OBJECTS section
+# and the streamed ENTITIES section.
+# Created: 18.10.2026
+# License: MIT License
+"""
+The r2000writer() creates compact DXF R2000 (AC1015) files, the main advantage to the r12writer() is the LWPOLYLINE
+entity, which stores 2D polylines with bulges and widths in a single entity.
+
+All layers, linetypes and text styles have to be defined by add_layer(), add_linetype() and add_text_style() before
+adding the first entity, because the TABLES section is written in front of the first entity. The linetypes ByBlock,
+ByLayer and Continuous and the text style Standard are always defined, undefined linetypes and text styles raise a
+ValueError. The final $HANDSEED value is patched into the HEADER section at closing, therefore the stream has to be
+seekable.
+
+    with r2000writer('laser.dxf') as dxf:
+        dxf.add_linetype('DASHED', 'Dashed __ __ __', [0.6, 0.5, -0.1])
+        dxf.add_layer('CUT', color=1)
+        dxf.add_layer('MARK', color=3, linetype='DASHED')
+        dxf.add_lwpolyline([(0, 0), (10, 0, 0, 0, 1), (10, 10), (0, 10)], closed=True, layer='CUT')
+"""
+from __future__ import unicode_literals
+
+import io
+from contextlib import contextmanager
+
+from .r12writer import rnd, dxf_attribs, dxf_vertex, dxf_tag, TEXT_ALIGN_FLAGS
+
+FIRST_HANDLE = 0x100  # lower handles are reserved for the table entries, blocks and objects
+MODEL_SPACE_HANDLE = '1F'  # BLOCK_RECORD *Model_Space, owner of all entities
+LAYER_TABLE_HANDLE = '2'
+LTYPE_TABLE_HANDLE = '5'
+STYLE_TABLE_HANDLE = '3'
+HANDSEED_PLACEHOLDER = '0' * 16  # reserves space for the final $HANDSEED value
+
+
+@contextmanager
+def r2000writer(stream):
+    if hasattr(stream, 'write'):
+        writer = R2000FastStreamWriter(stream)
+        yield writer
+        writer.close()
+    else:
+        with io.open(stream, mode='wt', encoding='cp1252', errors='replace') as stream:
+            writer = R2000FastStreamWriter(stream)
+            yield writer
+            writer.close()
+
+
+class R2000FastStreamWriter(object):
+    def __init__(self, stream):
+        self.stream = stream
+        self.layers = []  # layer table entries as DXF strings
+        self.linetypes = []  # linetype table entries as DXF strings, without the predefined linetypes
+        self.text_styles = []  # text style table entries as DXF strings, without the predefined text style
+        self._linetype_names = set(['BYBLOCK', 'BYLAYER', 'CONTINUOUS'])  # upper case names of defined linetypes
+        self._text_style_names = set(['STANDARD'])  # upper case names of defined text styles
+        self._handle = FIRST_HANDLE
+        self._handseed_position = None  # HEADER, TABLES and BLOCKS are written by adding the first entity
+
+    def close(self):
+        if self._handseed_position is None:
+            self._write_prologue()
+        stream = self.stream
+        stream.write("0\nENDSEC\n")  # end of ENTITIES
+        stream.write(SUFFIX)
+        stream.seek(self._handseed_position)
+        stream.write(("%X" % self._handle).rjust(len(HANDSEED_PLACEHOLDER), '0'))
+        stream.seek(0, io.SEEK_END)
+
+    def _next_handle(self):
+        handle = self._handle
+        self._handle += 1
+        return "%X" % handle
+
+    def _write_prologue(self):
+        stream = self.stream
+        stream.write(HEADER_START)
+        self._handseed_position = stream.tell()
+        stream.write(HANDSEED_PLACEHOLDER)
+        stream.write(HEADER_END)
+        stream.write(TABLES_START)
+        stream.write(table('LTYPE', LTYPE_TABLE_HANDLE, len(self.linetypes) + 3))
+        stream.write(LINETYPES)
+        stream.write(''.join(self.linetypes))
+        stream.write("0\nENDTAB\n")
+        stream.write(table('LAYER', LAYER_TABLE_HANDLE, len(self.layers) + 1))
+        stream.write(LAYER0)
+        stream.write(''.join(self.layers))
+        stream.write("0\nENDTAB\n")
+        stream.write(table('STYLE', STYLE_TABLE_HANDLE, len(self.text_styles) + 1))
+        stream.write(STANDARD_TEXT_STYLE)
+        stream.write(''.join(self.text_styles))
+        stream.write("0\nENDTAB\n")
+        stream.write(TABLES_END)
+        stream.write(BLOCKS)
+        stream.write("0\nSECTION\n2\nENTITIES\n")
+
+    def _entity(self, dxftype, layer, color, linetype):
+        if linetype is not None:
+            self._check_linetype(linetype)
+        if self._handseed_position is None:
+            self._write_prologue()
+        return "0\n%s\n5\n%s\n330\n%s\n100\nAcDbEntity\n%s" % (
+            dxftype, self._next_handle(), MODEL_SPACE_HANDLE, dxf_attribs(layer, color, linetype))
+
+    def _check_linetype(self, name):
+        if name.upper() not in self._linetype_names:
+            raise ValueError("Undefined linetype '{}', define linetypes by add_linetype().".format(name))
+
+    def _check_text_style(self, name):
+        if name.upper() not in self._text_style_names:
+            raise ValueError("Undefined text style '{}', define text styles by add_text_style().".format(name))
+
+    def add_linetype(self, name, description='', pattern=(0.,)):
+        """ Define linetype *name*, *pattern* is [total pattern length, element 1, element 2, ...], an element > 0
+        is a line, < 0 is a gap and 0 is a dot, see ezdxf.tools.standards.linetypes().
+        """
+        if self._handseed_position is not None:
+            raise ValueError("Linetypes have to be defined before adding the first entity.")
+        if name.upper() in self._linetype_names:
+            raise ValueError("Linetype '{}' already exists.".format(name))
+        self._linetype_names.add(name.upper())
+        self.linetypes.append(linetype(self._next_handle(), name, description, pattern))
+
+    def add_text_style(self, name, font='txt', width=1.):
+        """ Define text style *name*, *font* is the font file name and *width* the width factor. """
+        if self._handseed_position is not None:
+            raise ValueError("Text styles have to be defined before adding the first entity.")
+        if name.upper() in self._text_style_names:
+            raise ValueError("Text style '{}' already exists.".format(name))
+        self._text_style_names.add(name.upper())
+        self.text_styles.append(text_style(self._next_handle(), name, font, width))
+
+    def add_layer(self, name, color=7, linetype='Continuous'):
+        """ Define layer *name*, a negative *color* value defines a layer which is off, *linetype* has to be defined
+        by add_linetype() before.
+        """
+        if self._handseed_position is not None:
+            raise ValueError("Layers have to be defined before adding the first entity.")
+        self._check_linetype(linetype)
+        dxf = ["0\nLAYER\n5\n%s\n330\n%s\n" % (self._next_handle(), LAYER_TABLE_HANDLE)]
+        dxf.append("100\nAcDbSymbolTableRecord\n100\nAcDbLayerTableRecord\n")
+        dxf.append(dxf_tag(2, name))
+        dxf.append(dxf_tag(70, 0))
+        dxf.append(dxf_tag(62, int(color)))
+        dxf.append(dxf_tag(6, linetype))
+        dxf.append("390\nF\n")  # plot style name: Normal
+        self.layers.append(''.join(dxf))
+
+    def add_line(self, start, end, layer="0", color=None, linetype=None):
+        dxf = [self._entity('LINE', layer, color, linetype)]
+        dxf.append("100\nAcDbLine\n")
+        dxf.append(dxf_vertex(start, code=10))
+        dxf.append(dxf_vertex(end, code=11))
+        self.stream.write(''.join(dxf))
+
+    def add_circle(self, center, radius, layer="0", color=None, linetype=None):
+        dxf = [self._entity('CIRCLE', layer, color, linetype)]
+        dxf.append("100\nAcDbCircle\n")
+        dxf.append(dxf_vertex(center))
+        dxf.append(dxf_tag(40, str(rnd(radius))))
+        self.stream.write(''.join(dxf))
+
+    def add_arc(self, center, radius, start=0, end=360, layer="0", color=None, linetype=None):
+        dxf = [self._entity('ARC', layer, color, linetype)]
+        dxf.append("100\nAcDbCircle\n")
+        dxf.append(dxf_vertex(center))
+        dxf.append(dxf_tag(40, str(rnd(radius))))
+        dxf.append("100\nAcDbArc\n")
+        dxf.append(dxf_tag(50, str(rnd(start))))
+        dxf.append(dxf_tag(51, str(rnd(end))))
+        self.stream.write(''.join(dxf))
+
+    def add_point(self, location, layer="0", color=None, linetype=None):
+        dxf = [self._entity('POINT', layer, color, linetype)]
+        dxf.append("100\nAcDbPoint\n")
+        dxf.append(dxf_vertex(location))
+        self.stream.write(''.join(dxf))
+
+    def add_lwpolyline(self, points, closed=False, layer="0", color=None, linetype=None):
+        """ Add a LWPOLYLINE, *points* is an iterable of (x, y, [start_width, [end_width, [bulge]]]) tuples, the bulge
+        value defines the arc segment from this point to the next point.
+        """
+        count = 0
+        vertices = []
+        for point in points:
+            count += 1
+            vertices.append(dxf_vertex(point[:2]))
+            if len(point) > 2:
+                start_width, end_width, bulge = (tuple(point[2:5]) + (0, 0, 0))[:3]
+                if start_width or end_width:
+                    vertices.append(dxf_tag(40, str(rnd(start_width))))
+                    vertices.append(dxf_tag(41, str(rnd(end_width))))
+                if bulge:
+                    vertices.append(dxf_tag(42, str(rnd(bulge))))
+        dxf = [self._entity('LWPOLYLINE', layer, color, linetype)]
+        dxf.append("100\nAcDbPolyline\n")
+        dxf.append(dxf_tag(90, count))
+        dxf.append(dxf_tag(70, 1 if closed else 0))
+        dxf.extend(vertices)
+        self.stream.write(''.join(dxf))
+
+    def add_text(self, text, insert=(0, 0), height=1., width=1., align="LEFT", rotation=0., oblique=0., style='Standard',
+                 layer="0", color=None):
+        """ Add a TEXT, *style* has to be defined by add_text_style() before adding the first entity. """
+        self._check_text_style(style)
+        dxf = [self._entity('TEXT', layer, color, None)]
+        dxf.append("100\nAcDbText\n")
+        dxf.append(dxf_vertex(insert, code=10))
+        dxf.append(dxf_tag(40, str(rnd(height))))
+        dxf.append(dxf_tag(1, str(text)))
+        if rotation != 0.:
+            dxf.append(dxf_tag(50, str(rnd(rotation))))
+        if width != 1.:
+            dxf.append(dxf_tag(41, str(rnd(width))))
+        if oblique != 0.:
+            dxf.append(dxf_tag(51, str(rnd(oblique))))
+        if style != 'Standard':
+            dxf.append(dxf_tag(7, str(style)))
+        halign, valign = TEXT_ALIGN_FLAGS[align.upper()]
+        dxf.append(dxf_tag(72, str(halign)))
+        dxf.append(dxf_vertex(insert, code=11))  # align point
+        dxf.append("100\nAcDbText\n")
+        dxf.append(dxf_tag(73, str(valign)))
+        self.stream.write(''.join(dxf))
+
+
+def table(name, handle, entries=0):
+    return "0\nTABLE\n2\n%s\n5\n%s\n330\n0\n100\nAcDbSymbolTable\n70\n%d\n" % (name, handle, entries)
+
+
+def table_entry(dxftype, handle, owner, subclass, name):
+    return "0\n%s\n5\n%s\n330\n%s\n100\nAcDbSymbolTableRecord\n100\n%s\n2\n%s\n70\n0\n" % (
+        dxftype, handle, owner, subclass, name)
+
+
+def linetype(handle, name, description, pattern=(0.,)):
+    elements = pattern[1:]
+    return table_entry('LTYPE', handle, LTYPE_TABLE_HANDLE, 'AcDbLinetypeTableRecord', name) + \
+           "3\n%s\n72\n65\n73\n%d\n40\n%s\n" % (description, len(elements), rnd(pattern[0])) + \
+           ''.join("49\n%s\n74\n0\n" % rnd(element) for element in elements)
+
+
+def text_style(handle, name, font, width=1.):
+    return table_entry('STYLE', handle, STYLE_TABLE_HANDLE, 'AcDbTextStyleTableRecord', name) + \
+           "40\n0.0\n41\n%s\n50\n0.0\n71\n0\n42\n2.5\n3\n%s\n4\n\n" % (rnd(width), font)
+
+
+def block(handle, end_handle, owner, name, paperspace=False):
+    paperspace = "67\n1\n" if paperspace else ""
+    return "0\nBLOCK\n5\n%s\n330\n%s\n100\nAcDbEntity\n%s8\n0\n100\nAcDbBlockBegin\n2\n%s\n70\n0\n" \
+           "10\n0.0\n20\n0.0\n30\n0.0\n3\n%s\n1\n\n" \
+           "0\nENDBLK\n5\n%s\n330\n%s\n100\nAcDbEntity\n%s8\n0\n100\nAcDbBlockEnd\n" % (
+               handle, owner, paperspace, name, name, end_handle, owner, paperspace)
+
+
+HEADER_START = "0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1015\n9\n$DWGCODEPAGE\n3\nANSI_1252\n9\n$HANDSEED\n5\n"
+HEADER_END = "\n0\nENDSEC\n"
+
+TABLES_START = "0\nSECTION\n2\nTABLES\n" + table('VPORT', '8') + "0\nENDTAB\n"
+
+LINETYPES = linetype('14', 'ByBlock', '') + linetype('15', 'ByLayer', '') + linetype('16', 'Continuous', 'Solid line')
+
+LAYER0 = table_entry('LAYER', '10', LAYER_TABLE_HANDLE, 'AcDbLayerTableRecord', '0') + "62\n7\n6\nContinuous\n390\nF\n"
+
+STANDARD_TEXT_STYLE = text_style('11', 'Standard', 'txt')
+
+TABLES_END = table('VIEW', '6') + "0\nENDTAB\n" + \
+             table('UCS', '7') + "0\nENDTAB\n" + \
+             table('APPID', '9', 1) + \
+             table_entry('APPID', '12', '9', 'AcDbRegAppTableRecord', 'ACAD') + \
+             "0\nENDTAB\n" + \
+             table('DIMSTYLE', 'A', 1) + "100\nAcDbDimStyleTable\n71\n1\n340\n27\n" + \
+             table_entry('DIMSTYLE', '27', 'A', 'AcDbDimStyleTableRecord', 'Standard').replace("\n5\n", "\n105\n", 1) + \
+             "340\n11\n" + \
+             "0\nENDTAB\n" + \
+             table('BLOCK_RECORD', '1', 2) + \
+             table_entry('BLOCK_RECORD', MODEL_SPACE_HANDLE, '1', 'AcDbBlockTableRecord', '*Model_Space') + \
+             table_entry('BLOCK_RECORD', '58', '1', 'AcDbBlockTableRecord', '*Paper_Space') + \
+             "0\nENDTAB\n" + \
+             "0\nENDSEC\n"
+
+BLOCKS = "0\nSECTION\n2\nBLOCKS\n" + \
+         block('20', '21', MODEL_SPACE_HANDLE, '*Model_Space') + \
+         block('5A', '5B', '58', '*Paper_Space', paperspace=True) + \
+         "0\nENDSEC\n"
+
+SUFFIX = "0\nSECTION\n2\nOBJECTS\n" + \
+         "0\nDICTIONARY\n5\nC\n330\n0\n100\nAcDbDictionary\n281\n1\n3\nACAD_GROUP\n350\nD\n" + \
+         "0\nDICTIONARY\n5\nD\n330\nC\n100\nAcDbDictionary\n281\n1\n" + \
+         "0\nENDSEC\n0\nEOF\n"
@@ -7,8 +7,9 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from itertools import islice
 
-from ..lldxf.tags import TagGroups, DXFStructureError
-from ..lldxf.classifiedtags import ClassifiedTags, get_tags_linker
+from ..lldxf.tags import DXFStructureError
+from ..lldxf.classifiedtags import get_tags_linker
+from ..lldxf.lazytags import classified_tags_groups
 from ..query import EntityQuery
 
 
@@ -44,12 +45,11 @@ class AbstractSection(object):
         entitydb = self.entitydb
         fix_tags = self.dxffactory.modify_tags
 
-        for group in TagGroups(islice(tags, 2, len(tags)-1)):
-            tags = ClassifiedTags(group)
+        for tags in classified_tags_groups(islice(tags, 2, len(tags)-1)):
             fix_tags(tags)  # post read tags fixer for VERTEX!
             handle = entitydb.add_tags(tags)
             if not linked_tags(tags, handle):  # also creates the link structure as side effect
-                store_tags(tags)  # add to entity space
+                store_tags(tags, handle)  # add to entity space
 
     def write(self, stream):
         stream.write("  0\nSECTION\n  2\n%s\n" % self.name.upper())
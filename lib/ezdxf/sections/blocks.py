@@ -7,8 +7,9 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from itertools import islice
 
-from ..lldxf.tags import TagGroups, DXFStructureError
-from ..lldxf.classifiedtags import ClassifiedTags, get_tags_linker
+from ..lldxf.tags import DXFStructureError
+from ..lldxf.classifiedtags import get_tags_linker
+from ..lldxf.lazytags import classified_tags_groups
 from ..lldxf import const
 
 
@@ -62,11 +63,10 @@ class BlocksSection(object):
 
         entities = []
         modify_tags = self.dxffactory.modify_tags
-        for group in TagGroups(islice(tags, 2, len(tags) - 1)):
-            tags = ClassifiedTags(group)
+        for tags in classified_tags_groups(islice(tags, 2, len(tags) - 1)):
             modify_tags(tags)  # post read tags fixer for VERTEX!
             entities.append(tags)
-            if group[0].value == 'ENDBLK':
+            if tags.dxftype() == 'ENDBLK':
                 self.add(build_block_layout(entities))
                 entities = []
 
@@ -15,11 +15,13 @@ from .entities import EntitySection
 from ..options import options
 from ..lldxf.defaultchunk import DefaultChunk, iter_chunks, CompressedDefaultChunk
 from ..lldxf.tagger import skip_comments
+from ..lldxf.const import DXFSectionNotLoadedError
 
 
 class Sections(object):
-    def __init__(self, tagreader, drawing):
+    def __init__(self, tagreader, drawing, skipped=None):
         self._sections = {}
+        self._skipped = frozenset(skipped or [])  # names of not loaded sections, see PartialDrawing()
         self._setup_sections(tagreader, drawing)
 
     def __iter__(self):
@@ -51,21 +53,25 @@ class Sections(object):
         self._create_required_sections(drawing)
 
     def _create_required_sections(self, drawing):
-        if 'blocks' not in self:
+        if 'blocks' not in self and 'blocks' not in self._skipped:
             self._sections['blocks'] = BlocksSection(tags=None, drawing=drawing)
-        if 'tables' not in self:
+        if 'tables' not in self and 'tables' not in self._skipped:
             self._sections['tables'] = TablesSection(tags=None, drawing=drawing)
         if drawing.dxfversion > 'AC1009':  # required sections for DXF versions newer than R12 (AC1009)
-            if 'classes' not in self:
+            if 'classes' not in self and 'classes' not in self._skipped:
                 self._sections['classes'] = ClassesSection(tags=None, drawing=drawing)
 
     def __contains__(self, item):
         return item in self._sections
 
     def __getattr__(self, key):
+        if key.startswith('_'):  # prevent recursion by unpickling, self._sections does not exist yet
+            raise AttributeError(key)
         try:
             return self._sections[key]
         except KeyError:
+            if key in self._skipped:
+                raise DXFSectionNotLoadedError("Section '{}' was not loaded.".format(key.upper()))
             raise AttributeError(key)
 
     def get(self, name):
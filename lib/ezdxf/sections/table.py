@@ -36,6 +36,8 @@ class GenericTable(DefaultChunk):
 
 
 class Table(object):
+    _name_index = None  # case insensitive name index, created by _get_name_index()
+
     def __init__(self, tags, drawing):
         self._dxfname = tags[1].value
         self._drawing = drawing
@@ -43,6 +45,11 @@ class Table(object):
         self._table_header = None
         self._build_table_entries(tags)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_name_index', None)  # the name index is rebuilt at the first lookup
+        return state
+
     # start public interface
 
     @property
@@ -68,11 +75,11 @@ class Table(object):
         return self.new_entry(dxfattribs)
 
     def get(self, name):
-        """ Get table-entry by name as WrapperClass(). """
-        for entry in iter(self):
-            if entry.dxf.name == name:
-                return entry
-        raise ValueError(name)
+        """ Get table-entry by name as WrapperClass(), table-entry names are case insensitive. """
+        handles = self._get_name_index().get(name)
+        if not handles:
+            raise ValueError(name)
+        return self.get_table_entry_wrapper(handles[0])
 
     def remove(self, name):
         """ Remove table-entry from table and entitydb by name. """
@@ -148,8 +155,24 @@ class Table(object):
         self._append_entry_handle(handle)
 
     def _append_entry_handle(self, handle):
-        if handle not in self._table_entries:
-            self._table_entries.append(handle)
+        index = self._name_index
+        if index is None or not index.valid:
+            if handle in self._table_entries:
+                return
+        elif index.has_handle(handle):
+            return
+        self._table_entries.append(handle)
+        if index is not None and index.valid:
+            index.add(handle)
+
+    def _get_name_index(self):
+        """ Returns the name index of the table, created at the first call. """
+        index = self._name_index
+        if index is None or not index.valid:
+            index = TableNameIndex(self)
+            self.entitydb.name_indexes.append(index)
+            self._name_index = index
+        return index
 
     def get_table_entry_wrapper(self, handle):
         tags = self.entitydb[handle]
@@ -195,6 +218,60 @@ class Table(object):
         """ Remove table-entry from table and entitydb by handle. """
         self._table_entries.remove(handle)
         del self.entitydb[handle]
+        index = self._name_index
+        if index is not None and index.valid:
+            index.discard(handle)
+
+
+class TableNameIndex(object):
+    """ Case insensitive index of the table-entry names: lower case name -> list of handles in table order, list
+    because ViewportTable() can have multiple entries with the same name.
+
+    The index is maintained by adding and removing table-entries and by setting or deleting the DXF attribute 'name'
+    of the table-entry wrappers, see EntityDB.update_indexes().
+    """
+    def __init__(self, table):
+        self.valid = True
+        self._table = table
+        self._handles = {}  # lower case name -> list of handles
+        self._names = {}  # handle -> lower case name
+        for handle in table._table_entries:
+            self.add(handle)
+
+    def _key(self, handle):
+        return self._table.get_table_entry_wrapper(handle).get_dxf_attrib('name', '').lower()
+
+    def has_handle(self, handle):
+        return handle in self._names
+
+    def get(self, name):
+        """ Returns the handles of the table-entries *name*. """
+        return self._handles.get(name.lower())
+
+    def add(self, handle):
+        key = self._key(handle)
+        self._names[handle] = key
+        handles = self._handles.get(key)
+        if handles is None:
+            self._handles[key] = [handle]
+        else:
+            handles.append(handle)
+
+    def discard(self, handle):
+        key = self._names.pop(handle, None)
+        if key is not None:
+            handles = self._handles[key]
+            handles.remove(handle)
+            if not handles:
+                del self._handles[key]
+
+    def update(self, handle, key, count=None):
+        if key == 'name' and handle in self._names:
+            self.discard(handle)
+            self.add(handle)
+            handles = self._handles[self._names[handle]]
+            if len(handles) > 1:  # restore table order
+                handles.sort(key=self._table._table_entries.index)
 
 
 class ViewportTable(Table):
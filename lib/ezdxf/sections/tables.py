@@ -85,6 +85,8 @@ class TablesSection(object):
         return item in self._tables
 
     def __getattr__(self, key):
+        if key.startswith('_'):  # prevent recursion by unpickling, self._tables does not exist yet
+            raise AttributeError(key)
         try:
             return self._tables[key]
         except KeyError:
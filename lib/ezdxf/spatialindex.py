@@ -0,0 +1,234 @@
+# Purpose: spatial index of an entity space
+# Created: 18.10.2026
+# License: MIT License
+"""
+The SpatialIndex() is a uniform grid of square cells in the xy-plane of the WCS, each cell stores the handles of the
+entities, which bounding boxes overlap the cell, entities with very large bounding boxes are stored in a separated set
+and checked by each query. The cell size is derived from the median entity size and the extents of the entity space,
+and the grid is rebuilt if the count of entities grows too much.
+
+The index is maintained by adding and removing handles to/from the entity space and by setting or deleting DXF
+attributes by the entity wrappers, see EntityDB.update_indexes(). Changes, which bypass the wrappers, like
+modifications of the VERTEX entities of a POLYLINE or the ATTRIB entities of an INSERT, require a call of
+update(handle) for the main entity. The bounding boxes of block definitions are cached at the first use, later
+changes of the block content are not tracked, call get_spatial_index() of the layout after invalidating the index by
+setting its *valid* attribute to False.
+"""
+from __future__ import unicode_literals
+
+import math
+
+from .bbox import entity_bbox, union, intersects, distance
+
+MAX_CELLS = 64  # entities overlapping more cells are stored in the set of large entities
+NON_GEOMETRIC_DXF_ATTRIBS = frozenset([
+    'handle', 'owner', 'layer', 'color', 'linetype', 'lineweight', 'ltscale', 'invisible', 'true_color', 'color_name',
+    'transparency', 'shadow_mode', 'paperspace', 'thickness',
+])
+
+
+class SpatialIndex(object):
+    """ Spatial index of the entity space *handles*, the entities are wrapped by *dxffactory*. """
+    def __init__(self, handles, dxffactory):
+        self.valid = True
+        self._dxffactory = dxffactory
+        self._block_boxes = {}  # bounding boxes of the block content by block name, see _block_bbox()
+        self._boxes = dict((handle, self._entity_bbox(handle)) for handle in handles)  # None for no geometry
+        self._build_grid()
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def _entity_bbox(self, handle):
+        return entity_bbox(self._dxffactory.wrap_handle(handle), self._block_bbox)
+
+    def _block_bbox(self, name):
+        """ Returns the bounding box of the block *name* relative to the base point of the block. """
+        try:
+            return self._block_boxes[name]
+        except KeyError:
+            pass
+        self._block_boxes[name] = None  # guard against recursive block references
+        block_layout = self._dxffactory.blocks.get(name)
+        if block_layout is None:
+            return None
+        box = union(entity_bbox(entity, self._block_bbox) for entity in block_layout)
+        if box is not None:
+            base_point = block_layout.block.get_dxf_attrib('base_point', (0., 0.))
+            x, y = base_point[0], base_point[1]
+            box = (box[0] - x, box[1] - y, box[2] - x, box[3] - y)
+        self._block_boxes[name] = box
+        return box
+
+    def _build_grid(self):
+        boxes = [box for box in self._boxes.values() if box is not None]
+        self._cells = {}  # (column, row) -> set of handles
+        self._large = set()  # handles of entities overlapping more than MAX_CELLS cells
+        self._grid_bounds = None  # (min column, min row, max column, max row) of all cells ever used
+        self._grid_count = len(boxes)  # count of entities at building the grid
+        self._cell_size = _cell_size(boxes)
+        if self._cell_size is not None:
+            for handle, box in self._boxes.items():
+                if box is not None:
+                    self._insert(handle, box)
+
+    def _cell_range(self, box):
+        size = self._cell_size
+        return (int(math.floor(box[0] / size)), int(math.floor(box[1] / size)),
+                int(math.floor(box[2] / size)), int(math.floor(box[3] / size)))
+
+    def _insert(self, handle, box):
+        i0, j0, i1, j1 = self._cell_range(box)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > MAX_CELLS:
+            self._large.add(handle)
+            return
+        cells = self._cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is None:
+                    cells[(i, j)] = set([handle])
+                else:
+                    cell.add(handle)
+        bounds = self._grid_bounds
+        if bounds is None:
+            self._grid_bounds = (i0, j0, i1, j1)
+        elif i0 < bounds[0] or j0 < bounds[1] or i1 > bounds[2] or j1 > bounds[3]:
+            self._grid_bounds = (min(i0, bounds[0]), min(j0, bounds[1]), max(i1, bounds[2]), max(j1, bounds[3]))
+
+    def _remove(self, handle, box):
+        if handle in self._large:
+            self._large.discard(handle)
+            return
+        i0, j0, i1, j1 = self._cell_range(box)
+        cells = self._cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is not None:
+                    cell.discard(handle)
+                    if not cell:
+                        del cells[(i, j)]
+
+    def add(self, handle):
+        box = self._entity_bbox(handle)
+        self._boxes[handle] = box
+        if box is None:
+            return
+        if self._cell_size is None or len(self._boxes) > 2 * self._grid_count + 1000:
+            self._build_grid()
+        else:
+            self._insert(handle, box)
+
+    def discard(self, handle):
+        box = self._boxes.pop(handle, None)
+        if box is not None and self._cell_size is not None:
+            self._remove(handle, box)
+
+    def update(self, handle, key=None, count=None):
+        """ Update the bounding box of entity *handle* after changing the DXF attribute *key*, None for any change. """
+        if handle in self._boxes and key not in NON_GEOMETRIC_DXF_ATTRIBS:
+            self.discard(handle)
+            self.add(handle)
+
+    def bbox(self, handle):
+        """ Returns the cached bounding box of entity *handle* or None. """
+        return self._boxes.get(handle)
+
+    def extents(self):
+        """ Returns the bounding box of all entities or None. """
+        return union(self._boxes.values())
+
+    def intersecting(self, min_point, max_point):
+        """ Returns the handles of all entities, which bounding boxes intersect the window *min_point*, *max_point*,
+        sorted by handle.
+        """
+        window = (min(min_point[0], max_point[0]), min(min_point[1], max_point[1]),
+                  max(min_point[0], max_point[0]), max(min_point[1], max_point[1]))
+        found = set(self._large)
+        if self._cell_size is not None:
+            i0, j0, i1, j1 = self._cell_range(window)
+            cells = self._cells
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):  # less occupied cells than window cells
+                for (i, j), handles in cells.items():
+                    if i0 <= i <= i1 and j0 <= j <= j1:
+                        found.update(handles)
+            else:
+                for i in range(i0, i1 + 1):
+                    for j in range(j0, j1 + 1):
+                        handles = cells.get((i, j))
+                        if handles is not None:
+                            found.update(handles)
+        boxes = self._boxes
+        return _sorted_handles(handle for handle in found if intersects(boxes[handle], window))
+
+    def nearest(self, point, count=1):
+        """ Returns the handles of the *count* entities with the smallest distance of their bounding boxes to
+        *point*, sorted by distance.
+        """
+        if count < 1:
+            return []
+        boxes = self._boxes
+        candidates = {}  # handle -> distance
+
+        def add_candidates(handles):
+            for handle in handles:
+                if handle not in candidates:
+                    candidates[handle] = distance(boxes[handle], point)
+
+        def result():
+            return sorted(candidates, key=lambda handle: (candidates[handle], int(handle, 16)))[:count]
+
+        add_candidates(self._large)
+        if self._cell_size is None:
+            return result()
+
+        size = self._cell_size
+        cells = self._cells
+        ci = int(math.floor(point[0] / size))
+        cj = int(math.floor(point[1] / size))
+        bounds = self._grid_bounds
+        max_ring = max(abs(ci - bounds[0]), abs(ci - bounds[2]), abs(cj - bounds[1]), abs(cj - bounds[3]))
+        scanned = 0
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                keys = [(ci, cj)]
+            else:
+                keys = [(ci + di, cj - ring) for di in range(-ring, ring + 1)]
+                keys.extend((ci + di, cj + ring) for di in range(-ring, ring + 1))
+                keys.extend((ci - ring, cj + dj) for dj in range(-ring + 1, ring))
+                keys.extend((ci + ring, cj + dj) for dj in range(-ring + 1, ring))
+            for key in keys:
+                handles = cells.get(key)
+                if handles is not None:
+                    add_candidates(handles)
+            # all entities within the distance ring * size are found
+            if len(candidates) >= count and sorted(candidates.values())[count - 1] <= ring * size:
+                break
+            scanned += len(keys)
+            if scanned > 4 * len(cells):  # sparse grid, check all occupied cells
+                for handles in cells.values():
+                    add_candidates(handles)
+                break
+        return result()
+
+
+def _cell_size(boxes):
+    """ Returns the cell size for the bounding boxes *boxes* or None for no boxes. """
+    if not boxes:
+        return None
+    sizes = sorted(max(box[2] - box[0], box[3] - box[1]) for box in boxes)
+    median = sizes[len(sizes) // 2]
+    extents = union(boxes)
+    width = extents[2] - extents[0]
+    height = extents[3] - extents[1]
+    size = max(median, math.sqrt(width * height / len(boxes)))
+    if size <= 0.:  # points or entities on a horizontal or vertical line
+        size = max(width, height) / len(boxes)
+    if size <= 0.:  # all entities at the same location
+        size = 1.
+    return size
+
+
+def _sorted_handles(handles):
+    return sorted(handles, key=lambda handle: int(handle, 16))
@@ -0,0 +1,147 @@
+# Purpose: write-through DXF writer for huge drawings, for DXF version AC1015 and newer
+# Created: 18.10.2026
+# License: MIT License
+"""
+The streamwriter() writes HEADER, CLASSES, TABLES and BLOCKS of a prepared drawing (the schema) at the beginning, all
+layers, linetypes, text styles and blocks have to be defined before streaming. The model space entities are created by
+the usual GraphicsFactory() interface, but each entity is written to the stream and removed from the entity database
+when the next entity is added or the writer is closed, so the last added entity can be modified until the next entity
+is added. The OBJECTS section and the final $HANDSEED are written at closing, the $HANDSEED value in the HEADER
+section is patched in place, therefore the stream has to be seekable.
+
+    dwg = ezdxf.new('AC1015')
+    dwg.layers.new('LINES', dxfattribs={'color': 1})
+    with streamwriter('huge.dxf', dwg) as msp:
+        for index in range(1000000):
+            msp.add_line((index, 0), (index, 10), dxfattribs={'layer': 'LINES'})
+"""
+from __future__ import unicode_literals
+
+import io
+from contextlib import contextmanager
+
+from .graphicsfactory import GraphicsFactory
+from .lldxf.const import DXFVersionError, DXFStreamError
+from .lldxf.tagwriter import BufferedTextWriter
+from .options import options
+from .sections.sections import KNOWN_SECTIONS
+
+HANDSEED_PLACEHOLDER = '0' * 16  # reserves space for the final $HANDSEED value
+HANDSEED_TAG = '\n$HANDSEED\n  5\n'
+
+
+@contextmanager
+def streamwriter(stream, drawing, encoding='auto'):
+    """ Yields the model space of *drawing* as StreamLayout(), *stream* is a seekable text stream or a filename. """
+    if hasattr(stream, 'write'):
+        writer = DXFStreamWriter(stream, drawing)
+        yield writer.modelspace
+        writer.close()
+    else:
+        with io.open(stream, mode='wt', encoding=drawing.output_encoding(encoding), errors='dxfreplace') as fp:
+            writer = DXFStreamWriter(fp, drawing)
+            yield writer.modelspace
+            writer.close()
+
+
+class DXFStreamWriter(object):
+    def __init__(self, stream, drawing):
+        if drawing.dxfversion <= 'AC1009':
+            raise DXFVersionError('streamwriter() requires DXF version AC1015 or newer, use r12writer() for DXF R12.')
+        self.drawing = drawing
+        self.stream = stream
+        self.buffer = BufferedTextWriter(stream)
+        self._handseed_position = 0
+        self.modelspace = StreamLayout(self, drawing.modelspace())
+        self._write_prologue()
+
+    def _write_prologue(self):
+        dwg = self.drawing
+        dwg._create_appids()
+        dwg._update_metadata()
+        dwg.header['$HANDSEED'] = HANDSEED_PLACEHOLDER
+        header = io.StringIO()
+        if options.store_comments:
+            dwg.write_leading_comments(header)
+        dwg.header.write(header)
+        header = header.getvalue()
+        index = header.index(HANDSEED_TAG + HANDSEED_PLACEHOLDER) + len(HANDSEED_TAG)
+        self.stream.write(header[:index])
+        self._handseed_position = self.stream.tell()
+        self.stream.write(header[index:])
+
+        buffer = self.buffer
+        for name in ('classes', 'tables', 'blocks'):
+            section = dwg.sections.get(name)
+            if section is not None:
+                section.write(buffer)
+        buffer.write('  0\nSECTION\n  2\nENTITIES\n')
+        # entities of the drawing, created before streaming
+        dwg.entities.get_entity_space().write(buffer, dwg.get_active_entity_space_layout_keys())
+
+    def close(self):
+        """ Writes the last entity, the OBJECTS section and the final $HANDSEED. """
+        self.modelspace.flush()
+        buffer = self.buffer
+        buffer.write('  0\nENDSEC\n')
+        for name in KNOWN_SECTIONS[KNOWN_SECTIONS.index('entities') + 1:]:
+            section = self.drawing.sections.get(name)
+            if section is not None:
+                section.write(buffer)
+        buffer.write('  0\nEOF\n')
+        buffer.flush()
+
+        handseed = str(self.drawing._handles)
+        self.drawing.header['$HANDSEED'] = handseed
+        self.stream.seek(self._handseed_position)
+        self.stream.write(handseed.rjust(len(HANDSEED_PLACEHOLDER), '0'))
+        self.stream.seek(0, io.SEEK_END)
+
+
+class StreamLayout(GraphicsFactory):
+    """ Model space of the streamwriter(), supports the GraphicsFactory() interface, except add_auto_blockref().
+    """
+    def __init__(self, writer, layout):
+        super(StreamLayout, self).__init__(layout._dxffactory)
+        self._writer = writer
+        self._layout = layout
+        self._pending = None  # handle of the last added entity, written by adding the next entity
+
+    @property
+    def drawing(self):
+        return self._writer.drawing
+
+    @property
+    def entitydb(self):
+        return self._dxffactory.entitydb
+
+    @property
+    def layout_key(self):
+        return self._layout.layout_key
+
+    def build_and_add_entity(self, type_, dxfattribs):
+        self.flush()
+        entity = self._layout.build_entity(type_, dxfattribs)
+        self._pending = entity.dxf.handle
+        return entity
+
+    def add_entity(self, entity):
+        """ Add *entity* from the drawing database to the model space. """
+        self.flush()
+        self._layout._set_paperspace(entity)
+        self._pending = entity.dxf.handle
+
+    def add_auto_blockref(self, name, insert, values, dxfattribs=None):
+        raise DXFStreamError('Can not create anonymous blocks, the BLOCKS section is already written.')
+
+    def flush(self):
+        """ Write the last added entity and the linked entities, and remove them from the entity database. """
+        handle = self._pending
+        self._pending = None
+        entitydb = self.entitydb
+        stream = self._writer.buffer
+        while handle is not None:
+            tags = entitydb[handle]
+            tags.write(stream)
+            entitydb.delete_handle(handle)
+            handle = tags.link
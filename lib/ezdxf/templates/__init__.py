@@ -8,6 +8,35 @@ __author__ = "mozman <mozman@gmx.at>"
 import os
 import io
 
+from ..options import options
+
+# options which change the parsed drawing are part of the cache key
+PARSER_OPTIONS = ('compact_tags', 'compress_binary_data', 'compress_default_chunks')
+
+# In-process cache of the parsed templates as pickled Drawing() objects:
+# (template_dir, dxfversion, values of PARSER_OPTIONS) -> bytes
+_prototypes = {}
+
+
+def _prototype_key(template_dir, dxfversion):
+    return (template_dir, dxfversion) + tuple(getattr(options, name) for name in PARSER_OPTIONS)
+
+
+def get_prototype(template_dir, dxfversion):
+    """ Returns the pickled template drawing or None if not cached. """
+    return _prototypes.get(_prototype_key(template_dir, dxfversion))
+
+
+def set_prototype(template_dir, dxfversion, data):
+    _prototypes[_prototype_key(template_dir, dxfversion)] = data
+
+
+def clear_prototypes():
+    """ Invalidates all cached template drawings, called if options.template_dir changes, call this function
+    explicit if the template files were modified.
+    """
+    _prototypes.clear()
+
 
 class TemplateLoader(object):
     def __init__(self, template_dir=None):
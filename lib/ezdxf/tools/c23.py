@@ -8,9 +8,9 @@ import functools
 
 PY3 = sys.version_info.major > 2
 if sys.version_info[:2] > (3, 2):
-    from collections.abc import Sequence
+    from collections.abc import Sequence, MutableSequence
 else:
-    from collections import Sequence
+    from collections import Sequence, MutableSequence
 
 if PY3:
     import html
@@ -1,4 +1,4 @@
-# Purpose: read DXF files from zip archive
+# Purpose: read DXF files from zip archive, read and write gzip compressed DXF files
 # Created: 02.05.2014
 # Copyright (C) 2014, Manfred Moitzi
 # License: MIT License
@@ -6,6 +6,9 @@ from __future__ import unicode_literals
 
 __author__ = "mozman <mozman@gmx.at>"
 
+import gzip
+import io
+import os
 import zipfile
 from contextlib import contextmanager
 
@@ -14,6 +17,9 @@ from ezdxf.lldxf.tags import dxf_info
 
 WIN_NEW_LINE = b'\r\n'
 NEW_LINE = b'\n'
+GZIP_MAGIC = b'\x1f\x8b'
+ZIP_MAGIC = b'PK\x03\x04'
+COMPRESSION_LEVEL = 6  # zlib default, level 9 is much slower for a few percent smaller files
 
 
 class ZipReader(object):
@@ -73,3 +79,137 @@ def ctxZipReader(zip_achive, filename=None):
     zip_reader.open(filename)
     yield zip_reader
     zip_reader.close()
+
+
+def compression_format(filename):
+    """ Returns 'gzip' or 'zip' for compressed files detected by their leading bytes, else None. """
+    with io.open(filename, mode='rb') as fp:
+        return _compression_format(fp.read(4))
+
+
+def _compression_format(magic):
+    if magic.startswith(GZIP_MAGIC):
+        return 'gzip'
+    elif magic == ZIP_MAGIC:
+        return 'zip'
+    else:
+        return None
+
+
+def open_binary(filename):
+    """ Returns DXF file *filename* as binary file object, gzip compressed files and the first DXF file of a zip
+    archive are decompressed on the fly.
+    """
+    return open_binary_format(filename)[0]
+
+
+def open_binary_format(filename):
+    """ Returns (binary file object, compression format) of DXF file *filename*, see open_binary() and
+    compression_format(). The file is opened just once, the compression format is detected by the leading bytes of the
+    opened file.
+    """
+    fp = io.open(filename, mode='rb')
+    try:
+        compression = _compression_format(fp.read(4))
+        fp.seek(0)
+        if compression == 'gzip':
+            return OwnerStream(gzip.GzipFile(fileobj=fp, mode='rb'), fp), compression
+        elif compression == 'zip':
+            archive = zipfile.ZipFile(fp)  # does not close the passed file object fp
+            names = [name for name in archive.namelist() if name.lower().endswith('.dxf')]
+            if not names:
+                raise IOError("'{}' has no DXF files.".format(filename))
+            # the member reads from fp, which is open until closing the OwnerStream()
+            return OwnerStream(archive.open(names[0]), fp), compression
+        else:
+            return fp, None
+    except Exception:
+        fp.close()
+        raise
+
+
+class OwnerStream(io.BufferedIOBase):
+    """ Readable binary *stream*, which reads from the file object *fp*, and closes *fp* after closing *stream*. """
+    def __init__(self, stream, fp):
+        super(OwnerStream, self).__init__()
+        self._stream = stream
+        self._fp = fp
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    read1 = read
+
+    def readinto(self, buffer):
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        return self._stream.readline(size)
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                self._fp.close()
+                super(OwnerStream, self).close()
+
+
+def archive_name(filename):
+    """ Returns the name of the DXF file in the zip archive *filename*: 'drawing.dxf' for 'drawing.zip' or
+    'drawing.dxf.zip'.
+    """
+    name, ext = os.path.splitext(os.path.basename(filename))
+    if ext.lower() not in ('.zip', '.gz'):
+        name += ext
+    if not name.lower().endswith('.dxf'):
+        name += '.dxf'
+    return name
+
+
+@contextmanager
+def compressed_writer(filename, compression, encoding, errors='dxfreplace'):
+    """ Yields a text stream, which writes the compressed DXF file *filename* in the format *compression*, 'gzip' for
+    a gzip file or 'zip' for a zip archive with one DXF file. The text is encoded and compressed block by block as
+    written into the stream, the uncompressed text is never stored at once, except for zip archives on Python < 3.6,
+    which does not support writing into zip archive members. Yields a binary stream if *encoding* is None.
+    """
+    def text_stream(fp):
+        return fp if encoding is None else io.TextIOWrapper(fp, encoding=encoding, errors=errors)
+
+    def close(stream):
+        if encoding is not None:
+            stream.flush()
+            stream.detach()
+
+    if compression == 'gzip':
+        with gzip.open(filename, mode='wb', compresslevel=COMPRESSION_LEVEL) as fp:
+            stream = text_stream(fp)
+            yield stream
+            close(stream)
+    elif compression == 'zip':
+        with zipfile.ZipFile(filename, mode='w', compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            name = archive_name(filename)
+            try:
+                fp = archive.open(name, mode='w', force_zip64=True)
+            except (TypeError, ValueError):  # Python < 3.6
+                if encoding is None:
+                    stream = io.BytesIO()
+                    yield stream
+                    archive.writestr(name, stream.getvalue())
+                else:
+                    stream = io.StringIO()
+                    yield stream
+                    archive.writestr(name, stream.getvalue().encode(encoding, errors))
+            else:
+                with fp:
+                    stream = text_stream(fp)
+                    yield stream
+                    close(stream)
+    else:
+        raise ValueError("Unknown compression '{}', use 'gzip' or 'zip'.".format(compression))
@@ -0,0 +1,47 @@
+# Purpose: benchmark of ASCII DXF vs. binary DXF: save time, load time and file size
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/binary_dxf.py file.dxf
+#
+# Saves the drawing of file.dxf as ASCII DXF and as binary DXF into a temporary directory, and loads both files, the
+# best time of 3 runs is reported.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+
+def best_time(func, *args, **kwargs):
+    t = float('inf')
+    for _ in range(3):
+        t0 = time.time()
+        func(*args, **kwargs)
+        t = min(t, time.time() - t0)
+    return t
+
+
+def benchmark(filename, folder):
+    dwg = ezdxf.readfile(filename)
+    print('{}: {} entities'.format(filename, len(dwg.entitydb)))
+    for fmt in ('asc', 'bin'):
+        outname = os.path.join(folder, 'drawing_{}.dxf'.format(fmt))
+        t_save = best_time(dwg.saveas, outname, fmt=fmt)
+        t_load = best_time(ezdxf.readfile, outname)
+        size = os.path.getsize(outname) / (1024. * 1024.)
+        print('  {}: save {:>6.2f}s  load {:>6.2f}s  {:>8.1f} MB'.format(fmt, t_save, t_load, size))
+
+
+if __name__ == '__main__':
+    folder = tempfile.mkdtemp()
+    try:
+        benchmark(sys.argv[1], folder)
+    finally:
+        shutil.rmtree(folder)
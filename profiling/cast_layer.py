@@ -0,0 +1,71 @@
+# Purpose: micro benchmark of the tag cast layer: string_tagger(), stream_tagger() and cast_tag()
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/cast_layer.py [count]
+#
+# Runs on synthetic in-memory DXF data, count is the number of generated entities (default 20000). Compare the
+# results of different revisions to track regressions in the cast layer.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import io
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+from ezdxf.lldxf.tagger import string_tagger, stream_tagger
+from ezdxf.lldxf.types import cast_tag
+
+ENTITIES = [
+    # LINE: handle, owner, layer, int, 2x 3d point
+    '  0\nLINE\n  5\n{handle:X}\n330\n1F\n100\nAcDbEntity\n  8\nLayer{layer}\n 62\n{color}\n100\nAcDbLine\n'
+    ' 10\n{x:.6f}\n 20\n{y:.6f}\n 30\n0.0\n 11\n{y:.6f}\n 21\n{x:.6f}\n 31\n1.5\n',
+    # CIRCLE: 3d point, float, extrusion
+    '  0\nCIRCLE\n  5\n{handle:X}\n330\n1F\n100\nAcDbEntity\n  8\nLayer{layer}\n100\nAcDbCircle\n'
+    ' 10\n{x:.6f}\n 20\n{y:.6f}\n 30\n0.0\n 40\n{r:.6f}\n210\n0.0\n220\n0.0\n230\n1.0\n',
+    # LWPOLYLINE: 2d points
+    '  0\nLWPOLYLINE\n  5\n{handle:X}\n330\n1F\n100\nAcDbEntity\n  8\nLayer{layer}\n100\nAcDbPolyline\n 90\n4\n'
+    ' 70\n1\n 10\n{x:.6f}\n 20\n{y:.6f}\n 10\n{y:.6f}\n 20\n{x:.6f}\n 10\n{r:.6f}\n 20\n{x:.6f}\n'
+    ' 10\n{x:.6f}\n 20\n{r:.6f}\n',
+]
+
+
+def dxf_data(count):
+    parts = []
+    for index in range(count):
+        template = ENTITIES[index % len(ENTITIES)]
+        parts.append(template.format(handle=index + 256, layer=index % 7, color=index % 256, x=index * 1.5,
+                                     y=index * 0.25, r=1. + index % 10))
+    return ''.join(parts)
+
+
+def run(name, func):
+    t0 = time.time()
+    count = func()
+    t = time.time() - t0
+    print('{:<16} {:>10} tags {:>8.3f}s {:>12.0f} tags/s'.format(name, count, t, count / t))
+
+
+def count_tags(tagger):
+    count = 0
+    for _ in tagger:
+        count += 1
+    return count
+
+
+def benchmark(count):
+    s = dxf_data(count)
+    lines = s.split('\n')
+    # cast_tag() handles just single tags, point coordinates are grouped by the taggers
+    raw_tags = [(int(code), value) for code, value in zip(lines[0:-1:2], lines[1::2])
+                if not (10 <= int(code) < 40 or 210 <= int(code) < 240)]
+    print('{} entities, {} lines, {:.1f} MB'.format(count, len(lines) - 1, len(s) / (1024. * 1024.)))
+    run('string_tagger', lambda: count_tags(string_tagger(s)))
+    run('stream_tagger', lambda: count_tags(stream_tagger(io.StringIO(s))))
+    run('cast_tag', lambda: count_tags(cast_tag(tag) for tag in raw_tags))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,110 @@
+# Purpose: regression check of the writers for compressed binary data
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/compressed_binary_data.py
+#
+# Creates a drawing with an XRECORD and a BODY entity with proxy graphic, both with binary data tags 310, loads it with
+# options.compress_binary_data = True, saves it by each writer and checks if the reloaded binary data is unchanged.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+from ezdxf.lldxf.classifiedtags import ClassifiedTags
+
+BINARY_DATA = ['DEADBEEF', 'CAFEBABE', '0123456789ABCDEF']
+
+XRECORD = """  0
+XRECORD
+  5
+{handle}
+330
+{owner}
+100
+AcDbXrecord
+280
+1
+{data}"""
+
+BODY = """  0
+BODY
+  5
+{handle}
+330
+{owner}
+100
+AcDbEntity
+  8
+0
+ 92
+{size}
+{data}100
+AcDbModelerGeometry
+ 70
+1
+"""
+
+WRITERS = [
+    ('tag writer', dict(), False),
+    ('bulk writer', dict(), True),
+    ('fixed precision', dict(precision=6), True),
+    ('binary DXF', dict(fmt='bin'), True),
+]
+
+
+def binary_tags():
+    return ''.join('310\n{}\n'.format(data) for data in BINARY_DATA)
+
+
+def create_drawing(filename):
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    xrecord = ClassifiedTags.from_text(XRECORD.format(
+        handle=dwg.entitydb.get_unique_handle(), owner=dwg.rootdict.dxf.handle, data=binary_tags()))
+    dwg.objects.add_handle(dwg.entitydb.add_tags(xrecord))
+    body = ClassifiedTags.from_text(BODY.format(
+        handle=dwg.entitydb.get_unique_handle(), owner=msp.layout_key, size=len(''.join(BINARY_DATA)) // 2,
+        data=binary_tags()))
+    dwg.entitydb.add_tags(body)
+    msp.add_entity(dwg.dxffactory.wrap_entity(body))
+    dwg.saveas(filename)
+    return xrecord.get_handle(), body.get_handle()
+
+
+def binary_data(dwg, handle):
+    return [tag.value for tag in dwg.entitydb[handle] if tag.code == 310]
+
+
+def check(folder):
+    source = os.path.join(folder, 'source.dxf')
+    handles = create_drawing(source)
+    ok = True
+    for name, kwargs, bulk in WRITERS:
+        ezdxf.options.bulk_tag_writer = bulk
+        ezdxf.options.compress_binary_data = True
+        dwg = ezdxf.readfile(source)
+        filename = os.path.join(folder, 'out.dxf')
+        dwg.saveas(filename, **kwargs)
+        ezdxf.options.compress_binary_data = False
+        result = ezdxf.readfile(filename)
+        for handle in handles:
+            data = binary_data(result, handle)
+            if data != BINARY_DATA:
+                ok = False
+                print('{}: entity {} has binary data {}'.format(name, handle, data))
+    print('compressed binary data: {}'.format('ok' if ok else 'FAILED'))
+    return ok
+
+
+if __name__ == '__main__':
+    folder = tempfile.mkdtemp()
+    try:
+        sys.exit(0 if check(folder) else 1)
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,66 @@
+# Purpose: benchmark of the fixed float precision on saving: file size and save time
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/float_precision.py [file.dxf ...]
+#
+# Saves each DXF file with full float precision, with 6 decimal places and with 4 decimal places for coordinates and
+# scale factors and 2 decimal places for angles into a temporary directory, the best time of 3 runs is reported.
+# Without arguments a generated drawing with computed coordinates, like coordinates of transformed entities, is used.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import math
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+PRECISIONS = [
+    ('full precision', None),
+    ('precision 6', 6),
+    ('precision 4/2/4', {'coordinates': 4, 'angles': 2, 'scales': 4}),
+]
+
+
+def generate(count):
+    """ Returns a drawing with count LINE, CIRCLE, ARC and TEXT entities with computed coordinates. """
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    for index in range(count):
+        angle = index * 0.001
+        x = 1000. * math.cos(angle) + index / 7.
+        y = 1000. * math.sin(angle) + index / 3.
+        msp.add_line((x, y, 0), (y / 3., x / 7., 0))
+        msp.add_circle((x, y), radius=index / 9. + 1.)
+        msp.add_arc((y, x), radius=index / 11. + 1., start_angle=math.degrees(angle), end_angle=angle * 30.)
+        msp.add_text('TEXT', dxfattribs={'insert': (x, y), 'height': x / 1000., 'rotation': math.degrees(angle)})
+    return dwg
+
+
+def benchmark(dwg, filename, folder):
+    print(filename)
+    for name, precision in PRECISIONS:
+        outname = os.path.join(folder, 'precision.dxf')
+        t = float('inf')
+        for _ in range(3):
+            t0 = time.time()
+            dwg.saveas(outname, precision=precision)
+            t = min(t, time.time() - t0)
+        print('  {:<16} {:>8.2f}s {:>8.1f} MB'.format(name, t, os.path.getsize(outname) / (1024. * 1024.)))
+
+
+if __name__ == '__main__':
+    folder = tempfile.mkdtemp()
+    try:
+        if len(sys.argv) > 1:
+            for filename in sys.argv[1:]:
+                benchmark(ezdxf.readfile(filename), filename, folder)
+        else:
+            benchmark(generate(50000), 'generated drawing, 200000 entities', folder)
+    finally:
+        shutil.rmtree(folder)
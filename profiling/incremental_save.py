@@ -0,0 +1,48 @@
+# Purpose: benchmark of the incremental save: full save vs. incremental save of a few changed entities
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/incremental_save.py file.dxf [count]
+#
+# Loads file.dxf, changes the layer of count (default 10) model space entities and saves the drawing by a full save and
+# by an incremental save into a temporary directory.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+
+def run(name, dwg, filename, incremental):
+    t0 = time.time()
+    dwg.saveas(filename, incremental=incremental)
+    t = time.time() - t0
+    print('{:<16} {:>8.2f}s {:>8.1f} MB'.format(name, t, os.path.getsize(filename) / (1024. * 1024.)))
+    return t
+
+
+def benchmark(filename, count):
+    t0 = time.time()
+    dwg = ezdxf.readfile(filename)
+    print('loading {}: {:.2f}s'.format(filename, time.time() - t0))
+    for index, entity in enumerate(dwg.modelspace()):
+        if index >= count:
+            break
+        entity.dxf.layer = 'INCREMENTAL'
+    folder = tempfile.mkdtemp()
+    try:
+        t_full = run('full save', dwg, os.path.join(folder, 'full.dxf'), False)
+        t_incremental = run('incremental save', dwg, os.path.join(folder, 'incremental.dxf'), True)
+    finally:
+        shutil.rmtree(folder)
+    print('speedup: {:.2f}x'.format(t_full / t_incremental))
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 10)
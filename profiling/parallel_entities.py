@@ -0,0 +1,41 @@
+# Purpose: benchmark of readfile(workers=N): parsing the ENTITIES section by 1 to 16 processes
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/parallel_entities.py DXF-file [max-workers]
+#
+# Worker counts above the count of CPU cores are skipped, the ENTITIES section has to be larger than 2 MB to be
+# parsed in parallel.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+WORKERS = (1, 2, 4, 8, 12, 16)
+
+
+def benchmark(filename, max_workers):
+    print('{}, {:.1f} MB, {} CPU cores'.format(filename, os.path.getsize(filename) / (1024. * 1024.),
+                                               multiprocessing.cpu_count()))
+    t1 = None
+    for workers in WORKERS:
+        if workers > max_workers:
+            break
+        t0 = time.time()
+        dwg = ezdxf.readfile(filename, workers=workers)
+        t = time.time() - t0
+        if t1 is None:
+            t1 = t
+        print('workers={:<3} {:>8.2f}s  speedup {:>5.2f}x  {} entities'.format(
+            workers, t, t1 / t, len(dwg.entities)))
+
+
+if __name__ == '__main__':
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+    benchmark(sys.argv[1], max_workers)
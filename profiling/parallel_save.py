@@ -0,0 +1,42 @@
+# Purpose: benchmark of the parallel save: sequential writer vs. chunks rendered by a process pool
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/parallel_save.py file.dxf [workers]
+#
+# Writes file.dxf into memory by the sequential writer and by a pool of workers (default is the CPU count) processes,
+# and checks if both outputs are identical.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import io
+import re
+import time
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+TIMESTAMPS = re.compile(r'\$TD\w+\n 40\n[^\n]*\n|999\nlast saved by [^\n]*\n')  # updated by each write
+
+
+def run(name, dwg, workers):
+    stream = io.StringIO()
+    t0 = time.time()
+    dwg.write(stream, workers=workers)
+    t = time.time() - t0
+    print('{:<16} {:>8.2f}s'.format(name, t))
+    return t, TIMESTAMPS.sub('', stream.getvalue())
+
+
+def benchmark(filename, workers):
+    dwg = ezdxf.readfile(filename)
+    t_sequential, sequential = run('sequential', dwg, 1)
+    t_parallel, parallel = run('{} workers'.format(workers), dwg, workers)
+    print('speedup: {:.2f}x, identical output: {}'.format(t_sequential / t_parallel, sequential == parallel))
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count())
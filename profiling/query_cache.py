@@ -0,0 +1,62 @@
+# Purpose: benchmark of the compiled query cache: many small queries with and without cache
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/query_cache.py [count]
+#
+# Runs count (default 5000) queries from a small set of query strings against a layout with a few entities, like
+# application code which queries in a loop, with enabled cache and with disabled cache (options.query_cache_size = 0).
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+from ezdxf import query
+
+QUERIES = [
+    'LINE',
+    'CIRCLE ARC',
+    '*[layer=="Walls"]',
+    'LINE[layer ? "W.*" & color==1]',
+    'TEXT[text ? ".*A.*"]i',
+    '*[!layer=="0" | color<3]',
+]
+
+
+def generate():
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    for index in range(10):
+        attribs = {'layer': 'Walls' if index % 2 else '0', 'color': index % 4}
+        msp.add_line((0, index), (10, index), dxfattribs=attribs)
+        msp.add_circle((index, 0), 1, dxfattribs=attribs)
+        msp.add_arc((index, 0), 1, 0, 90, dxfattribs=attribs)
+        msp.add_text('TEXT{}'.format(index), dxfattribs=attribs)
+    return msp
+
+
+def run(name, msp, count, cache_size):
+    ezdxf.options.query_cache_size = cache_size
+    query.clear_cache()
+    t0 = time.time()
+    found = 0
+    for index in range(count):
+        found += len(msp.query(QUERIES[index % len(QUERIES)]))
+    t = time.time() - t0
+    print('{:<16} {:>8.3f}s  {:>8.1f} queries/s  {}'.format(name, t, count / t, query.cache_info()))
+    return t, found
+
+
+def benchmark(count):
+    msp = generate()
+    t_uncached, found_uncached = run('without cache', msp, count, 0)
+    t_cached, found_cached = run('with cache', msp, count, 256)
+    print('speedup: {:.1f}x, same results: {}'.format(t_uncached / t_cached, found_uncached == found_cached))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,81 @@
+# Purpose: benchmark of the secondary indexes of entity spaces for queries with equality terms
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/query_index.py [count]
+#
+# Creates a modelspace with count (default 500000) LINE, CIRCLE, ARC, TEXT and LWPOLYLINE entities on 100 layers, and
+# runs each query without (options.query_indexes = False) and with secondary indexes, the best time of 3 runs is
+# reported, the indexes are created by the first run. Reports also the time of layer changes with maintained index.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+QUERIES = [
+    '*[layer=="Layer7"]',
+    'CIRCLE',
+    'LINE[layer=="Layer7"]',
+    'TEXT[layer=="layer7" & color==3]i',
+    '*[linetype=="DASHED" & color==1]',
+    'ARC[layer=="Layer7" | color==1]',  # no index terms
+]
+
+
+def generate(count):
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    for index in range(count // 5):
+        attribs = {
+            'layer': 'Layer{}'.format(index % 100),
+            'color': index % 7 + 1,
+            'linetype': 'DASHED' if index % 10 == 0 else 'BYLAYER',
+        }
+        msp.add_line((0, index), (10, index), dxfattribs=attribs)
+        msp.add_circle((index, 0), 1, dxfattribs=attribs)
+        msp.add_arc((index, 0), 1, 0, 90, dxfattribs=attribs)
+        msp.add_text('TEXT', dxfattribs=attribs)
+        msp.add_lwpolyline([(0, 0), (index, 0), (index, index)], dxfattribs=attribs)
+    return msp
+
+
+def best_time(func):
+    t = float('inf')
+    for _ in range(3):
+        t0 = time.time()
+        result = func()
+        t = min(t, time.time() - t0)
+    return t, [entity.dxf.handle for entity in result]
+
+
+def benchmark(count):
+    msp = generate(count)
+    print('modelspace with {} entities'.format(len(msp)))
+    t0 = time.time()
+    msp.query('CIRCLE')
+    print('first query by DXF type, including the creation of the DXF type index: {:.2f}s'.format(time.time() - t0))
+    for query in QUERIES:
+        ezdxf.options.query_indexes = False
+        t_scan, scan_result = best_time(lambda: msp.query(query))
+        ezdxf.options.query_indexes = True
+        t_index, index_result = best_time(lambda: msp.query(query))
+        print('{:<40} {:>7} entities  scan {:>7.3f}s  index {:>7.3f}s  {:>6.1f}x  {}'.format(
+            query, len(index_result), t_scan, t_index, t_scan / t_index,
+            'ok' if scan_result == index_result else 'DIFFERENT RESULT'))
+
+    entities = list(msp.query('LINE[layer=="Layer8"]'))
+    t0 = time.time()
+    for entity in entities:
+        entity.dxf.layer = 'Layer7'
+    t = time.time() - t0
+    print('{} layer changes with maintained index: {:.3f}s, LINE entities on Layer7: {}'.format(
+        len(entities), t, len(msp.query('LINE[layer=="Layer7"]'))))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,61 @@
+# Purpose: benchmark of the R12 fast stream writer: single entity methods vs. batch methods
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/r12writer_batch.py [count]
+#
+# Writes count (default 1000000) LINE and POINT entities and count/10 POLYLINE entities with 10 vertices into memory,
+# by the add_line(), add_point(), add_polyline() methods and by the add_lines(), add_points() and add_polylines()
+# methods.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import io
+import time
+import random
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+from ezdxf.r12writer import r12writer
+
+
+def single(dxf, starts, ends, polylines):
+    for index in range(0, len(starts), 2):
+        dxf.add_line(starts[index:index + 2], ends[index:index + 2])
+    for index in range(0, len(starts), 2):
+        dxf.add_point(starts[index:index + 2])
+    for vertices in polylines:
+        dxf.add_polyline([vertices[index:index + 2] for index in range(0, len(vertices), 2)])
+
+
+def batch(dxf, starts, ends, polylines):
+    dxf.add_lines(starts, ends)
+    dxf.add_points(starts)
+    dxf.add_polylines(polylines)
+
+
+def run(name, func, *args):
+    stream = io.StringIO()
+    t0 = time.time()
+    with r12writer(stream) as dxf:
+        func(dxf, *args)
+    t = time.time() - t0
+    print('{:<16} {:>8.2f}s {:>8.1f} MB'.format(name, t, len(stream.getvalue()) / (1024. * 1024.)))
+    return t
+
+
+def benchmark(count):
+    random.seed(2026)
+    starts = array('d', (random.uniform(-1000., 1000.) for _ in range(count * 2)))
+    ends = array('d', (random.uniform(-1000., 1000.) for _ in range(count * 2)))
+    polylines = [array('d', (random.uniform(-1000., 1000.) for _ in range(20))) for _ in range(count // 10)]
+    print('{} LINE, {} POINT, {} POLYLINE entities'.format(count, count, len(polylines)))
+    t_single = run('single methods', single, starts, ends, polylines)
+    t_batch = run('batch methods', batch, starts, ends, polylines)
+    print('speedup: {:.2f}x'.format(t_single / t_batch))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
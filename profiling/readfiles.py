@@ -0,0 +1,43 @@
+# Purpose: benchmark of ezdxf.readfiles(): sequential loading vs. loading by a process pool
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/readfiles.py DXF-file ...
+#
+# Use several files or the same file several times, the speedup depends on the count of CPU cores, and the costs of
+# transferring the drawings to the parent process.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+
+def run(name, func):
+    t0 = time.time()
+    func()
+    t = time.time() - t0
+    print('{:<28} {:>8.2f}s'.format(name, t))
+    return t
+
+
+def benchmark(filenames):
+    print('{} files, {} CPU cores'.format(len(filenames), multiprocessing.cpu_count()))
+    for lazy in (False, True):
+        label = ' lazy' if lazy else ''
+        t_seq = run('readfile()' + label, lambda: [ezdxf.readfile(name, lazy=lazy) for name in filenames])
+        workers = 2
+        while workers <= min(multiprocessing.cpu_count(), len(filenames)):
+            t = run('readfiles(workers={}){}'.format(workers, label),
+                    lambda: ezdxf.readfiles(filenames, workers=workers, lazy=lazy))
+            print('{:<28} {:>8.2f}x'.format('speedup', t_seq / t))
+            workers *= 2
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1:])
@@ -0,0 +1,71 @@
+# Purpose: benchmark of Drawing.saveas(): tag by tag writer vs. bulk tag writer
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/save_benchmark.py [count] [dxfversion]
+#
+# Creates a drawing with count entities (default 1000000) and saves it with options.bulk_tag_writer = False (old
+# writer) and True (new writer), both files have to be equal except the time stamps.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import io
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+
+def create_drawing(count, dxfversion):
+    dwg = ezdxf.new(dxfversion)
+    msp = dwg.modelspace()
+    for index in range(count):
+        x = index * 0.5
+        y = index * 0.25
+        kind = index % 4
+        if kind == 0:
+            msp.add_line((x, y), (y, x), dxfattribs={'layer': 'LINES'})
+        elif kind == 1:
+            msp.add_circle((x, y), radius=1.5, dxfattribs={'layer': 'CIRCLES'})
+        elif kind == 2:
+            msp.add_text('Text{}'.format(index), dxfattribs={'insert': (x, y), 'height': 2.5})
+        else:
+            msp.add_point((x, y, 1.0))
+    return dwg
+
+
+def save(dwg, filename, bulk):
+    ezdxf.options.bulk_tag_writer = bulk
+    t0 = time.time()
+    dwg.saveas(filename)
+    t = time.time() - t0
+    print('{:<16} {:>8.2f}s {:>8.1f} MB'.format(
+        'bulk writer' if bulk else 'tag writer', t, os.path.getsize(filename) / (1024. * 1024.)))
+    return t
+
+
+def content(filename):
+    with io.open(filename, mode='rt', encoding='utf-8', errors='ignore') as fp:
+        return [line for line in fp if not line.startswith('2461') and 'saved by' not in line]
+
+
+def benchmark(count, dxfversion):
+    print('creating {} entities ...'.format(count))
+    dwg = create_drawing(count, dxfversion)
+    folder = tempfile.mkdtemp()
+    old_file = os.path.join(folder, 'old.dxf')
+    new_file = os.path.join(folder, 'new.dxf')
+    t_old = save(dwg, old_file, bulk=False)
+    t_new = save(dwg, new_file, bulk=True)
+    print('speedup: {:.2f}x'.format(t_old / t_new))
+    print('equal files: {}'.format(content(old_file) == content(new_file)))
+    os.remove(old_file)
+    os.remove(new_file)
+    os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000, sys.argv[2] if len(sys.argv) > 2 else 'AC1015')
@@ -0,0 +1,106 @@
+# Purpose: benchmark of the spatial index of entity spaces: window queries and nearest neighbours
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/spatial_index.py [count]
+#
+# Creates a modelspace with count (default 200000) LINE, CIRCLE, ARC, TEXT and LWPOLYLINE entities distributed over a
+# square area, and runs window queries and nearest neighbour lookups by a scan of all bounding boxes and by the spatial
+# index, the best time of 3 runs is reported. Reports also the time of moving entities with maintained index.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+from ezdxf.bbox import entity_bbox, intersects, distance
+
+SIZE = 10000.
+WINDOWS = [
+    ((100., 100.), (200., 200.)),
+    ((5000., 5000.), (6000., 5500.)),
+    ((-10., -10.), (2500., 2500.)),
+]
+POINTS = [(0., 0.), (5000., 5000.), (SIZE + 100., 3000.)]
+
+
+def generate(count):
+    random.seed(1)
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    for _ in range(count // 5):
+        x, y = random.uniform(0, SIZE), random.uniform(0, SIZE)
+        msp.add_line((x, y), (x + 10, y + 5))
+        msp.add_circle((y, x), 2)
+        msp.add_arc((x, x), 3, 0, 90)
+        msp.add_text('TEXT', dxfattribs={'insert': (y, y), 'height': 2.5})
+        msp.add_lwpolyline([(x, y), (x + 5, y), (x + 5, y + 5)])
+    return msp
+
+
+def scan_window(msp, min_point, max_point):
+    window = min_point + max_point
+    return [entity for entity in msp if intersects(entity_bbox(entity) or (1., 1., -1., -1.), window)]
+
+
+def scan_nearest(msp, point, count):
+    distances = []
+    for entity in msp:
+        box = entity_bbox(entity)
+        if box is not None:
+            distances.append((distance(box, point), int(entity.dxf.handle, 16), entity))
+    return [entity for _, _, entity in sorted(distances)[:count]]
+
+
+def best_time(func):
+    t = float('inf')
+    for _ in range(3):
+        t0 = time.time()
+        result = func()
+        t = min(t, time.time() - t0)
+    return t, [entity.dxf.handle for entity in result]
+
+
+def compare(name, scan, indexed):
+    t_scan, scan_result = best_time(scan)
+    t_index, index_result = best_time(indexed)
+    print('{:<44} {:>7} entities  scan {:>7.3f}s  index {:>7.4f}s  {:>8.1f}x  {}'.format(
+        name, len(index_result), t_scan, t_index, t_scan / t_index,
+        'ok' if scan_result == index_result else 'DIFFERENT RESULT'))
+
+
+def benchmark(count):
+    msp = generate(count)
+    print('modelspace with {} entities'.format(len(msp)))
+    t0 = time.time()
+    msp.get_spatial_index()
+    print('creation of the spatial index: {:.2f}s'.format(time.time() - t0))
+    for min_point, max_point in WINDOWS:
+        compare('window {} {}'.format(min_point, max_point),
+                lambda: scan_window(msp, min_point, max_point),
+                lambda: msp.query_window(min_point, max_point))
+    for point in POINTS:
+        compare('nearest 10 to {}'.format(point),
+                lambda: scan_nearest(msp, point, 10),
+                lambda: msp.nearest(point, 10))
+
+    entities = list(msp.query_window(*WINDOWS[1]))
+    t0 = time.time()
+    for entity in entities:
+        if entity.dxftype() == 'CIRCLE':
+            entity.dxf.center = (random.uniform(0, SIZE), random.uniform(0, SIZE))
+        else:
+            msp.delete_entity(entity)
+    new_entities = [msp.add_circle((5500., 5200.), 1.) for _ in range(100)]
+    t = time.time() - t0
+    result = set(entity.dxf.handle for entity in msp.query_window(*WINDOWS[1]))
+    print('{} moved or deleted entities and 100 new circles with maintained index: {:.3f}s, new circles found: {}'.format(
+        len(entities), t, all(entity.dxf.handle in result for entity in new_entities)))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,67 @@
+# Purpose: benchmark of the name index of tables: bulk creation of layers, linetypes and text styles
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/table_index.py [count]
+#
+# Creates count (default 5000) layers, linetypes and text styles, each table-entry creation checks the existence of
+# the name, the creation time of 1/4, 1/2 and all entries shows the scaling. Compares the lookup of all names by the
+# name index with the linear search of previous versions, the best time of 3 runs is reported.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+TABLES = [
+    ('layers', lambda index: {'color': index % 255 + 1}),
+    ('linetypes', lambda index: {'description': '- -', 'pattern': [0.5, 0.25, -0.25]}),
+    ('styles', lambda index: {'font': 'arial.ttf'}),
+]
+
+
+def create(table, names, dxfattribs):
+    for index, name in enumerate(names):
+        table.new(name, dxfattribs(index))
+
+
+def linear_search(table, name):
+    for entry in table:
+        if entry.dxf.name == name:
+            return entry
+    raise ValueError(name)
+
+
+def best_time(func, *args):
+    t = float('inf')
+    for _ in range(3):
+        t0 = time.time()
+        func(*args)
+        t = min(t, time.time() - t0)
+    return t
+
+
+def benchmark(count):
+    for table_name, dxfattribs in TABLES:
+        times = []
+        for size in (count // 4, count // 2, count):
+            dwg = ezdxf.new('AC1015')
+            table = getattr(dwg, table_name)
+            names = ['{}{}'.format(table_name, index) for index in range(size)]
+            t0 = time.time()
+            create(table, names, dxfattribs)
+            times.append('{}: {:.3f}s'.format(size, time.time() - t0))
+        print('create {:<10} {}'.format(table_name, '  '.join(times)))
+        sample = names[::max(1, count // 500)]
+        t_index = best_time(lambda: [table.get(name.upper()) for name in sample])
+        t_scan = best_time(lambda: [linear_search(table, name) for name in sample])
+        print('lookup of {} {}: linear search {:.3f}s  index {:.4f}s  {:.1f}x'.format(
+            len(sample), table_name, t_scan, t_index, t_scan / t_index))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,43 @@
+# Purpose: memory usage of the entity database: Tags() vs CompactTags()
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/tag_memory.py DXF-file ...
+#
+# requires Python 3.4+ for the tracemalloc module
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+
+
+def load(filename, compact):
+    ezdxf.options.compact_tags = compact
+    tracemalloc.start()
+    t0 = time.time()
+    dwg = ezdxf.readfile(filename)
+    t = time.time() - t0
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    count = len(dwg.entitydb)
+    print('{:<12} {:>8} entities {:>8.2f}s {:>8.1f} MB {:>8.0f} bytes/entity'.format(
+        'CompactTags' if compact else 'Tags', count, t, memory / (1024. * 1024.), memory / count))
+    return memory
+
+
+def benchmark(filename):
+    print(filename)
+    memory_tags = load(filename, compact=False)
+    memory_compact = load(filename, compact=True)
+    print('memory ratio: {:.2f}\n'.format(memory_tags / float(memory_compact)))
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:]:
+        benchmark(name)
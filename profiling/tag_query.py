@@ -0,0 +1,73 @@
+# Purpose: benchmark of entity queries: wrapper level matcher vs. tag level predicates
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/tag_query.py [count]
+#
+# Creates a modelspace with count (default 500000) LINE, CIRCLE, ARC, TEXT and LWPOLYLINE entities, and runs each query
+# by the wrapper level matcher, which wraps every entity and evaluates the DXF attributes, and by layout.query(), which
+# evaluates the tag level predicates on the ClassifiedTags() and wraps just the matching entities, the best time of 3
+# runs is reported.
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+import ezdxf
+from ezdxf.query import EntityQuery
+
+QUERIES = [
+    'CIRCLE',
+    'LINE[layer=="Walls"]',
+    '*[color==1]',
+    'TEXT[text ? "A.*"]i',
+    '*[!layer=="0" & color<3]',
+    'LINE ARC[layer ? "W.*" | (color>=2 & linetype=="BYLAYER")]',
+]
+LAYERS = ['0', 'Walls', 'Doors', 'Windows']
+
+
+def generate(count):
+    dwg = ezdxf.new('AC1015')
+    msp = dwg.modelspace()
+    for index in range(count // 5):
+        attribs = {'layer': LAYERS[index % len(LAYERS)], 'color': index % 7 + 1}
+        msp.add_line((0, index), (10, index), dxfattribs=attribs)
+        msp.add_circle((index, 0), 1, dxfattribs=attribs)
+        msp.add_arc((index, 0), 1, 0, 90, dxfattribs=attribs)
+        msp.add_text('ABC' if index % 2 else 'xyz', dxfattribs=attribs)
+        msp.add_lwpolyline([(0, 0), (index, 0), (index, index)], dxfattribs=attribs)
+    return msp
+
+
+def run(func):
+    t = float('inf')
+    for _ in range(3):
+        t0 = time.time()
+        result = func()
+        t = min(t, time.time() - t0)
+    return t, [entity.dxf.handle for entity in result]
+
+
+def benchmark(count):
+    t0 = time.time()
+    msp = generate(count)
+    print('modelspace with {} entities created in {:.1f}s'.format(len(msp), time.time() - t0))
+    total_wrapper, total_tags = 0., 0.
+    for query in QUERIES:
+        t_wrapper, wrapper_result = run(lambda: EntityQuery(iter(msp), query))
+        t_tags, tags_result = run(lambda: msp.query(query))
+        total_wrapper += t_wrapper
+        total_tags += t_tags
+        print('{:<60} {:>7} entities  wrapper {:>7.2f}s  tags {:>7.2f}s  {:>5.1f}x  {}'.format(
+            query, len(tags_result), t_wrapper, t_tags, t_wrapper / t_tags,
+            'ok' if wrapper_result == tags_result else 'DIFFERENT RESULT'))
+    print('total: wrapper {:.2f}s  tags {:.2f}s  speedup {:.1f}x'.format(total_wrapper, total_tags,
+                                                                      total_wrapper / total_tags))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,58 @@
+# Purpose: throughput benchmark: stream_tagger() vs bulk_stream_tagger()
+# Created: 18.10.2026
+# License: MIT License
+#
+# usage: python profiling/tagger_throughput.py [DXF file ...]
+from __future__ import unicode_literals, print_function
+
+import sys
+import os
+import io
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+from ezdxf.lldxf.tagger import stream_tagger, bulk_stream_tagger
+from ezdxf.lldxf.tags import dxf_info
+
+
+def count_tags(tagger):
+    count = 0
+    for _ in tagger:
+        count += 1
+    return count
+
+
+def run(name, filename, func):
+    size = os.path.getsize(filename) / (1024. * 1024.)
+    t0 = time.time()
+    count = func()
+    t = time.time() - t0
+    print('{:<22} {:>10} tags {:>8.2f}s {:>12.0f} tags/s {:>8.2f} MB/s'.format(name, count, t, count / t, size / t))
+    return t
+
+
+def benchmark(filename):
+    with io.open(filename, mode='rt', encoding='utf-8', errors='ignore') as fp:
+        info = dxf_info(fp)
+    encoding = 'utf-8' if info.version >= 'AC1021' else info.encoding
+    print('{} ({:.1f} MB, {})'.format(filename, os.path.getsize(filename) / (1024. * 1024.), info.version))
+
+    def old_reader():
+        with io.open(filename, mode='rt', encoding=encoding, errors='ignore') as fp:
+            return count_tags(stream_tagger(fp))
+
+    def new_reader():
+        with io.open(filename, mode='rb') as fp:
+            return count_tags(bulk_stream_tagger(fp, encoding=encoding))
+
+    t_old = run('stream_tagger', filename, old_reader)
+    t_new = run('bulk_stream_tagger', filename, new_reader)
+    print('speedup: {:.2f}x\n'.format(t_old / t_new))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__ or 'usage: python tagger_throughput.py DXF-file ...')
+    for name in sys.argv[1:]:
+        benchmark(name)